@@ -92,6 +92,33 @@ ROW_BASED_VALIDATION_TYPES = [
     "col_vals_not_null",
 ]
 
+# The table types of Parquet and Arrow IPC files that are given as paths (by file extension)
+TABLE_FILE_TYPES = {
+    ".parquet": "parquet_file",
+    ".pq": "parquet_file",
+    ".arrow": "arrow_file",
+    ".feather": "arrow_file",
+    ".ipc": "arrow_file",
+}
+
+# The validation types that only need a table's metadata (and so work with table files)
+TABLE_FILE_VALIDATION_TYPES = [
+    "col_schema_match",
+    "row_count_match",
+    "col_count_match",
+]
+
+PARQUET_PRUNABLE_METHODS = [
+    "gt",
+    "lt",
+    "ge",
+    "le",
+    "between",
+    "outside",
+    "null",
+    "not_null",
+]
+
 IBIS_BACKENDS = [
     "databricks",
     "duckdb",
@@ -147,6 +174,8 @@ TABLE_TYPE_STYLES = {
     "sqlite": {"background": "#BACBEF", "text": "#222222", "label": "SQLite"},
     "parquet": {"background": "#3F9FF9", "text": "#FFFFFF", "label": "Parquet"},
     "memtable": {"background": "#2C3E50", "text": "#FFFFFF", "label": "Ibis memtable"},
+    "parquet_file": {"background": "#3F9FF9", "text": "#FFFFFF", "label": "Parquet file"},
+    "arrow_file": {"background": "#D22128", "text": "#FFFFFF", "label": "Arrow IPC file"},
 }
 
 REPORTING_LANGUAGES = ["en", "fr", "de", "it", "es", "pt", "tr", "zh", "ru", "pl", "da", "sv", "nl"]
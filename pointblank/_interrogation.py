@@ -4,17 +4,22 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 import narwhals as nw
-from narwhals.dependencies import is_pandas_dataframe, is_polars_dataframe
+from narwhals.dependencies import get_ibis, get_polars, is_pandas_dataframe
 from narwhals.typing import FrameT
 
 from pointblank._constants import IBIS_BACKENDS
+from pointblank._predicates import _build_predicate
 from pointblank._utils import (
     _column_subset_test_prep,
     _column_test_prep,
     _convert_to_narwhals,
     _get_tbl_type,
 )
-from pointblank.column import Column, ColumnLiteral
+from pointblank._utils_extract import (
+    _ExtractReservoir,
+    _get_sample_size,
+    _iter_failing_row_nums,
+)
 from pointblank.schema import Schema
 from pointblank.thresholds import _threshold_check
 
@@ -88,990 +93,67 @@ class Interrogator:
     na_pass: bool = False
     tbl_type: str = "local"
 
-    def gt(self) -> FrameT | Any:
-        # Ibis backends ---------------------------------------------
-
-        if self.tbl_type in IBIS_BACKENDS:
-            import ibis
-
-            if isinstance(self.compare, ColumnLiteral):
-                tbl = self.x.mutate(
-                    pb_is_good_1=(self.x[self.column].isnull() | self.x[self.compare.name].isnull())
-                    & ibis.literal(self.na_pass),
-                    pb_is_good_2=self.x[self.column] > self.x[self.compare.name],
-                )
-
-                tbl = tbl.mutate(
-                    pb_is_good_2=ibis.ifelse(tbl.pb_is_good_2.notnull(), tbl.pb_is_good_2, False)
-                )
-
-                return tbl.mutate(pb_is_good_=tbl.pb_is_good_1 | tbl.pb_is_good_2).drop(
-                    "pb_is_good_1", "pb_is_good_2"
-                )
-
-            else:
-                tbl = self.x.mutate(
-                    pb_is_good_1=self.x[self.column].isnull() & ibis.literal(self.na_pass),
-                    pb_is_good_2=self.x[self.column] > ibis.literal(self.compare),
-                )
-
-                tbl = tbl.mutate(
-                    pb_is_good_2=ibis.ifelse(tbl.pb_is_good_2.notnull(), tbl.pb_is_good_2, False)
-                )
-
-                return tbl.mutate(pb_is_good_=tbl.pb_is_good_1 | tbl.pb_is_good_2).drop(
-                    "pb_is_good_1", "pb_is_good_2"
-                )
-
-        # Local backends (Narwhals) ---------------------------------
-
-        compare_expr = _get_compare_expr_nw(compare=self.compare)
-
-        return (
-            self.x.with_columns(
-                pb_is_good_1=nw.col(self.column).is_null() & self.na_pass,
-                pb_is_good_2=(
-                    nw.col(self.compare.name).is_null() & self.na_pass
-                    if isinstance(self.compare, Column)
-                    else nw.lit(False)
-                ),
-                pb_is_good_3=nw.col(self.column) > compare_expr,
-            )
-            .with_columns(
-                pb_is_good_3=(
-                    nw.when(nw.col("pb_is_good_3").is_null())
-                    .then(nw.lit(False))
-                    .otherwise(nw.col("pb_is_good_3"))
-                )
-            )
-            .with_columns(
-                pb_is_good_=nw.col("pb_is_good_1") | nw.col("pb_is_good_2") | nw.col("pb_is_good_3")
-            )
-            .drop("pb_is_good_1", "pb_is_good_2", "pb_is_good_3")
-            .to_native()
-        )
-
-    def lt(self) -> FrameT | Any:
-        # Ibis backends ---------------------------------------------
-
-        if self.tbl_type in IBIS_BACKENDS:
-            import ibis
-
-            if isinstance(self.compare, Column):
-                tbl = self.x.mutate(
-                    pb_is_good_1=(self.x[self.column].isnull() | self.x[self.compare.name].isnull())
-                    & ibis.literal(self.na_pass),
-                    pb_is_good_2=self.x[self.column] < self.x[self.compare.name],
-                )
-
-                tbl = tbl.mutate(
-                    pb_is_good_2=ibis.ifelse(tbl.pb_is_good_2.notnull(), tbl.pb_is_good_2, False)
-                )
-
-                return tbl.mutate(pb_is_good_=tbl.pb_is_good_1 | tbl.pb_is_good_2).drop(
-                    "pb_is_good_1", "pb_is_good_2"
-                )
-
-            else:
-                tbl = self.x.mutate(
-                    pb_is_good_1=self.x[self.column].isnull() & ibis.literal(self.na_pass),
-                    pb_is_good_2=self.x[self.column] < ibis.literal(self.compare),
-                )
-
-                tbl = tbl.mutate(
-                    pb_is_good_2=ibis.ifelse(tbl.pb_is_good_2.notnull(), tbl.pb_is_good_2, False)
-                )
-
-                return tbl.mutate(pb_is_good_=tbl.pb_is_good_1 | tbl.pb_is_good_2).drop(
-                    "pb_is_good_1", "pb_is_good_2"
-                )
-
-        # Local backends (Narwhals) ---------------------------------
-
-        compare_expr = _get_compare_expr_nw(compare=self.compare)
-
-        return (
-            self.x.with_columns(
-                pb_is_good_1=nw.col(self.column).is_null() & self.na_pass,
-                pb_is_good_2=(
-                    nw.col(self.compare.name).is_null() & self.na_pass
-                    if isinstance(self.compare, Column)
-                    else nw.lit(False)
-                ),
-                pb_is_good_3=nw.col(self.column) < compare_expr,
-            )
-            .with_columns(
-                pb_is_good_3=(
-                    nw.when(nw.col("pb_is_good_3").is_null())
-                    .then(nw.lit(False))
-                    .otherwise(nw.col("pb_is_good_3"))
-                )
-            )
-            .with_columns(
-                pb_is_good_=nw.col("pb_is_good_1") | nw.col("pb_is_good_2") | nw.col("pb_is_good_3")
-            )
-            .drop("pb_is_good_1", "pb_is_good_2", "pb_is_good_3")
-            .to_native()
+    def _apply_predicate(self, assertion_method: str, values: Any = None) -> FrameT | Any:
+        # Build the predicate for the step once; it's then lowered to a single expression that
+        # produces the `pb_is_good_` column (without any intermediate columns)
+        predicate = _build_predicate(
+            assertion_method=assertion_method,
+            column=self.column,
+            values=values,
+            inclusive=self.inclusive,
+            na_pass=self.na_pass,
+            compare_by_difference=(
+                self.tbl_type not in IBIS_BACKENDS and is_pandas_dataframe(self.x.to_native())
+            ),
         )
 
-    def eq(self) -> FrameT | Any:
         # Ibis backends ---------------------------------------------
 
         if self.tbl_type in IBIS_BACKENDS:
-            import ibis
-
-            if isinstance(self.compare, Column):
-                tbl = self.x.mutate(
-                    pb_is_good_1=(self.x[self.column].isnull() | self.x[self.compare.name].isnull())
-                    & ibis.literal(self.na_pass),
-                    pb_is_good_2=self.x[self.column] == self.x[self.compare.name],
-                )
-
-                tbl = tbl.mutate(
-                    pb_is_good_2=ibis.ifelse(tbl.pb_is_good_2.notnull(), tbl.pb_is_good_2, False)
-                )
-
-                return tbl.mutate(pb_is_good_=tbl.pb_is_good_1 | tbl.pb_is_good_2).drop(
-                    "pb_is_good_1", "pb_is_good_2"
-                )
-
-            else:
-                tbl = self.x.mutate(
-                    pb_is_good_1=self.x[self.column].isnull() & ibis.literal(self.na_pass),
-                    pb_is_good_2=self.x[self.column] == ibis.literal(self.compare),
-                )
-
-                tbl = tbl.mutate(
-                    pb_is_good_2=ibis.ifelse(tbl.pb_is_good_2.notnull(), tbl.pb_is_good_2, False)
-                )
-
-                return tbl.mutate(pb_is_good_=tbl.pb_is_good_1 | tbl.pb_is_good_2).drop(
-                    "pb_is_good_1", "pb_is_good_2"
-                )
+            return self.x.mutate(pb_is_good_=predicate.to_ibis(self.x))
 
         # Local backends (Narwhals) ---------------------------------
 
-        if isinstance(self.compare, Column):
-            compare_expr = _get_compare_expr_nw(compare=self.compare)
-
-            tbl = self.x.with_columns(
-                pb_is_good_1=nw.col(self.column).is_null() & self.na_pass,
-                pb_is_good_2=(
-                    nw.col(self.compare.name).is_null() & self.na_pass
-                    if isinstance(self.compare, Column)
-                    else nw.lit(False)
-                ),
-            )
-
-            tbl = tbl.with_columns(
-                pb_is_good_3=(~nw.col(self.compare.name).is_null() & ~nw.col(self.column).is_null())
-            )
+        return self.x.with_columns(pb_is_good_=predicate.to_narwhals()).to_native()
 
-            if is_pandas_dataframe(tbl.to_native()):
-                tbl = tbl.with_columns(
-                    pb_is_good_4=nw.col(self.column) - compare_expr,
-                )
-
-                tbl = tbl.with_columns(
-                    pb_is_good_=nw.col("pb_is_good_1")
-                    | nw.col("pb_is_good_2")
-                    | (nw.col("pb_is_good_4") == 0 & ~nw.col("pb_is_good_3").is_null())
-                )
-
-            else:
-                tbl = tbl.with_columns(
-                    pb_is_good_4=nw.col(self.column) == compare_expr,
-                )
-
-                tbl = tbl.with_columns(
-                    pb_is_good_=nw.col("pb_is_good_1")
-                    | nw.col("pb_is_good_2")
-                    | (nw.col("pb_is_good_4") & ~nw.col("pb_is_good_1") & ~nw.col("pb_is_good_2"))
-                )
-
-            return tbl.drop(
-                "pb_is_good_1", "pb_is_good_2", "pb_is_good_3", "pb_is_good_4"
-            ).to_native()
-
-        else:
-            compare_expr = _get_compare_expr_nw(compare=self.compare)
-
-            tbl = self.x.with_columns(
-                pb_is_good_1=nw.col(self.column).is_null() & self.na_pass,
-                pb_is_good_2=(
-                    nw.col(self.compare.name).is_null() & self.na_pass
-                    if isinstance(self.compare, Column)
-                    else nw.lit(False)
-                ),
-            )
-
-            tbl = tbl.with_columns(pb_is_good_3=nw.col(self.column) == compare_expr)
-
-            tbl = tbl.with_columns(
-                pb_is_good_3=(
-                    nw.when(nw.col("pb_is_good_3").is_null())
-                    .then(nw.lit(False))
-                    .otherwise(nw.col("pb_is_good_3"))
-                )
-            )
+    def gt(self) -> FrameT | Any:
+        return self._apply_predicate(assertion_method="gt", values=self.compare)
 
-            tbl = tbl.with_columns(
-                pb_is_good_=nw.col("pb_is_good_1") | nw.col("pb_is_good_2") | nw.col("pb_is_good_3")
-            )
+    def lt(self) -> FrameT | Any:
+        return self._apply_predicate(assertion_method="lt", values=self.compare)
 
-            return tbl.drop("pb_is_good_1", "pb_is_good_2", "pb_is_good_3").to_native()
+    def eq(self) -> FrameT | Any:
+        return self._apply_predicate(assertion_method="eq", values=self.compare)
 
     def ne(self) -> FrameT | Any:
-        # Ibis backends ---------------------------------------------
-
-        if self.tbl_type in IBIS_BACKENDS:
-            import ibis
-
-            if isinstance(self.compare, Column):
-                tbl = self.x.mutate(
-                    pb_is_good_1=(self.x[self.column].isnull() | self.x[self.compare.name].isnull())
-                    & ibis.literal(self.na_pass),
-                    pb_is_good_2=self.x[self.column] != self.x[self.compare.name],
-                )
-
-                tbl = tbl.mutate(
-                    pb_is_good_2=ibis.ifelse(tbl.pb_is_good_2.notnull(), tbl.pb_is_good_2, False)
-                )
-
-                return tbl.mutate(pb_is_good_=tbl.pb_is_good_1 | tbl.pb_is_good_2).drop(
-                    "pb_is_good_1", "pb_is_good_2"
-                )
-
-            tbl = self.x.mutate(
-                pb_is_good_1=self.x[self.column].isnull() & ibis.literal(self.na_pass),
-                pb_is_good_2=ibis.ifelse(
-                    self.x[self.column].notnull(),
-                    self.x[self.column] != ibis.literal(self.compare),
-                    ibis.literal(False),
-                ),
-            )
-
-            return tbl.mutate(pb_is_good_=tbl.pb_is_good_1 | tbl.pb_is_good_2).drop(
-                "pb_is_good_1", "pb_is_good_2"
-            )
-
-        # Local backends (Narwhals) ---------------------------------
-
-        # Determine if the reference and comparison columns have any null values
-        ref_col_has_null_vals = _column_has_null_values(table=self.x, column=self.column)
-
-        if isinstance(self.compare, Column):
-            compare_name = self.compare.name if isinstance(self.compare, Column) else self.compare
-            cmp_col_has_null_vals = _column_has_null_values(table=self.x, column=compare_name)
-        else:
-            cmp_col_has_null_vals = False
-
-        # If neither column has null values, we can proceed with the comparison
-        # without too many complications
-        if not ref_col_has_null_vals and not cmp_col_has_null_vals:
-            if isinstance(self.compare, Column):
-                compare_expr = _get_compare_expr_nw(compare=self.compare)
-
-                return self.x.with_columns(
-                    pb_is_good_=nw.col(self.column) != compare_expr,
-                ).to_native()
-
-            else:
-                return self.x.with_columns(
-                    pb_is_good_=nw.col(self.column) != nw.lit(self.compare),
-                ).to_native()
-
-        # If either column has null values, we need to handle the comparison
-        # much more carefully since we can't inadverdently compare null values
-        # to non-null values
-
-        if isinstance(self.compare, Column):
-            compare_expr = _get_compare_expr_nw(compare=self.compare)
-
-            # CASE 1: the reference column has null values but the comparison column does not
-            if ref_col_has_null_vals and not cmp_col_has_null_vals:
-                if is_pandas_dataframe(self.x.to_native()):
-                    tbl = self.x.with_columns(
-                        pb_is_good_1=nw.col(self.column).is_null(),
-                        pb_is_good_2=nw.lit(self.column) != nw.col(self.compare.name),
-                    )
-
-                else:
-                    tbl = self.x.with_columns(
-                        pb_is_good_1=nw.col(self.column).is_null(),
-                        pb_is_good_2=nw.col(self.column) != nw.col(self.compare.name),
-                    )
-
-                if not self.na_pass:
-                    tbl = tbl.with_columns(
-                        pb_is_good_2=nw.col("pb_is_good_2") & ~nw.col("pb_is_good_1")
-                    )
-
-                if is_polars_dataframe(self.x.to_native()):
-                    # There may be Null values in the pb_is_good_2 column, change those to
-                    # True if na_pass is True, False otherwise
-
-                    tbl = tbl.with_columns(
-                        pb_is_good_2=nw.when(nw.col("pb_is_good_2").is_null())
-                        .then(False)
-                        .otherwise(nw.col("pb_is_good_2")),
-                    )
-
-                    if self.na_pass:
-                        tbl = tbl.with_columns(
-                            pb_is_good_2=(nw.col("pb_is_good_1") | nw.col("pb_is_good_2"))
-                        )
-
-                return (
-                    tbl.with_columns(pb_is_good_=nw.col("pb_is_good_2"))
-                    .drop("pb_is_good_1", "pb_is_good_2")
-                    .to_native()
-                )
-
-            # CASE 2: the comparison column has null values but the reference column does not
-            elif not ref_col_has_null_vals and cmp_col_has_null_vals:
-                if is_pandas_dataframe(self.x.to_native()):
-                    tbl = self.x.with_columns(
-                        pb_is_good_1=nw.col(self.column) != nw.lit(self.compare.name),
-                        pb_is_good_2=nw.col(self.compare.name).is_null(),
-                    )
-
-                else:
-                    tbl = self.x.with_columns(
-                        pb_is_good_1=nw.col(self.column) != nw.col(self.compare.name),
-                        pb_is_good_2=nw.col(self.compare.name).is_null(),
-                    )
-
-                if not self.na_pass:
-                    tbl = tbl.with_columns(
-                        pb_is_good_1=nw.col("pb_is_good_1") & ~nw.col("pb_is_good_2")
-                    )
-
-                if is_polars_dataframe(self.x.to_native()):
-                    if self.na_pass:
-                        tbl = tbl.with_columns(
-                            pb_is_good_1=(nw.col("pb_is_good_1") | nw.col("pb_is_good_2"))
-                        )
-
-                return (
-                    tbl.with_columns(pb_is_good_=nw.col("pb_is_good_1"))
-                    .drop("pb_is_good_1", "pb_is_good_2")
-                    .to_native()
-                )
-
-            # CASE 3: both columns have null values and there may potentially be cases where
-            # there could even be null/null comparisons
-            elif ref_col_has_null_vals and cmp_col_has_null_vals:
-                tbl = self.x.with_columns(
-                    pb_is_good_1=nw.col(self.column).is_null(),
-                    pb_is_good_2=nw.col(self.compare.name).is_null(),
-                    pb_is_good_3=nw.col(self.column) != nw.col(self.compare.name),
-                )
-
-                if not self.na_pass:
-                    tbl = tbl.with_columns(
-                        pb_is_good_3=nw.col("pb_is_good_3")
-                        & ~nw.col("pb_is_good_1")
-                        & ~nw.col("pb_is_good_2")
-                    )
-
-                if is_polars_dataframe(self.x.to_native()):
-                    if self.na_pass:
-                        tbl = tbl.with_columns(
-                            pb_is_good_3=(
-                                nw.when(nw.col("pb_is_good_1") | nw.col("pb_is_good_2"))
-                                .then(True)
-                                .otherwise(False)
-                            )
-                        )
-
-                return (
-                    tbl.with_columns(pb_is_good_=nw.col("pb_is_good_3"))
-                    .drop("pb_is_good_1", "pb_is_good_2", "pb_is_good_3")
-                    .to_native()
-                )
-
-        else:
-            # Case where the reference column contains null values
-            if ref_col_has_null_vals:
-                # Create individual cases for Pandas and Polars
-
-                if is_pandas_dataframe(self.x.to_native()):
-                    tbl = self.x.with_columns(
-                        pb_is_good_1=nw.col(self.column).is_null(),
-                        pb_is_good_2=nw.lit(self.column) != nw.lit(self.compare),
-                    )
-
-                    if not self.na_pass:
-                        tbl = tbl.with_columns(
-                            pb_is_good_2=nw.col("pb_is_good_2") & ~nw.col("pb_is_good_1")
-                        )
-
-                    return (
-                        tbl.with_columns(pb_is_good_=nw.col("pb_is_good_2"))
-                        .drop("pb_is_good_1", "pb_is_good_2")
-                        .to_native()
-                    )
-
-                elif is_polars_dataframe(self.x.to_native()):
-                    tbl = self.x.with_columns(
-                        pb_is_good_1=nw.col(self.column).is_null(),  # val is Null in Column
-                        pb_is_good_2=nw.lit(self.na_pass),  # Pass if any Null in val or compare
-                    )
-
-                    tbl = tbl.with_columns(pb_is_good_3=nw.col(self.column) != nw.lit(self.compare))
-
-                    tbl = tbl.with_columns(
-                        pb_is_good_=(
-                            (nw.col("pb_is_good_1") & nw.col("pb_is_good_2"))
-                            | (nw.col("pb_is_good_3") & ~nw.col("pb_is_good_1"))
-                        )
-                    )
-
-                    tbl = tbl.drop("pb_is_good_1", "pb_is_good_2", "pb_is_good_3").to_native()
-
-                    return tbl
+        return self._apply_predicate(assertion_method="ne", values=self.compare)
 
     def ge(self) -> FrameT | Any:
-        # Ibis backends ---------------------------------------------
-
-        if self.tbl_type in IBIS_BACKENDS:
-            import ibis
-
-            if isinstance(self.compare, Column):
-                tbl = self.x.mutate(
-                    pb_is_good_1=(self.x[self.column].isnull() | self.x[self.compare.name].isnull())
-                    & ibis.literal(self.na_pass),
-                    pb_is_good_2=self.x[self.column] >= self.x[self.compare.name],
-                )
-
-                tbl = tbl.mutate(
-                    pb_is_good_2=ibis.ifelse(tbl.pb_is_good_2.notnull(), tbl.pb_is_good_2, False)
-                )
-
-                return tbl.mutate(pb_is_good_=tbl.pb_is_good_1 | tbl.pb_is_good_2).drop(
-                    "pb_is_good_1", "pb_is_good_2"
-                )
-
-            tbl = self.x.mutate(
-                pb_is_good_1=self.x[self.column].isnull() & ibis.literal(self.na_pass),
-                pb_is_good_2=self.x[self.column] >= ibis.literal(self.compare),
-            )
-
-            tbl = tbl.mutate(
-                pb_is_good_2=ibis.ifelse(tbl.pb_is_good_2.notnull(), tbl.pb_is_good_2, False)
-            )
-
-            return tbl.mutate(pb_is_good_=tbl.pb_is_good_1 | tbl.pb_is_good_2).drop(
-                "pb_is_good_1", "pb_is_good_2"
-            )
-
-        # Local backends (Narwhals) ---------------------------------
-
-        compare_expr = _get_compare_expr_nw(compare=self.compare)
-
-        tbl = (
-            self.x.with_columns(
-                pb_is_good_1=nw.col(self.column).is_null() & self.na_pass,
-                pb_is_good_2=(
-                    nw.col(self.compare.name).is_null() & self.na_pass
-                    if isinstance(self.compare, Column)
-                    else nw.lit(False)
-                ),
-                pb_is_good_3=nw.col(self.column) >= compare_expr,
-            )
-            .with_columns(
-                pb_is_good_3=(
-                    nw.when(nw.col("pb_is_good_3").is_null())
-                    .then(nw.lit(False))
-                    .otherwise(nw.col("pb_is_good_3"))
-                )
-            )
-            .with_columns(
-                pb_is_good_=nw.col("pb_is_good_1") | nw.col("pb_is_good_2") | nw.col("pb_is_good_3")
-            )
-        )
-
-        return tbl.drop("pb_is_good_1", "pb_is_good_2", "pb_is_good_3").to_native()
+        return self._apply_predicate(assertion_method="ge", values=self.compare)
 
     def le(self) -> FrameT | Any:
-        # Ibis backends ---------------------------------------------
-
-        if self.tbl_type in IBIS_BACKENDS:
-            import ibis
-
-            if isinstance(self.compare, Column):
-                tbl = self.x.mutate(
-                    pb_is_good_1=(self.x[self.column].isnull() | self.x[self.compare.name].isnull())
-                    & ibis.literal(self.na_pass),
-                    pb_is_good_2=self.x[self.column] <= self.x[self.compare.name],
-                )
-
-                tbl = tbl.mutate(
-                    pb_is_good_2=ibis.ifelse(tbl.pb_is_good_2.notnull(), tbl.pb_is_good_2, False)
-                )
-
-                return tbl.mutate(pb_is_good_=tbl.pb_is_good_1 | tbl.pb_is_good_2).drop(
-                    "pb_is_good_1", "pb_is_good_2"
-                )
-
-            tbl = self.x.mutate(
-                pb_is_good_1=self.x[self.column].isnull() & ibis.literal(self.na_pass),
-                pb_is_good_2=self.x[self.column] <= ibis.literal(self.compare),
-            )
-
-            tbl = tbl.mutate(
-                pb_is_good_2=ibis.ifelse(tbl.pb_is_good_2.notnull(), tbl.pb_is_good_2, False)
-            )
-
-            return tbl.mutate(pb_is_good_=tbl.pb_is_good_1 | tbl.pb_is_good_2).drop(
-                "pb_is_good_1", "pb_is_good_2"
-            )
-
-        # Local backends (Narwhals) ---------------------------------
-
-        compare_expr = _get_compare_expr_nw(compare=self.compare)
-
-        return (
-            self.x.with_columns(
-                pb_is_good_1=nw.col(self.column).is_null() & self.na_pass,
-                pb_is_good_2=(
-                    nw.col(self.compare.name).is_null() & self.na_pass
-                    if isinstance(self.compare, Column)
-                    else nw.lit(False)
-                ),
-                pb_is_good_3=nw.col(self.column) <= compare_expr,
-            )
-            .with_columns(
-                pb_is_good_3=(
-                    nw.when(nw.col("pb_is_good_3").is_null())
-                    .then(nw.lit(False))
-                    .otherwise(nw.col("pb_is_good_3"))
-                )
-            )
-            .with_columns(
-                pb_is_good_=nw.col("pb_is_good_1") | nw.col("pb_is_good_2") | nw.col("pb_is_good_3")
-            )
-            .drop("pb_is_good_1", "pb_is_good_2", "pb_is_good_3")
-            .to_native()
-        )
+        return self._apply_predicate(assertion_method="le", values=self.compare)
 
     def between(self) -> FrameT | Any:
-        # Ibis backends ---------------------------------------------
-
-        if self.tbl_type in IBIS_BACKENDS:
-            import ibis
-
-            if isinstance(self.low, Column) or isinstance(self.high, Column):
-                if isinstance(self.low, Column):
-                    low_val = self.x[self.low.name]
-                else:
-                    low_val = ibis.literal(self.low)
-
-                if isinstance(self.high, Column):
-                    high_val = self.x[self.high.name]
-                else:
-                    high_val = ibis.literal(self.high)
-
-                if isinstance(self.low, Column) and isinstance(self.high, Column):
-                    tbl = self.x.mutate(
-                        pb_is_good_1=(
-                            self.x[self.column].isnull()
-                            | self.x[self.low.name].isnull()
-                            | self.x[self.high.name].isnull()
-                        )
-                        & ibis.literal(self.na_pass)
-                    )
-                elif isinstance(self.low, Column):
-                    tbl = self.x.mutate(
-                        pb_is_good_1=(self.x[self.column].isnull() | self.x[self.low.name].isnull())
-                        & ibis.literal(self.na_pass)
-                    )
-                elif isinstance(self.high, Column):
-                    tbl = self.x.mutate(
-                        pb_is_good_1=(
-                            self.x[self.column].isnull() | self.x[self.high.name].isnull()
-                        )
-                        & ibis.literal(self.na_pass)
-                    )
-
-                if self.inclusive[0]:
-                    tbl = tbl.mutate(pb_is_good_2=tbl[self.column] >= low_val)
-                else:
-                    tbl = tbl.mutate(pb_is_good_2=tbl[self.column] > low_val)
-
-                tbl = tbl.mutate(
-                    pb_is_good_2=ibis.ifelse(tbl.pb_is_good_2.notnull(), tbl.pb_is_good_2, False)
-                )
-
-                if self.inclusive[1]:
-                    tbl = tbl.mutate(pb_is_good_3=tbl[self.column] <= high_val)
-                else:
-                    tbl = tbl.mutate(pb_is_good_3=tbl[self.column] < high_val)
-
-                tbl = tbl.mutate(
-                    pb_is_good_3=ibis.ifelse(tbl.pb_is_good_3.notnull(), tbl.pb_is_good_3, False)
-                )
-
-                return tbl.mutate(
-                    pb_is_good_=tbl.pb_is_good_1 | (tbl.pb_is_good_2 & tbl.pb_is_good_3)
-                ).drop("pb_is_good_1", "pb_is_good_2", "pb_is_good_3")
-
-            else:
-                low_val = ibis.literal(self.low)
-                high_val = ibis.literal(self.high)
-
-                tbl = self.x.mutate(
-                    pb_is_good_1=self.x[self.column].isnull() & ibis.literal(self.na_pass)
-                )
-
-                if self.inclusive[0]:
-                    tbl = tbl.mutate(pb_is_good_2=tbl[self.column] >= low_val)
-                else:
-                    tbl = tbl.mutate(pb_is_good_2=tbl[self.column] > low_val)
-
-                tbl = tbl.mutate(
-                    pb_is_good_2=ibis.ifelse(tbl.pb_is_good_2.notnull(), tbl.pb_is_good_2, False)
-                )
-
-                if self.inclusive[1]:
-                    tbl = tbl.mutate(pb_is_good_3=tbl[self.column] <= high_val)
-                else:
-                    tbl = tbl.mutate(pb_is_good_3=tbl[self.column] < high_val)
-
-                tbl = tbl.mutate(
-                    pb_is_good_3=ibis.ifelse(tbl.pb_is_good_3.notnull(), tbl.pb_is_good_3, False)
-                )
-
-                return tbl.mutate(
-                    pb_is_good_=tbl.pb_is_good_1 | (tbl.pb_is_good_2 & tbl.pb_is_good_3)
-                ).drop("pb_is_good_1", "pb_is_good_2", "pb_is_good_3")
-
-        # Local backends (Narwhals) ---------------------------------
-
-        low_val = _get_compare_expr_nw(compare=self.low)
-        high_val = _get_compare_expr_nw(compare=self.high)
-
-        tbl = self.x.with_columns(
-            pb_is_good_1=nw.col(self.column).is_null(),  # val is Null in Column
-            pb_is_good_2=(  # lb is Null in Column
-                nw.col(self.low.name).is_null() if isinstance(self.low, Column) else nw.lit(False)
-            ),
-            pb_is_good_3=(  # ub is Null in Column
-                nw.col(self.high.name).is_null() if isinstance(self.high, Column) else nw.lit(False)
-            ),
-            pb_is_good_4=nw.lit(self.na_pass),  # Pass if any Null in lb, val, or ub
-        )
-
-        if self.inclusive[0]:
-            tbl = tbl.with_columns(pb_is_good_5=nw.col(self.column) >= low_val)
-        else:
-            tbl = tbl.with_columns(pb_is_good_5=nw.col(self.column) > low_val)
-
-        if self.inclusive[1]:
-            tbl = tbl.with_columns(pb_is_good_6=nw.col(self.column) <= high_val)
-        else:
-            tbl = tbl.with_columns(pb_is_good_6=nw.col(self.column) < high_val)
-
-        tbl = tbl.with_columns(
-            pb_is_good_5=(
-                nw.when(nw.col("pb_is_good_5").is_null())
-                .then(nw.lit(False))
-                .otherwise(nw.col("pb_is_good_5"))
-            )
-        )
-
-        tbl = tbl.with_columns(
-            pb_is_good_6=(
-                nw.when(nw.col("pb_is_good_6").is_null())
-                .then(nw.lit(False))
-                .otherwise(nw.col("pb_is_good_6"))
-            )
-        )
-
-        tbl = (
-            tbl.with_columns(
-                pb_is_good_=(
-                    (
-                        (nw.col("pb_is_good_1") | nw.col("pb_is_good_2") | nw.col("pb_is_good_3"))
-                        & nw.col("pb_is_good_4")
-                    )
-                    | (nw.col("pb_is_good_5") & nw.col("pb_is_good_6"))
-                )
-            )
-            .drop(
-                "pb_is_good_1",
-                "pb_is_good_2",
-                "pb_is_good_3",
-                "pb_is_good_4",
-                "pb_is_good_5",
-                "pb_is_good_6",
-            )
-            .to_native()
-        )
-
-        return tbl
+        return self._apply_predicate(assertion_method="between", values=(self.low, self.high))
 
     def outside(self) -> FrameT | Any:
-        # Ibis backends ---------------------------------------------
-
-        if self.tbl_type in IBIS_BACKENDS:
-            import ibis
-
-            if isinstance(self.low, Column) or isinstance(self.high, Column):
-                if isinstance(self.low, Column):
-                    low_val = self.x[self.low.name]
-                else:
-                    low_val = ibis.literal(self.low)
-
-                if isinstance(self.high, Column):
-                    high_val = self.x[self.high.name]
-                else:
-                    high_val = ibis.literal(self.high)
-
-                if isinstance(self.low, Column) and isinstance(self.high, Column):
-                    tbl = self.x.mutate(
-                        pb_is_good_1=(
-                            self.x[self.column].isnull()
-                            | self.x[self.low.name].isnull()
-                            | self.x[self.high.name].isnull()
-                        )
-                        & ibis.literal(self.na_pass)
-                    )
-
-                elif isinstance(self.low, Column):
-                    tbl = self.x.mutate(
-                        pb_is_good_1=(self.x[self.column].isnull() | self.x[self.low.name].isnull())
-                        & ibis.literal(self.na_pass)
-                    )
-                elif isinstance(self.high, Column):
-                    tbl = self.x.mutate(
-                        pb_is_good_1=(
-                            self.x[self.column].isnull() | self.x[self.high.name].isnull()
-                        )
-                        & ibis.literal(self.na_pass)
-                    )
-
-                if self.inclusive[0]:
-                    tbl = tbl.mutate(pb_is_good_2=tbl[self.column] < low_val)
-                else:
-                    tbl = tbl.mutate(pb_is_good_2=tbl[self.column] <= low_val)
-
-                if self.inclusive[1]:
-                    tbl = tbl.mutate(pb_is_good_3=tbl[self.column] > high_val)
-                else:
-                    tbl = tbl.mutate(pb_is_good_3=tbl[self.column] >= high_val)
-
-                tbl = tbl.mutate(
-                    pb_is_good_2=ibis.ifelse(
-                        tbl.pb_is_good_3.isnull(),
-                        False,
-                        tbl.pb_is_good_2,
-                    )
-                )
-
-                tbl = tbl.mutate(
-                    pb_is_good_3=ibis.ifelse(
-                        tbl.pb_is_good_2.isnull(),
-                        False,
-                        tbl.pb_is_good_3,
-                    )
-                )
-
-                tbl = tbl.mutate(
-                    pb_is_good_2=ibis.ifelse(
-                        tbl.pb_is_good_2.isnull(),
-                        False,
-                        tbl.pb_is_good_2,
-                    )
-                )
-
-                tbl = tbl.mutate(
-                    pb_is_good_3=ibis.ifelse(
-                        tbl.pb_is_good_3.isnull(),
-                        False,
-                        tbl.pb_is_good_3,
-                    )
-                )
-
-                return tbl.mutate(
-                    pb_is_good_=tbl.pb_is_good_1 | (tbl.pb_is_good_2 | tbl.pb_is_good_3)
-                ).drop("pb_is_good_1", "pb_is_good_2", "pb_is_good_3")
-
-            low_val = ibis.literal(self.low)
-            high_val = ibis.literal(self.high)
-
-            tbl = self.x.mutate(
-                pb_is_good_1=self.x[self.column].isnull() & ibis.literal(self.na_pass)
-            )
-
-            if self.inclusive[0]:
-                tbl = tbl.mutate(pb_is_good_2=tbl[self.column] < low_val)
-            else:
-                tbl = tbl.mutate(pb_is_good_2=tbl[self.column] <= low_val)
-
-            tbl = tbl.mutate(
-                pb_is_good_2=ibis.ifelse(tbl.pb_is_good_2.notnull(), tbl.pb_is_good_2, False)
-            )
-
-            if self.inclusive[1]:
-                tbl = tbl.mutate(pb_is_good_3=tbl[self.column] > high_val)
-            else:
-                tbl = tbl.mutate(pb_is_good_3=tbl[self.column] >= high_val)
-
-            tbl = tbl.mutate(
-                pb_is_good_3=ibis.ifelse(tbl.pb_is_good_3.notnull(), tbl.pb_is_good_3, False)
-            )
-
-            return tbl.mutate(
-                pb_is_good_=tbl.pb_is_good_1 | tbl.pb_is_good_2 | tbl.pb_is_good_3
-            ).drop("pb_is_good_1", "pb_is_good_2", "pb_is_good_3")
-
-        # Local backends (Narwhals) ---------------------------------
-
-        low_val = _get_compare_expr_nw(compare=self.low)
-        high_val = _get_compare_expr_nw(compare=self.high)
-
-        tbl = self.x.with_columns(
-            pb_is_good_1=nw.col(self.column).is_null(),  # val is Null in Column
-            pb_is_good_2=(  # lb is Null in Column
-                nw.col(self.low.name).is_null() if isinstance(self.low, Column) else nw.lit(False)
-            ),
-            pb_is_good_3=(  # ub is Null in Column
-                nw.col(self.high.name).is_null() if isinstance(self.high, Column) else nw.lit(False)
-            ),
-            pb_is_good_4=nw.lit(self.na_pass),  # Pass if any Null in lb, val, or ub
-        )
-
-        if self.inclusive[0]:
-            tbl = tbl.with_columns(pb_is_good_5=nw.col(self.column) < low_val)
-        else:
-            tbl = tbl.with_columns(pb_is_good_5=nw.col(self.column) <= low_val)
-
-        if self.inclusive[1]:
-            tbl = tbl.with_columns(pb_is_good_6=nw.col(self.column) > high_val)
-        else:
-            tbl = tbl.with_columns(pb_is_good_6=nw.col(self.column) >= high_val)
-
-        tbl = tbl.with_columns(
-            pb_is_good_5=nw.when(nw.col("pb_is_good_5").is_null())
-            .then(False)
-            .otherwise(nw.col("pb_is_good_5")),
-            pb_is_good_6=nw.when(nw.col("pb_is_good_6").is_null())
-            .then(False)
-            .otherwise(nw.col("pb_is_good_6")),
-        )
-
-        tbl = (
-            tbl.with_columns(
-                pb_is_good_=(
-                    (
-                        (nw.col("pb_is_good_1") | nw.col("pb_is_good_2") | nw.col("pb_is_good_3"))
-                        & nw.col("pb_is_good_4")
-                    )
-                    | (
-                        (nw.col("pb_is_good_5") & ~nw.col("pb_is_good_3"))
-                        | (nw.col("pb_is_good_6")) & ~nw.col("pb_is_good_2")
-                    )
-                )
-            )
-            .drop(
-                "pb_is_good_1",
-                "pb_is_good_2",
-                "pb_is_good_3",
-                "pb_is_good_4",
-                "pb_is_good_5",
-                "pb_is_good_6",
-            )
-            .to_native()
-        )
-
-        return tbl
+        return self._apply_predicate(assertion_method="outside", values=(self.low, self.high))
 
     def isin(self) -> FrameT | Any:
-        # Ibis backends ---------------------------------------------
-
-        if self.tbl_type in IBIS_BACKENDS:
-            return self.x.mutate(pb_is_good_=self.x[self.column].isin(self.set))
-
-        # Local backends (Narwhals) ---------------------------------
-
-        return self.x.with_columns(
-            pb_is_good_=nw.col(self.column).is_in(self.set),
-        ).to_native()
+        return self._apply_predicate(assertion_method="in_set", values=self.set)
 
     def notin(self) -> FrameT | Any:
-        # Ibis backends ---------------------------------------------
-
-        if self.tbl_type in IBIS_BACKENDS:
-            return self.x.mutate(pb_is_good_=self.x[self.column].notin(self.set))
-
-        # Local backends (Narwhals) ---------------------------------
-
-        return (
-            self.x.with_columns(
-                pb_is_good_=nw.col(self.column).is_in(self.set),
-            )
-            .with_columns(pb_is_good_=~nw.col("pb_is_good_"))
-            .to_native()
-        )
+        return self._apply_predicate(assertion_method="not_in_set", values=self.set)
 
     def regex(self) -> FrameT | Any:
-        # Ibis backends ---------------------------------------------
-
-        if self.tbl_type in IBIS_BACKENDS:
-            import ibis
-
-            tbl = self.x.mutate(
-                pb_is_good_1=self.x[self.column].isnull() & ibis.literal(self.na_pass),
-                pb_is_good_2=self.x[self.column].re_search(self.pattern),
-            )
-
-            return tbl.mutate(pb_is_good_=tbl.pb_is_good_1 | tbl.pb_is_good_2).drop(
-                "pb_is_good_1", "pb_is_good_2"
-            )
-
-        # Local backends (Narwhals) ---------------------------------
-
-        return (
-            self.x.with_columns(
-                pb_is_good_1=nw.col(self.column).is_null() & self.na_pass,
-                pb_is_good_2=nw.when(~nw.col(self.column).is_null())
-                .then(nw.col(self.column).str.contains(pattern=self.pattern))
-                .otherwise(False),
-            )
-            .with_columns(pb_is_good_=nw.col("pb_is_good_1") | nw.col("pb_is_good_2"))
-            .drop("pb_is_good_1", "pb_is_good_2")
-            .to_native()
-        )
+        return self._apply_predicate(assertion_method="regex", values=self.pattern)
 
     def null(self) -> FrameT | Any:
-        # Ibis backends ---------------------------------------------
-
-        if self.tbl_type in IBIS_BACKENDS:
-            return self.x.mutate(
-                pb_is_good_=self.x[self.column].isnull(),
-            )
-
-        # Local backends (Narwhals) ---------------------------------
-
-        return self.x.with_columns(
-            pb_is_good_=nw.col(self.column).is_null(),
-        ).to_native()
+        return self._apply_predicate(assertion_method="null")
 
     def not_null(self) -> FrameT | Any:
-        # Ibis backends ---------------------------------------------
-
-        if self.tbl_type in IBIS_BACKENDS:
-            return self.x.mutate(
-                pb_is_good_=~self.x[self.column].isnull(),
-            )
-
-        # Local backends (Narwhals) ---------------------------------
-
-        return self.x.with_columns(
-            pb_is_good_=~nw.col(self.column).is_null(),
-        ).to_native()
+        return self._apply_predicate(assertion_method="not_null")
 
     def rows_distinct(self) -> FrameT | Any:
         # Ibis backends ---------------------------------------------
@@ -1523,6 +605,39 @@ class ColValsRegex:
         )
 
 
+def _get_expr_type(expr: Any) -> str:
+    """
+    Get the type of an expression used in `col_vals_expr()`.
+
+    Returns
+    -------
+    str
+        One of `"narwhals"`, `"polars"`, `"ibis"`, or `"callable"` (e.g., a lambda function that
+        takes a Pandas DataFrame). Any other type of object is returned as its type name.
+    """
+
+    if isinstance(expr, nw.Expr):
+        return "narwhals"
+
+    # Only check against the libraries that are already imported
+    pl = get_polars()
+
+    if pl is not None and isinstance(expr, pl.Expr):
+        return "polars"
+
+    if get_ibis() is not None:
+        from ibis.common.deferred import Deferred
+        from ibis.expr.types import Value
+
+        if isinstance(expr, (Deferred, Value)):
+            return "ibis"
+
+    if callable(expr):
+        return "callable"
+
+    return type(expr).__name__
+
+
 @dataclass
 class ColValsExpr:
     """
@@ -1547,40 +662,57 @@ class ColValsExpr:
     """
 
     data_tbl: FrameT
-    expr: str
+    expr: Any
     threshold: int
     tbl_type: str = "local"
 
     def __post_init__(self):
-        if self.tbl_type == "local":
-            # Check the type of expression provided
-            if "narwhals" in str(type(self.expr)) and "expr" in str(type(self.expr)):
-                expression_type = "narwhals"
-            elif "polars" in str(type(self.expr)) and "expr" in str(type(self.expr)):
-                expression_type = "polars"
-            else:
-                expression_type = "pandas"
+        expr_type = _get_expr_type(expr=self.expr)
 
-            # Determine whether this is a Pandas or Polars table
-            tbl_type = _get_tbl_type(data=self.data_tbl)
+        if self.tbl_type in IBIS_BACKENDS:
+            if expr_type == "ibis":
+                # Deferred expressions (e.g., `ibis._.a > 0`) are resolved against the table
+                self.test_unit_res = self.data_tbl.mutate(pb_is_good_=self.expr)
+
+            elif expr_type == "narwhals":
+                try:
+                    tbl_nw = nw.from_native(self.data_tbl).with_columns(pb_is_good_=self.expr)
+                except NotImplementedError as e:
+                    raise ValueError(
+                        "Using a Narwhals expression with an Ibis table requires a version of "
+                        "Narwhals that supports Ibis tables as lazy frames. Either upgrade "
+                        "Narwhals or use an Ibis expression (e.g., `ibis._.a > ibis._.b`)."
+                    ) from e
+
+                self.test_unit_res = tbl_nw.to_native()
+
+            else:
+                raise ValueError(
+                    "The expression for an Ibis table must be either an Ibis expression or a "
+                    f"Narwhals expression (got an expression of type `{expr_type}`)."
+                )
 
-            df_lib_name = "polars" if "polars" in tbl_type else "pandas"
+            return
 
-            if expression_type == "narwhals":
-                tbl_nw = _convert_to_narwhals(df=self.data_tbl)
-                tbl_nw = tbl_nw.with_columns(pb_is_good_=self.expr)
-                tbl = tbl_nw.to_native()
-                self.test_unit_res = tbl
+        # Determine whether this is a Pandas or Polars table
+        df_lib_name = "polars" if "polars" in _get_tbl_type(data=self.data_tbl) else "pandas"
 
-                return self
+        if expr_type == "narwhals":
+            tbl_nw = _convert_to_narwhals(df=self.data_tbl)
+            self.test_unit_res = tbl_nw.with_columns(pb_is_good_=self.expr).to_native()
 
-            if df_lib_name == "polars" and expression_type == "polars":
-                self.test_unit_res = self.data_tbl.with_columns(pb_is_good_=self.expr)
+        elif df_lib_name == "polars" and expr_type == "polars":
+            self.test_unit_res = self.data_tbl.with_columns(pb_is_good_=self.expr)
 
-            if df_lib_name == "pandas" and expression_type == "pandas":
-                self.test_unit_res = self.data_tbl.assign(pb_is_good_=self.expr)
+        elif df_lib_name == "pandas" and expr_type == "callable":
+            self.test_unit_res = self.data_tbl.assign(pb_is_good_=self.expr)
 
-            return self
+        else:
+            raise ValueError(
+                f"An expression of type `{expr_type}` cannot be used with a {df_lib_name.title()} "
+                "table. Use a Narwhals expression, or a Polars expression for a Polars DataFrame "
+                "and a callable (e.g., a lambda function) for a Pandas DataFrame."
+            )
 
     def get_test_results(self):
         return self.test_unit_res
@@ -1904,18 +1036,223 @@ class NumberOfTestUnits:
             return self.df.count().to_polars()
 
 
-def _get_compare_expr_nw(compare: Any) -> Any:
-    if isinstance(compare, Column):
-        if not isinstance(compare.exprs, str):
-            raise ValueError("The column expression must be a string.")  # pragma: no cover
-        return nw.col(compare.exprs)
-    return compare
+def _get_ibis_test_unit_counts(results_tbl: Any) -> tuple[int, int, int]:
+    """
+    Count the test units of an Ibis results table with a single aggregate query.
+
+    The `pb_is_good_` column is aggregated on the backend so that only three integers (the number
+    of test units, passing test units, and failing test units) are fetched.
+
+    Returns
+    -------
+    tuple[int, int, int]
+        A tuple with the number of test units, passing test units, and failing test units.
+    """
+
+    is_good = results_tbl["pb_is_good_"]
+
+    counts = (
+        results_tbl.aggregate(
+            n=results_tbl.count(),
+            n_passed=(is_good == True).sum(),  # noqa: E712
+            n_failed=(is_good == False).sum(),  # noqa: E712
+        )
+        .to_pyarrow()
+        .to_pylist()[0]
+    )
+
+    return tuple(int(counts[key] or 0) for key in ["n", "n_passed", "n_failed"])
+
+
+def _get_ibis_row_number(tbl: Any) -> Any:
+    """
+    Get a 0-indexed row number for an Ibis table, ordered by the table's sort keys if it has any.
+
+    A table built with `order_by()` (and then only given new or selected columns) is numbered in
+    that order, so its row numbers are deterministic. Otherwise, rows are numbered in the order
+    that the backend reads them. This is the insertion order for backends like DuckDB, SQLite, and
+    Polars but engines that scan in parallel (e.g., PySpark, BigQuery, or Snowflake) may give
+    different row numbers on different runs.
+    """
+
+    import ibis
+    import ibis.expr.operations as ops
+
+    op = tbl.op()
+
+    # Look through projections (e.g., the `pb_is_good_` column added by `mutate()`) for a sort,
+    # keeping track of the names of the columns that pass through them unchanged
+    outer_names = {col: col for col in tbl.columns}
+
+    while isinstance(op, ops.Project):
+        outer_names = {
+            value.name: outer_names[name]
+            for name, value in op.values.items()
+            if isinstance(value, ops.Field) and value.rel == op.parent and name in outer_names
+        }
+        op = op.parent
+
+    if not isinstance(op, ops.Sort):
+        return ibis.row_number()
+
+    order_by = []
+
+    for key in op.keys:
+        if not isinstance(key.expr, ops.Field) or key.expr.name not in outer_names:
+            return ibis.row_number()
+
+        col = outer_names[key.expr.name]
+        order_by.append(ibis.asc(col) if key.ascending else ibis.desc(col))
+
+    return ibis.row_number().over(order_by=order_by)
+
+
+def _get_ibis_extract(
+    results_tbl: Any,
+    get_first_n: int | None = None,
+    sample_n: int | None = None,
+    sample_frac: int | float | None = None,
+    sample_limit: int = 5000,
+) -> Any:
+    """
+    Get an (unexecuted) Ibis query for the rows that failed a row-based validation step.
+
+    Row numbers are obtained with a window function over the results table (before filtering) so
+    that they refer to rows in the target table (see `_get_ibis_row_number()` for how the rows are
+    ordered). Any limiting or sampling of rows is done by the
+    backend: `get_first_n=` becomes a `LIMIT` clause, `sample_n=` orders the failing rows randomly
+    before limiting, and `sample_frac=` uses the backend's table sampling.
+
+    Returns
+    -------
+    Any
+        An Ibis table expression for the failing rows, with the 1-indexed `_row_num_` column first.
+    """
+
+    import ibis
+
+    tbl = results_tbl.mutate(_row_num_=_get_ibis_row_number(results_tbl) + 1)
+    tbl = tbl.filter(tbl["pb_is_good_"] == False).drop("pb_is_good_")  # noqa: E712
+    tbl = tbl.select("_row_num_", *[col for col in tbl.columns if col != "_row_num_"])
+
+    if get_first_n is not None:
+        return tbl.order_by("_row_num_").limit(get_first_n)
+
+    if sample_n is not None:
+        return tbl.order_by(ibis.random()).limit(sample_n)
+
+    if sample_frac is not None:
+        return tbl.sample(sample_frac).limit(sample_limit)
+
+    return tbl
+
+
+def _get_ibis_sampled_extract(
+    extract_tbl: Any,
+    sample_n: int | None = None,
+    sample_frac: int | float | None = None,
+    sample_limit: int = 5000,
+    seed: int | None = None,
+) -> Any:
+    """
+    Get an (unexecuted) Ibis query for a seeded sample of the rows in an extract query.
+
+    Only the row numbers of the failing rows are streamed from the backend (in order) and sampled
+    in a single pass; the query then selects the sampled rows so a given seed always gives the same
+    rows.
+    """
+
+    import pyarrow as pa
+
+    n_failing = extract_tbl.count().to_pyarrow().as_py() if sample_frac is not None else 0
+
+    reservoir = _ExtractReservoir(
+        size=_get_sample_size(
+            n_failing=n_failing,
+            sample_n=sample_n,
+            sample_frac=sample_frac,
+            sample_limit=sample_limit,
+        ),
+        seed=seed,
+    )
+
+    row_nums_tbl = extract_tbl.select("_row_num_").order_by("_row_num_")
+
+    for batch in row_nums_tbl.to_pyarrow_batches():
+        reservoir.update(row_nums=nw.from_native(pa.Table.from_batches([batch]))["_row_num_"])
+
+    return extract_tbl.filter(extract_tbl["_row_num_"].isin(reservoir.get_row_nums())).order_by(
+        "_row_num_"
+    )
+
+
+def _get_local_extract(
+    tbl: FrameT,
+    mask: nw.Series,
+    get_first_n: int | None = None,
+    sample_n: int | None = None,
+    sample_frac: int | float | None = None,
+    sample_limit: int = 5000,
+    seed: int | None = None,
+) -> FrameT:
+    """
+    Get the rows of a DataFrame that failed a row-based validation step.
+
+    Parameters
+    ----------
+    tbl
+        The table that was checked in the validation step (after any `pre=` processing).
+    mask
+        The boolean results of the step (the `pb_is_good_` column), where `True` indicates a
+        passing row.
+    seed
+        The seed for sampling failing rows with `sample_n=` or `sample_frac=`. Samples are drawn
+        in a single pass over the results (without first collecting all failing rows) and a given
+        seed always gives the same rows.
+
+    Returns
+    -------
+    FrameT
+        A table of the failing rows, with the 1-indexed `_row_num_` column first.
+    """
+
+    if sample_n is not None or sample_frac is not None:
+        n_failing = (mask == False).sum() if sample_frac is not None else 0  # noqa: E712
+
+        reservoir = _ExtractReservoir(
+            size=_get_sample_size(
+                n_failing=n_failing,
+                sample_n=sample_n,
+                sample_frac=sample_frac,
+                sample_limit=sample_limit,
+            ),
+            seed=seed,
+        )
+
+        for row_nums in _iter_failing_row_nums(mask=mask):
+            reservoir.update(row_nums=row_nums)
+
+        # Take the sampled rows (in their original order) from the table
+        extract_nw = nw.from_native(tbl).with_row_index(name="_row_num_")[
+            [row_num - 1 for row_num in reservoir.get_row_nums()]
+        ]
+
+        return nw.to_native(extract_nw.with_columns(nw.col("_row_num_") + 1))
 
+    # Add row numbers to the table and keep only the failing rows
+    extract_nw = (
+        nw.from_native(tbl)
+        .with_columns(pb_is_good_=mask)
+        .with_row_index(name="_row_num_")
+        .filter(nw.col("pb_is_good_") == False)  # noqa: E712
+        .drop("pb_is_good_")
+    )
 
-def _column_has_null_values(table: FrameT, column: str) -> bool:
-    null_count = (table.select(column).null_count())[column][0]
+    # Add 1 to the row numbers to make them 1-indexed
+    extract_nw = extract_nw.with_columns(nw.col("_row_num_") + 1)
 
-    if null_count is None or null_count == 0:
-        return False
+    # Limit the number of rows to extract
+    if get_first_n is not None:
+        extract_nw = extract_nw.head(get_first_n)
 
-    return True
+    return nw.to_native(extract_nw)
@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from functools import reduce
+from typing import Any
+
+import narwhals as nw
+
+from pointblank.column import Column
+
+COMPARISON_OPS = {
+    "gt": lambda x, y: x > y,
+    "lt": lambda x, y: x < y,
+    "eq": lambda x, y: x == y,
+    "ne": lambda x, y: x != y,
+    "ge": lambda x, y: x >= y,
+    "le": lambda x, y: x <= y,
+}
+
+
+@dataclass(frozen=True)
+class Predicate(ABC):
+    """
+    A node in a backend-neutral predicate expression.
+
+    Predicates are built once per validation step and then lowered to a single Narwhals
+    expression (for DataFrames) or a single Ibis expression (for Ibis tables). In both cases, the
+    result is one boolean column without any intermediate columns.
+    """
+
+    @abstractmethod
+    def to_narwhals(self) -> nw.Expr: ...
+
+    @abstractmethod
+    def to_ibis(self, tbl: Any) -> Any: ...
+
+    def __and__(self, other: Predicate) -> Predicate:
+        return And(operands=(self, other))
+
+    def __or__(self, other: Predicate) -> Predicate:
+        return Or(operands=(self, other))
+
+    def __invert__(self) -> Predicate:
+        return Not(operand=self)
+
+
+@dataclass(frozen=True)
+class ColRef(Predicate):
+    name: str
+
+    def to_narwhals(self) -> nw.Expr:
+        return nw.col(self.name)
+
+    def to_ibis(self, tbl: Any) -> Any:
+        return tbl[self.name]
+
+
+@dataclass(frozen=True)
+class Lit(Predicate):
+    value: Any
+
+    def to_narwhals(self) -> Any:
+        # Scalars are used as-is on the right-hand side of comparisons
+        return self.value
+
+    def to_ibis(self, tbl: Any) -> Any:
+        import ibis
+
+        return ibis.literal(self.value)
+
+
+@dataclass(frozen=True)
+class Difference(Predicate):
+    left: ColRef
+    right: ColRef
+
+    def to_narwhals(self) -> nw.Expr:
+        return self.left.to_narwhals() - self.right.to_narwhals()
+
+    def to_ibis(self, tbl: Any) -> Any:
+        return self.left.to_ibis(tbl) - self.right.to_ibis(tbl)
+
+
+@dataclass(frozen=True)
+class Compare(Predicate):
+    op: str
+    left: ColRef | Difference
+    right: ColRef | Lit
+
+    def to_narwhals(self) -> nw.Expr:
+        return COMPARISON_OPS[self.op](self.left.to_narwhals(), self.right.to_narwhals())
+
+    def to_ibis(self, tbl: Any) -> Any:
+        return COMPARISON_OPS[self.op](self.left.to_ibis(tbl), self.right.to_ibis(tbl))
+
+
+@dataclass(frozen=True)
+class IsNull(Predicate):
+    operand: ColRef
+
+    def to_narwhals(self) -> nw.Expr:
+        return self.operand.to_narwhals().is_null()
+
+    def to_ibis(self, tbl: Any) -> Any:
+        return self.operand.to_ibis(tbl).isnull()
+
+
+@dataclass(frozen=True)
+class IsIn(Predicate):
+    operand: ColRef
+    values: tuple
+
+    def to_narwhals(self) -> nw.Expr:
+        return self.operand.to_narwhals().is_in(list(self.values))
+
+    def to_ibis(self, tbl: Any) -> Any:
+        return self.operand.to_ibis(tbl).isin(list(self.values))
+
+
+@dataclass(frozen=True)
+class NotIn(Predicate):
+    operand: ColRef
+    values: tuple
+
+    def to_narwhals(self) -> nw.Expr:
+        return ~self.operand.to_narwhals().is_in(list(self.values))
+
+    def to_ibis(self, tbl: Any) -> Any:
+        return self.operand.to_ibis(tbl).notin(list(self.values))
+
+
+@dataclass(frozen=True)
+class RegexMatch(Predicate):
+    operand: ColRef
+    pattern: str
+
+    def to_narwhals(self) -> nw.Expr:
+        return self.operand.to_narwhals().str.contains(pattern=self.pattern)
+
+    def to_ibis(self, tbl: Any) -> Any:
+        return self.operand.to_ibis(tbl).re_search(self.pattern)
+
+
+@dataclass(frozen=True)
+class FillNull(Predicate):
+    operand: Predicate
+    value: bool = False
+
+    def to_narwhals(self) -> nw.Expr:
+        expr = self.operand.to_narwhals()
+        return nw.when(~expr.is_null()).then(expr).otherwise(nw.lit(self.value))
+
+    def to_ibis(self, tbl: Any) -> Any:
+        import ibis
+
+        return ibis.coalesce(self.operand.to_ibis(tbl), ibis.literal(self.value))
+
+
+@dataclass(frozen=True)
+class And(Predicate):
+    operands: tuple[Predicate, ...]
+
+    def to_narwhals(self) -> nw.Expr:
+        return reduce(lambda x, y: x & y, [op.to_narwhals() for op in self.operands])
+
+    def to_ibis(self, tbl: Any) -> Any:
+        return reduce(lambda x, y: x & y, [op.to_ibis(tbl) for op in self.operands])
+
+
+@dataclass(frozen=True)
+class Or(Predicate):
+    operands: tuple[Predicate, ...]
+
+    def to_narwhals(self) -> nw.Expr:
+        return reduce(lambda x, y: x | y, [op.to_narwhals() for op in self.operands])
+
+    def to_ibis(self, tbl: Any) -> Any:
+        return reduce(lambda x, y: x | y, [op.to_ibis(tbl) for op in self.operands])
+
+
+@dataclass(frozen=True)
+class Not(Predicate):
+    operand: Predicate
+
+    def to_narwhals(self) -> nw.Expr:
+        return ~self.operand.to_narwhals()
+
+    def to_ibis(self, tbl: Any) -> Any:
+        return ~self.operand.to_ibis(tbl)
+
+
+def _as_operand(value: Any) -> ColRef | Lit:
+    if isinstance(value, Column):
+        return ColRef(name=value.name)
+    return Lit(value=value)
+
+
+def _null_guarded(test: Predicate, operands: list[ColRef | Lit], na_pass: bool) -> Predicate:
+    """
+    Wrap a test so that rows with a missing value in any of the column operands get a definite
+    result: they pass if `na_pass=True` and fail otherwise. Any other missing result is a failure.
+    """
+
+    any_null = Or(operands=tuple(IsNull(operand=op) for op in operands if isinstance(op, ColRef)))
+    test = FillNull(operand=test, value=False)
+
+    if na_pass:
+        return any_null | test
+
+    return ~any_null & test
+
+
+def _build_predicate(
+    assertion_method: str,
+    column: str,
+    values: Any = None,
+    inclusive: tuple[bool, bool] | None = None,
+    na_pass: bool = False,
+    compare_by_difference: bool = False,
+) -> Predicate:
+    """
+    Build the predicate for a row-based validation step.
+
+    Parameters
+    ----------
+    assertion_method
+        The assertion method for the step (e.g., `"gt"`, `"between"`, `"in_set"`, `"regex"`).
+    column
+        The column to check.
+    values
+        The value(s) to check against. This is a single value (or `Column`) for comparisons, a
+        tuple of two values for `"between"` and `"outside"`, a list of values for the set-based
+        checks, and a pattern for `"regex"`.
+    inclusive
+        A tuple of booleans that state which bounds are inclusive.
+    na_pass
+        `True` to pass test units with missing values, `False` otherwise.
+    compare_by_difference
+        `True` to test column-to-column equality (and inequality) by comparing the difference of
+        the columns to zero. This is needed for Pandas DataFrames where object columns containing
+        `pd.NA` values cannot be compared directly.
+
+    Returns
+    -------
+    Predicate
+        A predicate that evaluates to `True` for passing test units.
+    """
+
+    col = ColRef(name=column)
+
+    if assertion_method in COMPARISON_OPS:
+        compare = _as_operand(values)
+
+        if (
+            compare_by_difference
+            and assertion_method in ["eq", "ne"]
+            and isinstance(compare, ColRef)
+        ):
+            test = Compare(
+                op=assertion_method, left=Difference(left=col, right=compare), right=Lit(value=0)
+            )
+        else:
+            test = Compare(op=assertion_method, left=col, right=compare)
+
+        return _null_guarded(test=test, operands=[col, compare], na_pass=na_pass)
+
+    if assertion_method in ["between", "outside"]:
+        low, high = (_as_operand(value) for value in values)
+
+        if assertion_method == "between":
+            test = Compare(op="ge" if inclusive[0] else "gt", left=col, right=low) & Compare(
+                op="le" if inclusive[1] else "lt", left=col, right=high
+            )
+        else:
+            test = Compare(op="lt" if inclusive[0] else "le", left=col, right=low) | Compare(
+                op="gt" if inclusive[1] else "ge", left=col, right=high
+            )
+
+        return _null_guarded(test=test, operands=[col, low, high], na_pass=na_pass)
+
+    if assertion_method == "in_set":
+        return IsIn(operand=col, values=tuple(values))
+
+    if assertion_method == "not_in_set":
+        return NotIn(operand=col, values=tuple(values))
+
+    if assertion_method == "regex":
+        return _null_guarded(
+            test=RegexMatch(operand=col, pattern=values), operands=[col], na_pass=na_pass
+        )
+
+    if assertion_method == "null":
+        return IsNull(operand=col)
+
+    if assertion_method == "not_null":
+        return ~IsNull(operand=col)
+
+    raise ValueError(f"A predicate cannot be built for the `{assertion_method}` assertion method.")
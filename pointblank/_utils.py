@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import inspect
+import os
 import re
 from typing import TYPE_CHECKING, Any
 
@@ -9,7 +10,11 @@ from great_tables import GT
 from great_tables.gt import _get_column_of_values
 from narwhals.typing import FrameT
 
-from pointblank._constants import ASSERTION_TYPE_METHOD_MAP, GENERAL_COLUMN_TYPES
+from pointblank._constants import (
+    ASSERTION_TYPE_METHOD_MAP,
+    GENERAL_COLUMN_TYPES,
+    TABLE_FILE_TYPES,
+)
 
 if TYPE_CHECKING:
     from pointblank._typing import AbsoluteBounds, Tolerance
@@ -33,7 +38,29 @@ def _derive_bounds(ref: int, tol: Tolerance) -> AbsoluteBounds:
     return bound, bound
 
 
+def _get_table_file_type(data: Any) -> str | None:
+    """
+    Get the table type of a Parquet or Arrow IPC file given as a path (based on its extension).
+
+    Returns
+    -------
+    str | None
+        Either `"parquet_file"` or `"arrow_file"`, or `None` if `data` isn't a path to such a file.
+    """
+
+    if not isinstance(data, (str, os.PathLike)):
+        return None
+
+    return TABLE_FILE_TYPES.get(os.path.splitext(os.fspath(data))[1].lower())
+
+
 def _get_tbl_type(data: FrameT | Any) -> str:
+    # Parquet and Arrow IPC files can be given as paths (and are only read through their metadata)
+    file_type = _get_table_file_type(data=data)
+
+    if file_type is not None:
+        return file_type
+
     type_str = str(type(data))
 
     ibis_tbl = "ibis.expr.types.relations.Table" in type_str
@@ -506,6 +533,7 @@ def _get_api_text() -> str:
         "Validate.get_step_report",
         "Validate.get_json_report",
         "Validate.get_sundered_data",
+        "Validate.get_failure_matrix",
         "Validate.get_data_extracts",
         "Validate.all_passed",
         "Validate.n",
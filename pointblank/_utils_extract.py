@@ -0,0 +1,352 @@
+from __future__ import annotations
+
+import atexit
+import math
+import os
+import random
+import re
+import shutil
+import tempfile
+import uuid
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+import narwhals as nw
+from narwhals.dependencies import get_pyarrow, is_polars_lazyframe
+
+from pointblank._utils import _is_lib_present
+
+# The number of rows of a DataFrame that are checked for failing rows at a time when an extract is
+# collected under a budget
+EXTRACT_CHUNK_SIZE = 100_000
+
+BYTE_UNITS = {
+    "b": 1,
+    "kb": 1_000,
+    "mb": 1_000_000,
+    "gb": 1_000_000_000,
+    "kib": 1_024,
+    "mib": 1_024**2,
+    "gib": 1_024**3,
+}
+
+
+def _parse_extract_limit(limit: int | str | None, param_name: str) -> tuple[int | None, int | None]:
+    """
+    Parse an extract limit given as a number of rows (an integer) or a size (e.g., `"250MB"`).
+
+    Returns
+    -------
+    tuple[int | None, int | None]
+        A tuple with the limit in rows and the limit in bytes (at most one of these isn't `None`).
+    """
+
+    if limit is None:
+        return None, None
+
+    if isinstance(limit, int) and not isinstance(limit, bool):
+        if limit < 0:
+            raise ValueError(f"The `{param_name}=` value must be a non-negative integer.")
+
+        return limit, None
+
+    if isinstance(limit, str):
+        match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([a-zA-Z]+)\s*", limit)
+
+        if match is not None and match.group(2).lower() in BYTE_UNITS:
+            return None, int(float(match.group(1)) * BYTE_UNITS[match.group(2).lower()])
+
+    raise ValueError(
+        f"The `{param_name}=` value must be either an integer number of rows or a string with a "
+        "size in bytes (e.g., `'500kB'`, `'250MB'`, or `'1GB'`)."
+    )
+
+
+@dataclass
+class _ExtractBudget:
+    """
+    The budget for the extracts that are held in memory after an interrogation.
+
+    The per-step limits apply to each extract and the total limits apply to all extracts of the
+    interrogation (in the order in which they are collected). An extract that would exceed the
+    budget is written to a Parquet file in `spill_dir=` instead. A directory given as `spill_dir=`
+    is owned by the caller, whereas a temporary directory created here is removed when the Python
+    process exits (the lazy scans of its files may outlive the validation).
+    """
+
+    max_rows: int | None = None
+    max_bytes: int | None = None
+    max_rows_total: int | None = None
+    max_bytes_total: int | None = None
+    spill_dir: str | None = None
+    used_rows: int = 0
+    used_bytes: int = 0
+
+    def get_step_limits(self) -> tuple[int | None, int | None]:
+        max_rows = _min_limit(
+            self.max_rows,
+            None if self.max_rows_total is None else max(self.max_rows_total - self.used_rows, 0),
+        )
+        max_bytes = _min_limit(
+            self.max_bytes,
+            None
+            if self.max_bytes_total is None
+            else max(self.max_bytes_total - self.used_bytes, 0),
+        )
+
+        return max_rows, max_bytes
+
+    def get_spill_path(self, step: int) -> str:
+        if self.spill_dir is None:
+            self.spill_dir = tempfile.mkdtemp(prefix="pointblank_extracts_")
+            atexit.register(shutil.rmtree, self.spill_dir, ignore_errors=True)
+
+        os.makedirs(self.spill_dir, exist_ok=True)
+
+        return os.path.join(self.spill_dir, f"extract_{step:04d}_{uuid.uuid4().hex[:8]}.parquet")
+
+
+def _min_limit(*limits: int | None) -> int | None:
+    limits = [limit for limit in limits if limit is not None]
+    return min(limits) if limits else None
+
+
+@dataclass
+class _ExtractReservoir:
+    """
+    A uniform random sample of a fixed size, drawn in a single pass over a stream of row numbers.
+
+    This uses reservoir sampling (Algorithm L), which jumps ahead in the stream to the next row to
+    be sampled so the work is proportional to the sample size rather than the number of rows. The
+    sample only depends on the `seed=` value and the order of the rows (not on how the stream is
+    split up) so the same seed always gives the same sample.
+    """
+
+    size: int
+    seed: int | None = None
+
+    def __post_init__(self):
+        self.row_nums = []
+        self.n_seen = 0
+        self._rng = random.Random(self.seed)
+        self._w = 1.0
+        self._next_index = self.size
+
+    def _skip(self) -> None:
+        # Using `1 - random()` avoids taking the log of zero
+        self._w *= math.exp(math.log(1 - self._rng.random()) / self.size)
+        self._next_index += math.floor(math.log(1 - self._rng.random()) / math.log1p(-self._w)) + 1
+
+    def update(self, row_nums: nw.Series) -> None:
+        """
+        Update the sample with the next row numbers in the stream.
+        """
+
+        start = self.n_seen
+        self.n_seen += len(row_nums)
+
+        if self.size == 0:
+            return
+
+        if len(self.row_nums) < self.size:
+            n_fill = min(self.size - len(self.row_nums), len(row_nums))
+            self.row_nums.extend(int(row_num) for row_num in row_nums[:n_fill].to_list())
+
+            if len(self.row_nums) == self.size:
+                self._next_index = self.size - 1
+                self._skip()
+
+        while self._next_index < self.n_seen:
+            self.row_nums[self._rng.randrange(self.size)] = int(row_nums[self._next_index - start])
+            self._skip()
+
+    def get_row_nums(self) -> list[int]:
+        return sorted(self.row_nums)
+
+
+def _iter_failing_row_nums(mask: nw.Series) -> Iterator[nw.Series]:
+    """
+    Iterate over the 1-indexed row numbers of failing rows, in chunks, given a step's results.
+    """
+
+    for offset in range(0, len(mask), EXTRACT_CHUNK_SIZE):
+        yield (
+            mask[offset : offset + EXTRACT_CHUNK_SIZE]
+            .to_frame()
+            .with_row_index(name="_row_num_")
+            .filter(nw.col(mask.name) == False)  # noqa: E712
+            .get_column("_row_num_")
+            + offset
+            + 1
+        )
+
+
+def _get_sample_size(
+    n_failing: int, sample_n: int | None, sample_frac: int | float | None, sample_limit: int
+) -> int:
+    if sample_n is not None:
+        return sample_n
+
+    return min(int(sample_frac * n_failing), sample_limit)
+
+
+def _iter_local_extract_batches(
+    tbl: Any, mask: nw.Series, get_first_n: int | None = None
+) -> Iterator[Any]:
+    """
+    Iterate over the failing rows of a DataFrame in chunks, as PyArrow tables.
+
+    Each chunk has the 1-indexed `_row_num_` column first. Only one chunk of failing rows is held
+    in memory at a time. The index of a Pandas DataFrame isn't carried into the chunks.
+    """
+
+    tbl_nw = nw.from_native(tbl)
+    n_rows = len(tbl_nw)
+    n_yielded = 0
+
+    for offset in range(0, max(n_rows, 1), EXTRACT_CHUNK_SIZE):
+        chunk = (
+            tbl_nw[offset : offset + EXTRACT_CHUNK_SIZE]
+            .with_columns(pb_is_good_=mask[offset : offset + EXTRACT_CHUNK_SIZE])
+            .with_row_index(name="_row_num_")
+            .filter(nw.col("pb_is_good_") == False)  # noqa: E712
+            .drop("pb_is_good_")
+            .with_columns(nw.col("_row_num_") + offset + 1)
+        )
+
+        if get_first_n is not None:
+            chunk = chunk.head(get_first_n - n_yielded)
+
+        n_yielded += len(chunk)
+
+        yield nw.maybe_reset_index(chunk).to_arrow()
+
+        if get_first_n is not None and n_yielded >= get_first_n:
+            return
+
+
+def _iter_ibis_extract_batches(query: Any) -> Iterator[Any]:
+    """
+    Iterate over the rows of an Ibis extract query as PyArrow tables (streamed from the backend).
+    """
+
+    import pyarrow as pa
+
+    reader = query.to_pyarrow_batches(chunk_size=EXTRACT_CHUNK_SIZE)
+
+    # Always provide at least one (possibly empty) table so that the schema is known
+    yield pa.Table.from_batches([], schema=reader.schema)
+
+    for batch in reader:
+        yield pa.Table.from_batches([batch])
+
+
+def _collect_extract_with_budget(
+    batches: Iterator[Any], budget: _ExtractBudget, step: int, df_lib_name: str
+) -> Any:
+    """
+    Collect an extract in memory if it fits within the budget, otherwise write it to Parquet.
+
+    Rows are held in memory until the budget for the step would be exceeded. At that point, the
+    rows held so far (and all remaining rows) are streamed to a Parquet file in the spill directory
+    and a lazy scan of that file is returned.
+
+    Returns
+    -------
+    Any
+        A Polars or Pandas DataFrame (per `df_lib_name=`) if the extract fits within the budget.
+        Otherwise, a lazy scan of the Parquet file: a Polars LazyFrame for Polars and a PyArrow
+        dataset for Pandas (which has no lazy frame).
+    """
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    max_rows, max_bytes = budget.get_step_limits()
+
+    held = []
+    held_rows = 0
+    held_bytes = 0
+    writer = None
+    spill_path = None
+
+    for batch in batches:
+        if writer is None:
+            exceeds_rows = max_rows is not None and held_rows + batch.num_rows > max_rows
+            exceeds_bytes = max_bytes is not None and held_bytes + batch.nbytes > max_bytes
+
+            if not (exceeds_rows or exceeds_bytes):
+                held.append(batch)
+                held_rows += batch.num_rows
+                held_bytes += batch.nbytes
+                continue
+
+            # Switch to writing the extract to a Parquet file, starting with the rows held so far
+            spill_path = budget.get_spill_path(step=step)
+            writer = pq.ParquetWriter(spill_path, schema=batch.schema)
+
+            for held_batch in held:
+                writer.write_table(held_batch.cast(batch.schema))
+
+            held = []
+
+        writer.write_table(batch.cast(writer.schema))
+
+    if writer is not None:
+        writer.close()
+        return _scan_spilled_extract(path=spill_path, df_lib_name=df_lib_name)
+
+    budget.used_rows += held_rows
+    budget.used_bytes += held_bytes
+
+    extract_arrow = pa.concat_tables(held, promote_options="permissive")
+
+    if df_lib_name == "polars":
+        import polars as pl
+
+        return pl.from_arrow(extract_arrow)
+
+    return extract_arrow.to_pandas()
+
+
+def _scan_spilled_extract(path: str, df_lib_name: str) -> Any:
+    if df_lib_name == "polars" and _is_lib_present(lib_name="polars"):
+        import polars as pl
+
+        return pl.scan_parquet(path)
+
+    import pyarrow.dataset as ds
+
+    return ds.dataset(path, format="parquet")
+
+
+def _is_spilled_extract(extract: Any) -> bool:
+    """
+    Determine whether an extract was written to a Parquet file (and is a lazy scan of that file).
+    """
+
+    if is_polars_lazyframe(extract):
+        return True
+
+    if get_pyarrow() is not None:
+        import pyarrow.dataset as ds
+
+        return isinstance(extract, ds.Dataset)
+
+    return False
+
+
+def _get_spilled_extract_preview(extract: Any, n: int) -> tuple[Any, int]:
+    """
+    Get the first `n` rows of a spilled extract (as a DataFrame) and the total number of rows.
+    """
+
+    if is_polars_lazyframe(extract):
+        import polars as pl
+
+        n_rows = extract.select(pl.len()).collect().item()
+
+        return extract.head(n).collect(), n_rows
+
+    return extract.head(n).to_pandas(), extract.count_rows()
@@ -54,3 +54,18 @@ def _create_table_dims_html(columns: int, rows: int, font_size: str = "10px") ->
         f"border: solid 1px #BDE7B4; padding: 2px 15px 2px 15px; font-size: {font_size};'>"
         f"{columns_fmt}</span>"
     )
+
+
+def _create_table_sample_html(rows: int, seed: int, font_size: str = "10px") -> str:
+    rows_fmt = _format_to_integer_value(int(rows))
+
+    return (
+        f"<span style='background-color: #FFE0A3; color: #333333; padding: 0.5em 0.5em; "
+        f"position: inherit; text-transform: uppercase; margin: 5px 0px 5px 3px; "
+        f"font-weight: bold; border: solid 1px #FFE0A3; padding: 2px 15px 2px 15px; "
+        f"font-size: {font_size};'>Sample</span>"
+        f"<span style='background-color: none; color: #333333; padding: 0.5em 0.5em; "
+        f"position: inherit; margin: 5px 0px 5px -4px; font-weight: bold; "
+        f"border: solid 1px #FFE0A3; padding: 2px 15px 2px 15px; font-size: {font_size};'>"
+        f"{rows_fmt} ROWS (SEED {seed})</span>"
+    )
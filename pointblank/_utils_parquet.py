@@ -0,0 +1,415 @@
+from __future__ import annotations
+
+import glob
+import os
+import re
+from typing import Any
+
+from pointblank._constants import PARQUET_PRUNABLE_METHODS
+from pointblank._utils import _is_lib_present
+
+
+def _get_parquet_paths(data: Any) -> list[str] | None:
+    """
+    Get the local file paths backing a Parquet table created with `ibis.read_parquet()`.
+
+    The DuckDB backend registers a temporary view for each `read_parquet()` call and the SQL for
+    that view contains the file paths (or glob patterns) that were supplied. Those paths are
+    recovered here and any glob patterns are expanded.
+
+    Parameters
+    ----------
+    data
+        An Ibis table that was obtained through `ibis.read_parquet()`.
+
+    Returns
+    -------
+    list[str] | None
+        A list of local file paths, or `None` if the paths could not be determined (e.g., for
+        remote files or if the table isn't backed by a `read_parquet()` view).
+    """
+
+    try:
+        import ibis
+
+        con = ibis.get_backend(data)
+        view_name = data.get_name()
+        view_sql = con.raw_sql(
+            f"SELECT sql FROM duckdb_views() WHERE view_name = '{view_name}'"
+        ).fetchone()
+    except Exception:
+        return None
+
+    if view_sql is None:
+        return None
+
+    read_parquet_match = re.search(r"read_parquet\((.*)\)", view_sql[0], re.DOTALL)
+
+    if read_parquet_match is None:
+        return None
+
+    # Get all quoted strings inside of the `list_value()` call (or the bare argument)
+    list_value_match = re.search(r"list_value\((.*?)\)", read_parquet_match.group(1), re.DOTALL)
+    path_args = list_value_match.group(1) if list_value_match else read_parquet_match.group(1)
+
+    raw_paths = [p.replace("''", "'") for p in re.findall(r"'((?:[^']|'')*)'", path_args)]
+
+    if len(raw_paths) == 0:
+        return None
+
+    paths = []
+
+    for raw_path in raw_paths:
+        # Remote files cannot be inspected without reading them through the backend
+        if "://" in raw_path:
+            return None
+
+        expanded = sorted(glob.glob(raw_path, recursive=True))
+
+        if len(expanded) == 0 or not all(os.path.isfile(p) for p in expanded):
+            return None
+
+        paths.extend(expanded)
+
+    return paths
+
+
+def _get_table_file_schema(path: str | os.PathLike, file_type: str) -> Any:
+    """
+    Get the PyArrow schema of a Parquet or Arrow IPC file from its metadata.
+
+    Only the footer of a Parquet file (or the schema message of an Arrow IPC file) is read.
+    """
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if file_type == "parquet_file":
+        return pq.read_schema(path)
+
+    with pa.memory_map(os.fspath(path)) as source:
+        return pa.ipc.open_file(source).schema
+
+
+def _get_table_file_row_count(path: str | os.PathLike, file_type: str) -> int:
+    """
+    Get the number of rows in a Parquet or Arrow IPC file from its metadata.
+
+    The row count of a Parquet file is stored in its footer. An Arrow IPC file is memory-mapped so
+    that only the metadata of its record batches is read (and none of their data buffers).
+    """
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if file_type == "parquet_file":
+        return pq.read_metadata(path).num_rows
+
+    with pa.memory_map(os.fspath(path)) as source:
+        reader = pa.ipc.open_file(source)
+
+        return sum(reader.get_batch(i).num_rows for i in range(reader.num_record_batches))
+
+
+def _get_parquet_row_count(data: Any) -> int | None:
+    """
+    Get the number of rows in a table created with `ibis.read_parquet()` from the file footers.
+
+    Returns
+    -------
+    int | None
+        The number of rows, or `None` if the file paths could not be determined (in which case the
+        rows should be counted through the backend).
+    """
+
+    if not _is_lib_present("pyarrow"):
+        return None
+
+    paths = _get_parquet_paths(data=data)
+
+    if paths is None:
+        return None
+
+    import pyarrow.parquet as pq
+
+    try:
+        return sum(pq.read_metadata(path).num_rows for path in paths)
+    except Exception:
+        return None
+
+
+def _is_prunable_value(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _decide_range(
+    assertion_method: str,
+    min_val: int | float,
+    max_val: int | float,
+    values: Any,
+    inclusive: tuple[bool, bool] | None,
+) -> bool | None:
+    """
+    Decide whether all non-null values within `[min_val, max_val]` pass or fail a range check.
+
+    Returns
+    -------
+    bool | None
+        `True` if all values must pass, `False` if all values must fail, and `None` if the range
+        straddles the bound(s) and the values need to be scanned.
+    """
+
+    if assertion_method == "gt":
+        if min_val > values:
+            return True
+        if max_val <= values:
+            return False
+
+    elif assertion_method == "ge":
+        if min_val >= values:
+            return True
+        if max_val < values:
+            return False
+
+    elif assertion_method == "lt":
+        if max_val < values:
+            return True
+        if min_val >= values:
+            return False
+
+    elif assertion_method == "le":
+        if max_val <= values:
+            return True
+        if min_val > values:
+            return False
+
+    elif assertion_method == "between":
+        low, high = values
+
+        def above_low(x):
+            return x >= low if inclusive[0] else x > low
+
+        def below_high(x):
+            return x <= high if inclusive[1] else x < high
+
+        if above_low(min_val) and below_high(max_val):
+            return True
+        if not above_low(max_val) or not below_high(min_val):
+            return False
+
+    elif assertion_method == "outside":
+        low, high = values
+
+        def below_low(x):
+            return x < low if inclusive[0] else x <= low
+
+        def above_high(x):
+            return x > high if inclusive[1] else x >= high
+
+        if below_low(max_val) or above_high(min_val):
+            return True
+        if not below_low(min_val) and not above_high(max_val):
+            return False
+
+    return None
+
+
+def _count_passing_in_array(
+    arr: Any,
+    assertion_method: str,
+    values: Any,
+    inclusive: tuple[bool, bool] | None,
+    na_pass: bool,
+) -> int:
+    """
+    Count the passing test units in a PyArrow array with the same semantics as the interrogation.
+    """
+
+    import pyarrow.compute as pc
+
+    if assertion_method == "null":
+        res = pc.is_null(arr)
+    elif assertion_method == "not_null":
+        res = pc.is_valid(arr)
+    else:
+        if assertion_method == "gt":
+            res = pc.greater(arr, values)
+        elif assertion_method == "ge":
+            res = pc.greater_equal(arr, values)
+        elif assertion_method == "lt":
+            res = pc.less(arr, values)
+        elif assertion_method == "le":
+            res = pc.less_equal(arr, values)
+        elif assertion_method == "between":
+            low, high = values
+            res = pc.and_(
+                pc.greater_equal(arr, low) if inclusive[0] else pc.greater(arr, low),
+                pc.less_equal(arr, high) if inclusive[1] else pc.less(arr, high),
+            )
+        else:
+            low, high = values
+            res = pc.or_(
+                pc.less(arr, low) if inclusive[0] else pc.less_equal(arr, low),
+                pc.greater(arr, high) if inclusive[1] else pc.greater_equal(arr, high),
+            )
+
+        res = pc.fill_null(res, na_pass)
+
+    return int(pc.sum(res).as_py() or 0)
+
+
+def _get_parquet_step_counts(
+    data: Any,
+    assertion_method: str,
+    column: str,
+    values: Any,
+    inclusive: tuple[bool, bool] | None,
+    na_pass: bool,
+) -> tuple[int, int, int] | None:
+    """
+    Get test unit counts for a row-based step using Parquet row-group statistics.
+
+    Each row group's footer statistics (min, max, and null count) are used to decide whether all
+    of its test units pass or fail. Only the row groups whose statistics straddle the bound(s) of
+    the check are read, and only for the column being checked.
+
+    Parameters
+    ----------
+    data
+        An Ibis table that was obtained through `ibis.read_parquet()`.
+    assertion_method
+        The assertion method for the validation step (e.g., `"gt"`, `"between"`, `"null"`).
+    column
+        The column to check.
+    values
+        The value (or pair of values for `"between"` and `"outside"`) to compare against.
+    inclusive
+        A tuple of booleans that state which bounds are inclusive.
+    na_pass
+        `True` to pass test units with missing values, `False` otherwise.
+
+    Returns
+    -------
+    tuple[int, int, int] | None
+        A tuple with the number of test units, passing test units, and failing test units. If the
+        step cannot be evaluated with row-group statistics then `None` is returned and the step
+        should be interrogated in the usual way.
+    """
+
+    if assertion_method not in PARQUET_PRUNABLE_METHODS or not _is_lib_present("pyarrow"):
+        return None
+
+    is_range_check = assertion_method not in ["null", "not_null"]
+
+    # Range checks are only decidable for numeric literal values
+    if is_range_check:
+        check_values = values if assertion_method in ["between", "outside"] else [values]
+
+        if not all(_is_prunable_value(v) for v in check_values):
+            return None
+
+    paths = _get_parquet_paths(data=data)
+
+    if paths is None:
+        return None
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    n = 0
+    n_passed = 0
+
+    for path in paths:
+        try:
+            pf = pq.ParquetFile(path)
+        except Exception:
+            return None
+
+        arrow_schema = pf.schema_arrow
+
+        if column not in arrow_schema.names:
+            return None
+
+        # Only integer columns have min/max statistics that fully describe the values (floating
+        # point statistics leave out NaN values, which have their own comparison semantics)
+        if is_range_check and not pa.types.is_integer(arrow_schema.field(column).type):
+            return None
+
+        metadata = pf.metadata
+
+        if metadata.num_row_groups == 0:
+            continue
+
+        # Get the position of the column within each row group
+        column_paths = [
+            metadata.row_group(0).column(j).path_in_schema for j in range(metadata.num_columns)
+        ]
+
+        if column not in column_paths:
+            return None
+
+        col_idx = column_paths.index(column)
+
+        row_groups_to_scan = []
+
+        for rg_i in range(metadata.num_row_groups):
+            row_group = metadata.row_group(rg_i)
+            num_rows = row_group.num_rows
+            stats = row_group.column(col_idx).statistics
+
+            n += num_rows
+
+            if stats is None or not stats.has_null_count:
+                row_groups_to_scan.append(rg_i)
+                continue
+
+            null_count = stats.null_count
+            non_null_count = num_rows - null_count
+
+            if assertion_method == "null":
+                n_passed += null_count
+                continue
+
+            if assertion_method == "not_null":
+                n_passed += non_null_count
+                continue
+
+            # Missing values pass or fail depending on the `na_pass=` setting
+            null_passed = null_count if na_pass else 0
+
+            if non_null_count == 0:
+                n_passed += null_passed
+                continue
+
+            if not stats.has_min_max:
+                row_groups_to_scan.append(rg_i)
+                continue
+
+            decision = _decide_range(
+                assertion_method=assertion_method,
+                min_val=stats.min,
+                max_val=stats.max,
+                values=values,
+                inclusive=inclusive,
+            )
+
+            if decision is None:
+                row_groups_to_scan.append(rg_i)
+            elif decision:
+                n_passed += non_null_count + null_passed
+            else:
+                n_passed += null_passed
+
+        # Read only the straddling row groups, and only the column being checked
+        if row_groups_to_scan:
+            arr = pf.read_row_groups(row_groups_to_scan, columns=[column]).column(column)
+
+            n_passed += _count_passing_in_array(
+                arr=arr,
+                assertion_method=assertion_method,
+                values=values,
+                inclusive=inclusive,
+                na_pass=na_pass,
+            )
+
+    return n, n_passed, n - n_passed
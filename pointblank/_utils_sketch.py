@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+import hashlib
+import math
+import random
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import narwhals as nw
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# The number of rows in each batch of a table that is streamed through the sketches
+SKETCH_BATCH_SIZE = 100_000
+
+# The HyperLogLog precision (the sketch has 2^p registers)
+HLL_PRECISION = 14
+
+# The capacity of each compactor in the quantile sketch
+QUANTILE_SKETCH_K = 256
+
+# The z-score used for the (two-sided, 99%) error bounds of the quantile sketch
+Z_99 = 2.576
+
+
+def _mix64(hashes: np.ndarray) -> np.ndarray:
+    """
+    Scramble an array of unsigned 64-bit integers with the SplitMix64 finalizer.
+    """
+
+    import numpy as np
+
+    # Overflow in unsigned integer arithmetic wraps around, as intended here
+    with np.errstate(over="ignore"):
+        hashes = hashes + np.uint64(0x9E3779B97F4A7C15)
+        hashes = (hashes ^ (hashes >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        hashes = (hashes ^ (hashes >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+
+    return hashes ^ (hashes >> np.uint64(31))
+
+
+def _hash_series(values: nw.Series) -> np.ndarray:
+    """
+    Get 64-bit hashes (as a NumPy array) for the non-missing values of a Series.
+
+    Numbers and booleans are hashed in a vectorized way from their bit patterns, so the hashes
+    don't depend on the DataFrame library. Other values (e.g., strings or dates) are hashed with
+    the vectorized hashing of the library: `Series.hash()` in Polars and `hash_array()` in Pandas.
+    Sketches are therefore only comparable when they're made from the same DataFrame library.
+    """
+
+    import numpy as np
+
+    values = values.drop_nulls()
+    dtype = values.dtype
+
+    if dtype == nw.Boolean:
+        bits = values.to_numpy().astype(np.uint64)
+    elif dtype.is_float():
+        # Cast to 64-bit floats so that `1.0` is hashed the same way in any float column
+        bits = values.cast(nw.Float64).to_numpy().astype(np.float64, copy=False).view(np.uint64)
+    elif dtype == nw.UInt64:
+        bits = values.to_numpy().astype(np.uint64)
+    elif dtype.is_integer():
+        bits = values.cast(nw.Int64).to_numpy().astype(np.int64, copy=False).view(np.uint64)
+    elif values.implementation.is_polars():
+        bits = values.to_native().hash(seed=0).to_numpy()
+    elif values.implementation.is_pandas():
+        import pandas as pd
+
+        bits = pd.util.hash_array(values.to_numpy())
+    else:
+        bits = np.asarray(_hash_array(values.to_arrow()), dtype=np.uint64)
+
+    return _mix64(bits)
+
+
+def _hash_array(values: Any) -> Any:
+    """
+    Get 64-bit hashes for the non-missing values of a PyArrow array (one unique value at a time).
+
+    This is the fallback for Series that aren't from Polars or Pandas.
+    """
+
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if isinstance(values, pa.ChunkedArray):
+        values = values.combine_chunks()
+
+    unique_values = pc.unique(values.drop_null()).to_pylist()
+
+    return pa.array(
+        [
+            int.from_bytes(
+                hashlib.blake2b(repr(value).encode("utf-8"), digest_size=8).digest(), "little"
+            )
+            for value in unique_values
+        ],
+        type=pa.uint64(),
+    )
+
+
+def _count_leading_zeros(values: np.ndarray) -> np.ndarray:
+    """
+    Count the leading zero bits of each unsigned 64-bit integer.
+
+    The bit length of each value is the binary exponent of the value as a float. Rounding to a
+    float can carry a value up to the next power of two, so those bit lengths are corrected.
+    """
+
+    import numpy as np
+
+    _, bit_length = np.frexp(values.astype(np.float64))
+    bit_length = bit_length.astype(np.int64)
+
+    is_rounded_up = (bit_length > 0) & (
+        (values >> np.maximum(bit_length - 1, 0).astype(np.uint64)) == 0
+    )
+    bit_length -= is_rounded_up
+
+    # A zero value has a bit length of zero (and so 64 leading zeros)
+    return (64 - bit_length).astype(np.uint8)
+
+
+@dataclass
+class _HyperLogLog:
+    """
+    A HyperLogLog sketch for estimating the number of distinct values.
+
+    The sketch has a fixed size (2^p one-byte registers) regardless of the number of values.
+    Sketches with the same precision are merged by taking the maximum of each register, and the
+    relative standard error of the estimate is `1.04 / sqrt(2^p)`.
+    """
+
+    p: int = HLL_PRECISION
+    registers: bytearray = field(default_factory=bytearray)
+
+    def __post_init__(self):
+        if not self.registers:
+            self.registers = bytearray(1 << self.p)
+
+    def update(self, values: nw.Series) -> None:
+        """
+        Update the sketch with a Series of values (missing values are ignored).
+        """
+
+        import numpy as np
+
+        hashes = _hash_series(values)
+
+        if len(hashes) == 0:
+            return
+
+        # The first `p` bits of a hash select the register and the position of the leftmost 1-bit
+        # in the remaining bits gives the value that's compared to the register
+        register_idx = (hashes >> np.uint64(64 - self.p)).astype(np.intp)
+        rank = np.minimum(
+            _count_leading_zeros(hashes << np.uint64(self.p)) + 1, 64 - self.p + 1
+        ).astype(np.uint8)
+
+        # The registers are updated in place through a NumPy view of the `bytearray`
+        np.maximum.at(np.frombuffer(self.registers, dtype=np.uint8), register_idx, rank)
+
+    def merge(self, other: _HyperLogLog) -> _HyperLogLog:
+        if self.p != other.p:
+            raise ValueError("HyperLogLog sketches with different precisions cannot be merged.")
+
+        import numpy as np
+
+        return _HyperLogLog(
+            p=self.p,
+            registers=bytearray(
+                np.maximum(
+                    np.frombuffer(self.registers, dtype=np.uint8),
+                    np.frombuffer(other.registers, dtype=np.uint8),
+                ).tobytes()
+            ),
+        )
+
+    def estimate(self) -> int:
+        import numpy as np
+
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+
+        registers = np.frombuffer(self.registers, dtype=np.uint8)
+        estimate = alpha * m * m / float(np.sum(np.ldexp(1.0, -registers.astype(np.int32))))
+
+        # Use linear counting for small cardinalities
+        n_zero_registers = self.registers.count(0)
+
+        if estimate <= 2.5 * m and n_zero_registers > 0:
+            estimate = m * math.log(m / n_zero_registers)
+
+        return round(estimate)
+
+    def rel_std_error(self) -> float:
+        return 1.04 / math.sqrt(len(self.registers))
+
+
+@dataclass
+class _QuantileSketch:
+    """
+    A KLL-style sketch for estimating quantiles in a single pass.
+
+    Values are kept in a hierarchy of compactors, where an item at level `h` stands for `2^h`
+    values. When a compactor is full, it's sorted and every other item (starting at a random
+    offset) is promoted to the next level. Each record batch is sorted and thinned the same way
+    (to at most `k` items) before it enters the sketch. The sketch tracks the variance of the rank
+    error introduced by these steps, which gives the error bound.
+    """
+
+    k: int = QUANTILE_SKETCH_K
+    seed: int = 0
+    compactors: list[list[float]] = field(default_factory=list)
+    n: int = 0
+    rank_error_variance: float = 0.0
+
+    def __post_init__(self):
+        self._rng = random.Random(self.seed)
+
+    def _add(self, level: int, items: list[float]) -> None:
+        while len(self.compactors) <= level:
+            self.compactors.append([])
+
+        self.compactors[level].extend(items)
+
+    def _compress(self) -> None:
+        level = 0
+
+        while level < len(self.compactors):
+            compactor = self.compactors[level]
+
+            if len(compactor) >= self.k:
+                compactor.sort()
+
+                # An odd item out stays at this level
+                keep = [compactor.pop()] if len(compactor) % 2 == 1 else []
+                offset = self._rng.randrange(2)
+
+                self._add(level + 1, compactor[offset::2])
+                self.compactors[level] = keep
+                self.rank_error_variance += float(4**level)
+
+            level += 1
+
+    def update(self, values: nw.Series) -> None:
+        """
+        Update the sketch with a Series of values (missing values are ignored).
+        """
+
+        import numpy as np
+
+        values = values.drop_nulls().cast(nw.Float64).to_numpy().astype(np.float64, copy=False)
+        values = values[~np.isnan(values)]
+        n_values = len(values)
+
+        if n_values == 0:
+            return
+
+        self.n += n_values
+
+        # Thin the sorted batch to at most `k` items, each standing for `2^level` values
+        level = max(0, math.ceil(math.log2(n_values / self.k)))
+        stride = 2**level
+
+        sorted_values = np.sort(values)
+
+        if stride > 1:
+            offset = self._rng.randrange(stride)
+            sorted_values = sorted_values[offset::stride]
+            self.rank_error_variance += float(stride**2)
+
+        self._add(level, sorted_values.tolist())
+        self._compress()
+
+    def merge(self, other: _QuantileSketch) -> _QuantileSketch:
+        merged = _QuantileSketch(
+            k=self.k,
+            seed=self.seed,
+            compactors=[list(compactor) for compactor in self.compactors],
+            n=self.n + other.n,
+            rank_error_variance=self.rank_error_variance + other.rank_error_variance,
+        )
+
+        for level, compactor in enumerate(other.compactors):
+            merged._add(level, compactor)
+
+        merged._compress()
+
+        return merged
+
+    def quantile(self, q: float) -> float | None:
+        weighted_items = sorted(
+            (item, 2**level)
+            for level, compactor in enumerate(self.compactors)
+            for item in compactor
+        )
+
+        if not weighted_items:
+            return None
+
+        total_weight = sum(weight for _, weight in weighted_items)
+        cumulative_weight = 0
+
+        for item, weight in weighted_items:
+            cumulative_weight += weight
+
+            if cumulative_weight >= q * total_weight:
+                return item
+
+        return weighted_items[-1][0]
+
+    def rank_error(self) -> float:
+        """
+        Get a bound on the normalized rank error of the quantiles (at 99% confidence).
+        """
+
+        if self.n == 0:
+            return 0.0
+
+        return Z_99 * math.sqrt(self.rank_error_variance) / self.n
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 import re
+import threading
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass
+from typing import Any
 
 import narwhals as nw
 from narwhals.typing import IntoDataFrame
@@ -17,6 +21,14 @@ __all__ = [
     "last_n",
 ]
 
+# The number of column resolutions kept in the cache that's used when evaluating column expressions
+COLUMN_RESOLUTION_CACHE_SIZE = 256
+
+# The cache maps a key for a column expression and a table schema to the resolved columns (along
+# with a weak reference to the expression, when the key relies on the expression's identity)
+_COLUMN_RESOLUTION_CACHE: OrderedDict = OrderedDict()
+_COLUMN_RESOLUTION_CACHE_LOCK = threading.Lock()
+
 
 @dataclass
 class ColumnSelector:
@@ -211,13 +223,81 @@ class ColumnSelectorNarwhals(Column):
     exprs: nw.selectors.Selector
 
     def resolve(self, table) -> list[str]:
-        # Convert the native table to a Narwhals DataFrame
+        # Convert the native table to a Narwhals DataFrame or LazyFrame
         dfn = nw.from_native(table)
+
+        # Only the schema is needed, so a DataFrame is reduced to zero rows (a LazyFrame isn't
+        # computed when getting its schema)
+        if isinstance(dfn, nw.DataFrame):
+            dfn = dfn.head(0)
+
         # Use the selector to select columns and return their names
-        columns = dfn.select(self.exprs.exprs).columns
+        columns = dfn.select(self.exprs.exprs).collect_schema().names()
         return columns
 
 
+def _get_schema_fingerprint(table: Any) -> tuple:
+    """
+    Get a hashable fingerprint of a table's schema (its column names and dtypes).
+    """
+
+    try:
+        schema = nw.from_native(table).collect_schema()
+    except Exception:  # pragma: no cover
+        return tuple(table.columns)
+
+    return tuple((name, str(dtype)) for name, dtype in schema.items())
+
+
+def _resolve_column_expr(column_expr: Column, table: Any) -> list[str]:
+    """
+    Resolve a column expression to a list of column names using only the schema of a table.
+
+    The resolved columns are cached for each combination of column expression and table schema.
+    Column selectors (e.g., `starts_with("a")`) are identified by their `repr()`, which describes
+    them fully, whereas Narwhals selectors are identified by the expression object itself.
+    """
+
+    if isinstance(column_expr, ColumnSelectorNarwhals):
+        selector = column_expr.exprs
+        expr_key = (type(column_expr).__name__, id(selector))
+    else:
+        selector = None
+        expr_key = (type(column_expr).__name__, repr(column_expr))
+
+    cache_key = (expr_key, _get_schema_fingerprint(table=table))
+
+    with _COLUMN_RESOLUTION_CACHE_LOCK:
+        entry = _COLUMN_RESOLUTION_CACHE.get(cache_key)
+
+        if entry is not None:
+            selector_ref, columns = entry
+
+            # The `id()` of an expression can be reused once it's garbage collected
+            if selector_ref is None or selector_ref() is selector:
+                _COLUMN_RESOLUTION_CACHE.move_to_end(cache_key)
+                return list(columns)
+
+            del _COLUMN_RESOLUTION_CACHE[cache_key]
+
+    if isinstance(column_expr, ColumnSelectorNarwhals):
+        columns = ColumnSelectorNarwhals(column_expr).resolve(table=table)
+    else:
+        columns = column_expr.resolve(columns=list(table.columns), table=table)
+
+    with _COLUMN_RESOLUTION_CACHE_LOCK:
+        _COLUMN_RESOLUTION_CACHE[cache_key] = (
+            None if selector is None else weakref.ref(selector),
+            list(columns),
+        )
+        _COLUMN_RESOLUTION_CACHE.move_to_end(cache_key)
+
+        while len(_COLUMN_RESOLUTION_CACHE) > COLUMN_RESOLUTION_CACHE_SIZE:
+            _COLUMN_RESOLUTION_CACHE.popitem(last=False)
+
+    return columns
+
+
 def col(
     exprs: str | ColumnSelector | ColumnSelectorNarwhals,
 ) -> Column | ColumnLiteral | ColumnSelectorNarwhals:
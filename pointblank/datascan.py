@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import copy
 import json
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import reduce
 from importlib.metadata import version
-from math import floor, log10
+from math import floor, log10, sqrt
 from typing import Any
 
 import narwhals as nw
@@ -12,11 +19,24 @@ from great_tables.vals import fmt_integer, fmt_number, fmt_scientific
 from narwhals.typing import FrameT
 
 from pointblank._constants import SVG_ICONS_FOR_DATA_TYPES
-from pointblank._utils import _get_tbl_type, _select_df_lib
-from pointblank._utils_html import _create_table_dims_html, _create_table_type_html
+from pointblank._utils import _get_tbl_type, _is_lib_present, _select_df_lib
+from pointblank._utils_html import (
+    _create_table_dims_html,
+    _create_table_sample_html,
+    _create_table_type_html,
+)
+from pointblank._utils_sketch import SKETCH_BATCH_SIZE, _HyperLogLog, _QuantileSketch
 
 __all__ = ["DataScan", "col_summary_tbl"]
 
+# The number of profiles kept in the cache that's shared by `DataScan` and `col_summary_tbl()`
+PROFILE_CACHE_SIZE = 16
+
+# The profile cache maps a key for a table (and the scan options) to a reference to the table,
+# the profile, the column statistics, and the number of rows in the table (if sampled)
+_PROFILE_CACHE: OrderedDict = OrderedDict()
+_PROFILE_CACHE_LOCK = threading.Lock()
+
 
 @dataclass
 class DataScan:
@@ -52,6 +72,34 @@ class DataScan:
         The data to scan and summarize.
     tbl_name
         Optionally, the name of the table could be provided as `tbl_name`.
+    approx
+        Should approximate statistics be used for the number of unique values and the quantiles
+        (including the median and the IQR)? These are the slowest statistics to compute exactly for
+        large tables. By default, this is `False` and all statistics are exact. See the
+        *Approximate Statistics* section for more information.
+    n_jobs
+        The number of threads to use for profiling a DataFrame. The columns are split into
+        `n_jobs` partitions and the statistics of each partition (one `select()` of aggregates
+        and, with `approx=True`, the sketches) are computed in a separate thread of the calling
+        process. The column profiles are then merged in the original column order. The default of
+        `1` profiles all columns in the calling thread and `-1` uses as many threads as there are
+        CPUs. Only work that releases the GIL runs in parallel: this is most of the work for
+        Polars (which also parallelizes each query on its own) and the NumPy reductions for
+        numerical Pandas columns, but not the string operations of Pandas. This has no effect for
+        Ibis tables, where the profile is computed by the backend.
+    sample_n
+        Profile a random sample of `sample_n` rows instead of the entire table. Can't be used
+        along with `sample_frac=`. See the *Sampling and Caching* section for more information.
+    sample_frac
+        Profile a random sample with this fraction of the table's rows (a value between `0` and
+        `1`) instead of the entire table. Can't be used along with `sample_n=`.
+    seed
+        The seed for drawing the sample with `sample_n=` or `sample_frac=`. The same seed always
+        gives the same sample of a table.
+    cache
+        Should the profile be reused from (and stored in) the profile cache? By default, this is
+        `False` and the table is always scanned. See the *Sampling and Caching* section for more
+        information.
 
     Measures of Missingness and Distinctness
     ----------------------------------------
@@ -107,6 +155,42 @@ class DataScan:
     - `min`: the minimum date/datetime in the column
     - `max`: the maximum date/datetime in the column
 
+    Approximate Statistics
+    ----------------------
+    With `approx=True`, the number of unique values and the quantiles are estimated with sketches,
+    which have a small and fixed size no matter the number of rows. All other measures are exact.
+
+    For DataFrames, the table is streamed in batches of rows through a HyperLogLog sketch (for the
+    number of unique values) and a KLL-style quantile sketch (for the quantiles) of each column.
+    This requires the NumPy library. The values are hashed with the vectorized hashing of the
+    DataFrame library, so only scans of DataFrames from the same library should be merged. For
+    Ibis tables, the approximate aggregations of the backend
+    are used within the single query for the profile (e.g., `approx_count_distinct()` and
+    `approx_quantile()` in DuckDB).
+
+    Each column in the profile then has an `approx` entry with the method and the error bound of
+    each estimate. For `n_unique_values`, `rel_std_error` is the relative standard error of the
+    count. For `quantiles`, `rank_error` is a bound (at 99% confidence) on the difference between
+    the requested quantile and the fraction of values that are smaller than the estimate. These
+    error bounds are `None` when backend aggregations are used.
+
+    Sampling and Caching
+    --------------------
+    With `sample_n=` or `sample_frac=`, a sample of the table's rows is profiled instead of the
+    entire table. The sample is drawn with the `seed=` value, so it's the same every time the same
+    table is scanned. The `dimensions` of the profile are those of the sample and the profile gets
+    a `sample` entry with the number of rows in the table and the seed (the sample is also noted in
+    the header of the tabular report). For Ibis tables, the sample is drawn by the backend with
+    `Table.sample()`, so `sample_n=` gives a sample of about that many rows.
+
+    With `cache=True`, profiles are kept in a small least-recently-used cache that's shared by
+    `DataScan` and [`col_summary_tbl()`](`pointblank.col_summary_tbl`), so scanning the same table
+    with the same options again (e.g., to render the summary once more) reuses the stored profile
+    rather than scanning the data. A table is identified by the table object itself (along with its
+    column types and, for DataFrames, its dimensions), not by its contents. Modifying a DataFrame
+    in place, or the data behind an Ibis table, isn't detected and gives the stale profile, so
+    only use the cache for tables that don't change.
+
     Returns
     -------
     DataScan
@@ -115,10 +199,18 @@ class DataScan:
 
     data: FrameT | Any
     tbl_name: str | None = None
+    approx: bool = False
+    n_jobs: int = 1
+    sample_n: int | None = None
+    sample_frac: int | float | None = None
+    seed: int = 0
+    cache: bool = False
     data_alt: Any | None = field(init=False)
     tbl_category: str = field(init=False)
     tbl_type: str = field(init=False)
     profile: dict = field(init=False)
+    _column_stats: list[dict] | None = field(init=False, default=None, repr=False)
+    _tbl_rows: int | None = field(init=False, default=None, repr=False)
 
     def __post_init__(self):
         # Determine if the data is a DataFrame that could be handled by Narwhals,
@@ -140,6 +232,23 @@ class DataScan:
         else:
             self.data_alt = None
 
+        _check_sample_params(sample_n=self.sample_n, sample_frac=self.sample_frac)
+
+        # Reuse a stored profile of the same table (scanned with the same options)
+        cache_key = self._get_profile_cache_key() if self.cache else None
+
+        if cache_key is not None and self._load_cached_profile(cache_key=cache_key):
+            return
+
+        # Draw the sample of a DataFrame that's profiled instead of the entire table
+        if self.data_alt is not None and self._is_sampled():
+            self._tbl_rows = len(self.data_alt)
+            self.data_alt = self.data_alt.sample(
+                n=None if self.sample_n is None else min(self.sample_n, self._tbl_rows),
+                fraction=self.sample_frac,
+                seed=self.seed,
+            )
+
         # Generate the profile based on the `tbl_category` value
         if self.tbl_category == "dataframe":
             self.profile = self._generate_profile_df()
@@ -147,6 +256,67 @@ class DataScan:
         if self.tbl_category == "ibis":
             self.profile = self._generate_profile_ibis()
 
+        if cache_key is not None:
+            self._store_cached_profile(cache_key=cache_key)
+
+    def _is_sampled(self) -> bool:
+        return self.sample_n is not None or self.sample_frac is not None
+
+    def _get_profile_cache_key(self) -> tuple | None:
+        if self.tbl_category == "ibis":
+            tbl_key = (
+                id(self.data),
+                tuple((column, str(dtype)) for column, dtype in self.data.schema().items()),
+            )
+        elif self.data_alt is not None:
+            tbl_key = (
+                id(self.data),
+                self.data_alt.shape,
+                tuple((column, str(dtype)) for column, dtype in self.data_alt.schema.items()),
+            )
+        else:
+            return None
+
+        sample_key = (self.sample_n, self.sample_frac, self.seed) if self._is_sampled() else None
+
+        return (self.tbl_type, tbl_key, self.tbl_name, self.approx, sample_key)
+
+    def _load_cached_profile(self, cache_key: tuple) -> bool:
+        with _PROFILE_CACHE_LOCK:
+            entry = _PROFILE_CACHE.get(cache_key)
+
+            if entry is None:
+                return False
+
+            tbl_ref, profile, column_stats, tbl_rows = entry
+
+            # The `id()` of a table can be reused once it's garbage collected
+            if tbl_ref() is not self.data:
+                del _PROFILE_CACHE[cache_key]
+                return False
+
+            _PROFILE_CACHE.move_to_end(cache_key)
+
+        self.profile = copy.deepcopy(profile)
+        self._column_stats = column_stats
+        self._tbl_rows = tbl_rows
+
+        return True
+
+    def _store_cached_profile(self, cache_key: tuple) -> None:
+        with _PROFILE_CACHE_LOCK:
+            # Tables are referenced weakly so that the cache doesn't keep them alive
+            _PROFILE_CACHE[cache_key] = (
+                weakref.ref(self.data),
+                copy.deepcopy(self.profile),
+                self._column_stats,
+                self._tbl_rows,
+            )
+            _PROFILE_CACHE.move_to_end(cache_key)
+
+            while len(_PROFILE_CACHE) > PROFILE_CACHE_SIZE:
+                _PROFILE_CACHE.popitem(last=False)
+
     def _generate_profile_df(self) -> dict:
         profile = {}
 
@@ -160,13 +330,56 @@ class DataScan:
             {
                 "tbl_type": self.tbl_type,
                 "dimensions": {"rows": row_count, "columns": column_count},
-                "columns": [],
             }
         )
 
+        if self._is_sampled():
+            profile["sample"] = {"tbl_rows": self._tbl_rows, "seed": self.seed}
+
+        profile["columns"] = []
+
+        column_kinds = [
+            _get_column_kind(dtype_str=str(dtype)) for dtype in self.data_alt.schema.values()
+        ]
+
+        # Compute the statistics for partitions of the columns, in parallel if `n_jobs` is greater
+        # than 1; the partitions are views of the same table so no data is copied
+        n_jobs = _resolve_n_jobs(n_jobs=self.n_jobs)
+        column_partitions = _partition_columns(n_columns=column_count, n_partitions=n_jobs)
+
+        column_stats = [{} for _ in self.data_alt.columns]
+
+        if n_jobs == 1 or len(column_partitions) == 1:
+            partition_stats = [
+                self._get_column_stats_df(column_idxs=column_idxs, column_kinds=column_kinds)
+                for column_idxs in column_partitions
+            ]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=n_jobs, thread_name_prefix="pointblank_datascan"
+            ) as executor:
+                partition_stats = list(
+                    executor.map(
+                        lambda column_idxs: self._get_column_stats_df(
+                            column_idxs=column_idxs, column_kinds=column_kinds
+                        ),
+                        column_partitions,
+                    )
+                )
+
+        # Merge the statistics of the partitions in the original column order
+        for stats in partition_stats:
+            for idx, col_stats in stats.items():
+                column_stats[idx] = col_stats
+
+        self._column_stats = column_stats
+
         for idx, column in enumerate(self.data_alt.columns):
             col_data = self.data_alt[column]
             native_dtype = str(self.data[column].dtype)
+            column_kind = column_kinds[idx]
+
+            col_stats = column_stats[idx]
 
             #
             # Collection of sample data
@@ -177,175 +390,236 @@ class DataScan:
             else:
                 sample_data = col_data.drop_nulls().head(5).to_list()
 
-            n_missing_vals = int(col_data.is_null().sum())
-            n_unique_vals = int(col_data.n_unique())
+            # Keep the column kind and the sample data with the statistics so that scans can be
+            # merged
+            col_stats.update({"column_kind": column_kind, "sample_data": sample_data})
+
+            profile["columns"].append(
+                _get_column_profile_df(
+                    column_name=column,
+                    column_type=native_dtype,
+                    column_number=idx + 1,
+                    column_kind=column_kind,
+                    col_stats=col_stats,
+                    sample_data=sample_data,
+                    row_count=row_count,
+                    approx=self.approx,
+                )
+            )
 
-            # If there are missing values, subtract 1 from the number of unique values
-            # to account for the missing value which shouldn't be included in the count
-            if (n_missing_vals > 0) and (n_unique_vals > 0):
-                n_unique_vals = n_unique_vals - 1
+        return profile
 
-            f_missing_vals = _round_to_sig_figs(n_missing_vals / row_count, 3)
-            f_unique_vals = _round_to_sig_figs(n_unique_vals / row_count, 3)
+    @classmethod
+    def merge(cls, scans: list[DataScan], tbl_name: str | None = None) -> DataScan:
+        """
+        Merge the scans of several partitions of a table into a single scan.
+
+        The scans must have been made with `approx=True` from DataFrames with the same columns
+        (and column types). The counts and the means and standard deviations of the partitions are
+        combined exactly (from their sufficient statistics), and the sketches for the number of
+        unique values and the quantiles are merged, so no partition needs to be scanned again. The
+        sample data is taken from the first partitions. A merged scan can itself be merged with
+        other scans.
+
+        Parameters
+        ----------
+        scans
+            A list of `DataScan` objects, one for each partition of the table (in order).
+        tbl_name
+            Optionally, the name of the table could be provided as `tbl_name`.
+
+        Returns
+        -------
+        DataScan
+            A DataScan object with the profile of the entire table.
+        """
+
+        if not scans:
+            raise ValueError("At least one `DataScan` object must be provided to `merge()`.")
+
+        for scan in scans:
+            if not isinstance(scan, DataScan) or not scan.approx or scan._column_stats is None:
+                raise ValueError(
+                    "Only `DataScan` objects that were made with `approx=True` from DataFrames "
+                    "can be merged."
+                )
 
-            col_profile = {
-                "column_name": column,
-                "column_type": native_dtype,
-                "column_number": idx + 1,
-                "n_missing_values": n_missing_vals,
-                "f_missing_values": f_missing_vals,
-                "n_unique_values": n_unique_vals,
-                "f_unique_values": f_unique_vals,
+        column_types = [
+            (col_profile["column_name"], col_profile["column_type"])
+            for col_profile in scans[0].profile["columns"]
+        ]
+
+        for scan in scans[1:]:
+            if [
+                (col_profile["column_name"], col_profile["column_type"])
+                for col_profile in scan.profile["columns"]
+            ] != column_types:
+                raise ValueError(
+                    "The `DataScan` objects to merge must have the same columns and column types."
+                )
+
+        row_count = sum(scan.profile["dimensions"]["rows"] for scan in scans)
+
+        merged = cls.__new__(cls)
+        merged.data = None
+        merged.tbl_name = tbl_name
+        merged.approx = True
+        merged.n_jobs = 1
+        merged.sample_n = None
+        merged.sample_frac = None
+        merged.seed = 0
+        merged.cache = False
+        merged.data_alt = None
+        merged.tbl_category = "dataframe"
+        merged.tbl_type = scans[0].tbl_type
+        merged._column_stats = []
+        merged._tbl_rows = None
+
+        profile = {}
+
+        if tbl_name:
+            profile["tbl_name"] = tbl_name
+
+        profile.update(
+            {
+                "tbl_type": merged.tbl_type,
+                "dimensions": {"rows": row_count, "columns": len(column_types)},
+                "columns": [],
             }
+        )
 
-            #
-            # Numerical columns
-            #
-            if "int" in str(col_data.dtype).lower() or "float" in str(col_data.dtype).lower():
-                n_negative_vals = int(col_data.is_between(-1e26, -1e-26).sum())
-                f_negative_vals = _round_to_sig_figs(n_negative_vals / row_count, 3)
+        for idx, (column, native_dtype) in enumerate(column_types):
+            column_kind = scans[0]._column_stats[idx]["column_kind"]
 
-                n_zero_vals = int(col_data.is_between(0, 0).sum())
-                f_zero_vals = _round_to_sig_figs(n_zero_vals / row_count, 3)
+            col_stats = _merge_column_stats(
+                column_stats=[scan._column_stats[idx] for scan in scans],
+                row_counts=[scan.profile["dimensions"]["rows"] for scan in scans],
+                column_kind=column_kind,
+            )
 
-                n_positive_vals = row_count - n_missing_vals - n_negative_vals - n_zero_vals
-                f_positive_vals = _round_to_sig_figs(n_positive_vals / row_count, 3)
+            merged._column_stats.append(col_stats)
+
+            profile["columns"].append(
+                _get_column_profile_df(
+                    column_name=column,
+                    column_type=native_dtype,
+                    column_number=idx + 1,
+                    column_kind=column_kind,
+                    col_stats=col_stats,
+                    sample_data=col_stats["sample_data"],
+                    row_count=row_count,
+                    approx=True,
+                )
+            )
 
-                col_profile_additional = {
-                    "n_negative_values": n_negative_vals,
-                    "f_negative_values": f_negative_vals,
-                    "n_zero_values": n_zero_vals,
-                    "f_zero_values": f_zero_vals,
-                    "n_positive_values": n_positive_vals,
-                    "f_positive_values": f_positive_vals,
-                    "sample_data": sample_data,
-                }
-                col_profile.update(col_profile_additional)
+        merged.profile = profile
 
-                col_profile_stats = {
-                    "statistics": {
-                        "numerical": {
-                            "descriptive": {
-                                "mean": round(float(col_data.mean()), 2),
-                                "std_dev": round(float(col_data.std()), 4),
-                            },
-                            "quantiles": {
-                                "min": float(col_data.min()),
-                                "p05": round(
-                                    float(col_data.quantile(0.05, interpolation="linear")), 2
-                                ),
-                                "q_1": round(
-                                    float(col_data.quantile(0.25, interpolation="linear")), 2
-                                ),
-                                "med": float(col_data.median()),
-                                "q_3": round(
-                                    float(col_data.quantile(0.75, interpolation="linear")), 2
-                                ),
-                                "p95": round(
-                                    float(col_data.quantile(0.95, interpolation="linear")), 2
-                                ),
-                                "max": float(col_data.max()),
-                                "iqr": round(
-                                    float(col_data.quantile(0.75, interpolation="linear"))
-                                    - float(col_data.quantile(0.25, interpolation="linear")),
-                                    2,
-                                ),
-                            },
-                        }
-                    }
-                }
-                col_profile.update(col_profile_stats)
+        return merged
 
-            #
-            # String columns
-            #
-            elif (
-                "string" in str(col_data.dtype).lower()
-                or "categorical" in str(col_data.dtype).lower()
-            ):
-                col_profile_additional = {
-                    "sample_data": sample_data,
-                }
-                col_profile.update(col_profile_additional)
+    def _get_column_stats_df(
+        self, column_idxs: list[int], column_kinds: list[str | None]
+    ) -> dict[int, dict]:
+        """
+        Compute the statistics of a subset of the columns (given by their indices).
+        """
 
-                # Transform `col_data` to a column of string lengths
-                col_str_len_data = col_data.str.len_chars()
+        columns = self.data_alt.columns
 
-                col_profile_stats = {
-                    "statistics": {
-                        "string_lengths": {
-                            "descriptive": {
-                                "mean": round(float(col_str_len_data.mean()), 2),
-                                "std_dev": round(float(col_str_len_data.std()), 4),
-                            },
-                            "quantiles": {
-                                "min": int(col_str_len_data.min()),
-                                "p05": int(col_str_len_data.quantile(0.05, interpolation="linear")),
-                                "q_1": int(col_str_len_data.quantile(0.25, interpolation="linear")),
-                                "med": int(col_str_len_data.median()),
-                                "q_3": int(col_str_len_data.quantile(0.75, interpolation="linear")),
-                                "p95": int(col_str_len_data.quantile(0.95, interpolation="linear")),
-                                "max": int(col_str_len_data.max()),
-                                "iqr": int(col_str_len_data.quantile(0.75, interpolation="linear"))
-                                - int(col_str_len_data.quantile(0.25, interpolation="linear")),
-                            },
-                        }
-                    }
-                }
-                col_profile.update(col_profile_stats)
+        # Compute every statistic for every column in a single `select()` of aggregate expressions,
+        # giving a table with a single row; the expressions are aliased as `<idx>__<statistic>`
+        stat_exprs = [
+            expr.alias(f"{idx}__{stat}")
+            for idx in column_idxs
+            for stat, expr in _get_column_agg_exprs(
+                column=columns[idx], column_kind=column_kinds[idx], approx=self.approx
+            ).items()
+        ]
 
-            #
-            # Date and datetime columns
-            #
-            elif "date" in str(col_data.dtype).lower():
-                col_profile_additional = {
-                    "sample_data": sample_data,
-                }
-                col_profile.update(col_profile_additional)
+        column_stats = {idx: {} for idx in column_idxs}
 
-                min_date = str(col_data.min())
-                max_date = str(col_data.max())
+        for name, values in self.data_alt.select(stat_exprs).to_dict(as_series=False).items():
+            idx, stat = name.split("__", 1)
+            column_stats[int(idx)][stat] = values[0]
 
-                col_profile_stats = {
-                    "statistics": {
-                        "datetime": {
-                            "min": min_date,
-                            "max": max_date,
-                        }
-                    }
-                }
-                col_profile.update(col_profile_stats)
+        # Estimate the number of unique values and the quantiles with sketches
+        if self.approx:
+            sketch_stats = self._get_sketch_stats_df(
+                column_idxs=column_idxs, column_kinds=column_kinds
+            )
 
-            #
-            # Boolean columns
-            #
-            elif "bool" in str(col_data.dtype).lower():
-                col_profile_additional = {
-                    "sample_data": sample_data,
-                }
-                col_profile.update(col_profile_additional)
+            for idx, col_sketch_stats in zip(column_idxs, sketch_stats):
+                column_stats[idx].update(col_sketch_stats)
 
-                n_true_values = int(col_data.sum())
-                f_true_values = _round_to_sig_figs(n_true_values / row_count, 3)
+        return column_stats
 
-                n_false_values = row_count - n_missing_vals - n_true_values
-                f_false_values = _round_to_sig_figs(n_false_values / row_count, 3)
+    def _get_sketch_stats_df(
+        self, column_idxs: list[int], column_kinds: list[str | None]
+    ) -> list[dict]:
+        """
+        Estimate the number of unique values and the quantiles of columns with sketches.
 
-                col_profile_stats = {
-                    "statistics": {
-                        "boolean": {
-                            "n_true_values": n_true_values,
-                            "f_true_values": f_true_values,
-                            "n_false_values": n_false_values,
-                            "f_false_values": f_false_values,
-                        }
+        The columns (given by their indices) are streamed in batches of rows, sliced from the table
+        itself, through a HyperLogLog sketch and (for numerical and string columns) a quantile
+        sketch of each column.
+        """
+
+        if not _is_lib_present(lib_name="numpy"):
+            raise ImportError(
+                "The NumPy library is not installed but is required when using `approx=True` "
+                "with a DataFrame."
+            )
+
+        columns = self.data_alt.columns
+
+        hll_sketches = [_HyperLogLog() for _ in column_idxs]
+        quantile_sketches = [_QuantileSketch() for _ in column_idxs]
+
+        for offset in range(0, len(self.data_alt), SKETCH_BATCH_SIZE):
+            batch = self.data_alt[offset : offset + SKETCH_BATCH_SIZE]
+
+            for i, idx in enumerate(column_idxs):
+                values = batch[columns[idx]]
+
+                hll_sketches[i].update(values)
+
+                # The quantiles of string columns are those of the string lengths
+                if column_kinds[idx] == "numerical":
+                    quantile_sketches[i].update(values)
+                elif column_kinds[idx] == "string":
+                    quantile_sketches[i].update(values.str.len_chars())
+
+        sketch_stats = []
+
+        for hll_sketch, quantile_sketch, column_kind in zip(
+            hll_sketches, quantile_sketches, [column_kinds[idx] for idx in column_idxs]
+        ):
+            col_sketch_stats = {
+                "n_unique": hll_sketch.estimate(),
+                "hll": hll_sketch,
+                "approx": _get_approx_info(
+                    column_kind=column_kind,
+                    method="hyperloglog",
+                    rel_std_error=round(hll_sketch.rel_std_error(), 4),
+                    rank_error=round(quantile_sketch.rank_error(), 4),
+                    quantile_method="kll",
+                ),
+            }
+
+            if column_kind in ["numerical", "string"]:
+                col_sketch_stats.update(
+                    {
+                        "quantile_sketch": quantile_sketch,
+                        "p05": quantile_sketch.quantile(0.05),
+                        "q_1": quantile_sketch.quantile(0.25),
+                        "med": quantile_sketch.quantile(0.5),
+                        "q_3": quantile_sketch.quantile(0.75),
+                        "p95": quantile_sketch.quantile(0.95),
                     }
-                }
-                col_profile.update(col_profile_stats)
+                )
 
-            profile["columns"].append(col_profile)
+            sketch_stats.append(col_sketch_stats)
 
-        return profile
+        return sketch_stats
 
     def _generate_profile_ibis(self) -> dict:
         profile = {}
@@ -353,35 +627,82 @@ class DataScan:
         if self.tbl_name:
             profile["tbl_name"] = self.tbl_name
 
-        from pointblank.validate import get_row_count
+        # Determine which DataFrame library is available
+        df_lib = _select_df_lib(preference="polars")
+        df_lib_str = str(df_lib)
+
+        if "polars" in df_lib_str:
+            df_lib_use = "polars"
+        else:
+            df_lib_use = "pandas"
+
+        tbl = self.data
+
+        # Draw the sample that's profiled instead of the entire table
+        if self._is_sampled():
+            self._tbl_rows = int(tbl.count().to_pyarrow().as_py())
 
-        row_count = get_row_count(data=self.data)
-        column_count = len(self.data.columns)
+            if self.sample_frac is not None:
+                fraction = self.sample_frac
+            else:
+                fraction = min(self.sample_n / self._tbl_rows, 1.0) if self._tbl_rows > 0 else 1.0
+
+            tbl = tbl.sample(fraction, seed=self.seed)
+
+        column_dtypes = list(tbl.schema().items())
+        column_kinds = [_get_ibis_column_kind(dtype_str=str(dtype)) for _, dtype in column_dtypes]
+
+        # Compile the whole profile into a single aggregate query (the result is a table with a
+        # single row); the aggregates are named as `<idx>__<statistic>`
+        stat_exprs = {
+            f"{idx}__{stat}": expr
+            for idx, column in enumerate(tbl.columns)
+            for stat, expr in _get_ibis_column_agg_exprs(
+                col_data=tbl[column], column_kind=column_kinds[idx], approx=self.approx
+            ).items()
+        }
+
+        stats_tbl = tbl.aggregate(n_rows_=tbl.count(), **stat_exprs)
+        stats_row = nw.from_native(_to_df_lib(stats_tbl, df_lib=df_lib_use)).to_dict(
+            as_series=False
+        )
+
+        row_count = int(stats_row.pop("n_rows_")[0])
+        column_count = len(tbl.columns)
+
+        column_stats = [{} for _ in tbl.columns]
+
+        for name, values in stats_row.items():
+            idx, stat = name.split("__", 1)
+            column_stats[int(idx)][stat] = values[0]
+
+        # The error bounds of the backend's approximate aggregations aren't known
+        if self.approx:
+            for col_stats, column_kind in zip(column_stats, column_kinds):
+                col_stats["approx"] = _get_approx_info(
+                    column_kind=column_kind, method="backend", rel_std_error=None, rank_error=None
+                )
+
+        # Get the sample data for all columns with a single query
+        sample_tbl = _to_df_lib(tbl.drop_null().head(5), df_lib=df_lib_use)
 
         profile.update(
             {
                 "tbl_type": self.tbl_type,
                 "dimensions": {"rows": row_count, "columns": column_count},
-                "columns": [],
             }
         )
 
-        # Determine which DataFrame library is available
-        df_lib = _select_df_lib(preference="polars")
-        df_lib_str = str(df_lib)
-
-        if "polars" in df_lib_str:
-            df_lib_use = "polars"
-        else:
-            df_lib_use = "pandas"
+        if self._is_sampled():
+            profile["sample"] = {"tbl_rows": self._tbl_rows, "seed": self.seed}
 
-        column_dtypes = list(self.data.schema().items())
+        profile["columns"] = []
 
-        for idx, column in enumerate(self.data.columns):
+        for idx, column in enumerate(tbl.columns):
             dtype_str = str(column_dtypes[idx][1])
+            column_kind = column_kinds[idx]
 
-            col_data = self.data[column]
-            col_data_no_null = self.data.drop_null().head(5)[column]
+            col_stats = column_stats[idx]
 
             #
             # Collection of sample data
@@ -390,21 +711,19 @@ class DataScan:
                 if df_lib_use == "polars":
                     import polars as pl
 
-                    sample_data = col_data_no_null.to_polars().cast(pl.String).to_list()
+                    sample_data = sample_tbl[column].cast(pl.String).to_list()
                 else:
-                    sample_data = col_data_no_null.to_pandas().astype(str).to_list()
+                    sample_data = sample_tbl[column].astype(str).to_list()
             else:
-                if df_lib_use == "polars":
-                    sample_data = col_data_no_null.to_polars().to_list()
-                else:
-                    sample_data = col_data_no_null.to_pandas().to_list()
+                sample_data = sample_tbl[column].to_list()
 
-            n_missing_vals = int(_to_df_lib(col_data.isnull().sum(), df_lib=df_lib_use))
-            n_unique_vals = int(_to_df_lib(col_data.nunique(), df_lib=df_lib_use))
+            n_missing_vals = int(col_stats["n_missing"])
+            n_unique_vals = int(col_stats["n_unique"])
 
             # If there are missing values, subtract 1 from the number of unique values
-            # to account for the missing value which shouldn't be included in the count
-            if (n_missing_vals > 0) and (n_unique_vals > 0):
+            # to account for the missing value which shouldn't be included in the count (the
+            # approximate count already excludes missing values)
+            if not self.approx and (n_missing_vals > 0) and (n_unique_vals > 0):
                 n_unique_vals = n_unique_vals - 1
 
             f_missing_vals = _round_to_sig_figs(n_missing_vals / row_count, 3)
@@ -423,13 +742,11 @@ class DataScan:
             #
             # Numerical columns
             #
-            if "int" in dtype_str.lower() or "float" in dtype_str.lower():
-                n_negative_vals = int(
-                    _to_df_lib(col_data.between(-1e26, -1e-26).sum(), df_lib=df_lib_use)
-                )
+            if column_kind == "numerical":
+                n_negative_vals = int(col_stats["n_negative"])
                 f_negative_vals = _round_to_sig_figs(n_negative_vals / row_count, 3)
 
-                n_zero_vals = int(_to_df_lib(col_data.between(0, 0).sum(), df_lib=df_lib_use))
+                n_zero_vals = int(col_stats["n_zero"])
                 f_zero_vals = _round_to_sig_figs(n_zero_vals / row_count, 3)
 
                 n_positive_vals = row_count - n_missing_vals - n_negative_vals - n_zero_vals
@@ -450,32 +767,20 @@ class DataScan:
                     "statistics": {
                         "numerical": {
                             "descriptive": {
-                                "mean": round(_to_df_lib(col_data.mean(), df_lib=df_lib_use), 2),
-                                "std_dev": round(_to_df_lib(col_data.std(), df_lib=df_lib_use), 4),
+                                "mean": round(col_stats["mean"], 2),
+                                "std_dev": round(col_stats["std"], 4),
                             },
                             "quantiles": {
-                                "min": _to_df_lib(col_data.min(), df_lib=df_lib_use),
-                                "p05": round(
-                                    _to_df_lib(col_data.approx_quantile(0.05), df_lib=df_lib_use),
-                                    2,
-                                ),
-                                "q_1": round(
-                                    _to_df_lib(col_data.approx_quantile(0.25), df_lib=df_lib_use),
-                                    2,
-                                ),
-                                "med": _to_df_lib(col_data.median(), df_lib=df_lib_use),
-                                "q_3": round(
-                                    _to_df_lib(col_data.approx_quantile(0.75), df_lib=df_lib_use),
-                                    2,
-                                ),
-                                "p95": round(
-                                    _to_df_lib(col_data.approx_quantile(0.95), df_lib=df_lib_use),
-                                    2,
-                                ),
-                                "max": _to_df_lib(col_data.max(), df_lib=df_lib_use),
+                                "min": col_stats["min"],
+                                "p05": round(col_stats["p05"], 2),
+                                "q_1": round(col_stats["q_1"], 2),
+                                "med": col_stats["med"],
+                                "q_3": round(col_stats["q_3"], 2),
+                                "p95": round(col_stats["p95"], 2),
+                                "max": col_stats["max"],
                                 "iqr": round(
-                                    _to_df_lib(col_data.quantile(0.75), df_lib=df_lib_use)
-                                    - _to_df_lib(col_data.quantile(0.25), df_lib=df_lib_use),
+                                    col_stats.get("q_3_exact", col_stats["q_3"])
+                                    - col_stats.get("q_1_exact", col_stats["q_1"]),
                                     2,
                                 ),
                             },
@@ -487,68 +792,29 @@ class DataScan:
             #
             # String columns
             #
-            elif "string" in dtype_str.lower() or "char" in dtype_str.lower():
+            elif column_kind == "string":
                 col_profile_additional = {
                     "sample_data": sample_data,
                 }
                 col_profile.update(col_profile_additional)
 
-                # Transform `col_data` to a column of string lengths
-                col_str_len_data = col_data.length()
-
+                # The statistics are those of the string lengths
                 col_profile_stats = {
                     "statistics": {
                         "string_lengths": {
                             "descriptive": {
-                                "mean": round(
-                                    float(_to_df_lib(col_str_len_data.mean(), df_lib=df_lib_use)), 2
-                                ),
-                                "std_dev": round(
-                                    float(_to_df_lib(col_str_len_data.std(), df_lib=df_lib_use)), 4
-                                ),
+                                "mean": round(float(col_stats["mean"]), 2),
+                                "std_dev": round(float(col_stats["std"]), 4),
                             },
                             "quantiles": {
-                                "min": int(_to_df_lib(col_str_len_data.min(), df_lib=df_lib_use)),
-                                "p05": int(
-                                    _to_df_lib(
-                                        col_str_len_data.approx_quantile(0.05),
-                                        df_lib=df_lib_use,
-                                    )
-                                ),
-                                "q_1": int(
-                                    _to_df_lib(
-                                        col_str_len_data.approx_quantile(0.25),
-                                        df_lib=df_lib_use,
-                                    )
-                                ),
-                                "med": int(
-                                    _to_df_lib(col_str_len_data.median(), df_lib=df_lib_use)
-                                ),
-                                "q_3": int(
-                                    _to_df_lib(
-                                        col_str_len_data.approx_quantile(0.75),
-                                        df_lib=df_lib_use,
-                                    )
-                                ),
-                                "p95": int(
-                                    _to_df_lib(
-                                        col_str_len_data.approx_quantile(0.95),
-                                        df_lib=df_lib_use,
-                                    )
-                                ),
-                                "max": int(_to_df_lib(col_str_len_data.max(), df_lib=df_lib_use)),
-                                "iqr": int(
-                                    _to_df_lib(
-                                        col_str_len_data.approx_quantile(0.75),
-                                        df_lib=df_lib_use,
-                                    )
-                                )
-                                - int(
-                                    _to_df_lib(
-                                        col_str_len_data.approx_quantile(0.25),
-                                        df_lib=df_lib_use,
-                                    )
-                                ),
+                                "min": int(col_stats["min"]),
+                                "p05": int(col_stats["p05"]),
+                                "q_1": int(col_stats["q_1"]),
+                                "med": int(col_stats["med"]),
+                                "q_3": int(col_stats["q_3"]),
+                                "p95": int(col_stats["p95"]),
+                                "max": int(col_stats["max"]),
+                                "iqr": int(col_stats["q_3"]) - int(col_stats["q_1"]),
                             },
                         }
                     }
@@ -558,20 +824,17 @@ class DataScan:
             #
             # Date and datetime columns
             #
-            elif "date" in dtype_str.lower() or "timestamp" in dtype_str.lower():
+            elif column_kind == "datetime":
                 col_profile_additional = {
                     "sample_data": sample_data,
                 }
                 col_profile.update(col_profile_additional)
 
-                min_date = _to_df_lib(col_data.min(), df_lib=df_lib_use)
-                max_date = _to_df_lib(col_data.max(), df_lib=df_lib_use)
-
                 col_profile_stats = {
                     "statistics": {
                         "datetime": {
-                            "min": str(min_date),
-                            "max": str(max_date),
+                            "min": str(col_stats["min"]),
+                            "max": str(col_stats["max"]),
                         }
                     }
                 }
@@ -580,13 +843,13 @@ class DataScan:
             #
             # Boolean columns
             #
-            elif "bool" in dtype_str.lower():
+            elif column_kind == "boolean":
                 col_profile_additional = {
                     "sample_data": sample_data,
                 }
                 col_profile.update(col_profile_additional)
 
-                n_true_values = _to_df_lib(col_data.cast(int).sum(), df_lib=df_lib)
+                n_true_values = int(col_stats["n_true"])
                 f_true_values = _round_to_sig_figs(n_true_values / row_count, 3)
 
                 n_false_values = row_count - n_missing_vals - n_true_values
@@ -604,6 +867,10 @@ class DataScan:
                 }
                 col_profile.update(col_profile_stats)
 
+            # Add the methods and error bounds of any approximate statistics
+            if self.approx:
+                col_profile["approx"] = col_stats["approx"]
+
             profile["columns"].append(col_profile)
 
         return profile
@@ -671,7 +938,17 @@ class DataScan:
             tbl_type=self.tbl_type, tbl_name=tbl_name, font_size="10px"
         )
 
-        tbl_dims_html = _create_table_dims_html(columns=n_columns, rows=n_rows, font_size="10px")
+        # The dimensions are those of the table, with the size of the sample shown separately
+        if "sample" in self.profile:
+            tbl_dims_html = _create_table_dims_html(
+                columns=n_columns, rows=self.profile["sample"]["tbl_rows"], font_size="10px"
+            ) + _create_table_sample_html(
+                rows=n_rows, seed=self.profile["sample"]["seed"], font_size="10px"
+            )
+        else:
+            tbl_dims_html = _create_table_dims_html(
+                columns=n_columns, rows=n_rows, font_size="10px"
+            )
 
         # Compose the subtitle HTML fragment
         combined_title = (
@@ -794,7 +1071,14 @@ class DataScan:
             json.dump(self.profile, f, indent=4)
 
 
-def col_summary_tbl(data: FrameT | Any, tbl_name: str | None = None) -> GT:
+def col_summary_tbl(
+    data: FrameT | Any,
+    tbl_name: str | None = None,
+    sample_n: int | None = None,
+    sample_frac: int | float | None = None,
+    seed: int = 0,
+    cache: bool = False,
+) -> GT:
     """
     Generate a column-level summary table of a dataset.
 
@@ -825,6 +1109,21 @@ def col_summary_tbl(data: FrameT | Any, tbl_name: str | None = None) -> GT:
         *Supported Input Table Types* section for details on the supported table types.
     tbl_name
         Optionally, the name of the table could be provided as `tbl_name=`.
+    sample_n
+        Summarize a random sample of `sample_n` rows instead of the entire table (the sample is
+        noted in the header of the table). Can't be used along with `sample_frac=`.
+    sample_frac
+        Summarize a random sample with this fraction of the table's rows (a value between `0` and
+        `1`) instead of the entire table. Can't be used along with `sample_n=`.
+    seed
+        The seed for drawing the sample with `sample_n=` or `sample_frac=`. The same seed always
+        gives the same sample of a table.
+    cache
+        Should the profile of the table be reused from (and stored in) the profile cache? This
+        cache is shared with [`DataScan`](`pointblank.DataScan`), so summarizing the same table
+        again doesn't scan the data again. By default, this is `False`. Tables are identified by
+        the table object (not its contents), so only use the cache for tables that aren't modified
+        in place.
 
     Returns
     -------
@@ -873,10 +1172,494 @@ def col_summary_tbl(data: FrameT | Any, tbl_name: str | None = None) -> GT:
     ```
     """
 
-    scanner = DataScan(data=data, tbl_name=tbl_name)
+    scanner = DataScan(
+        data=data,
+        tbl_name=tbl_name,
+        sample_n=sample_n,
+        sample_frac=sample_frac,
+        seed=seed,
+        cache=cache,
+    )
     return scanner.get_tabular_report()
 
 
+def _get_column_profile_df(
+    column_name: str,
+    column_type: str,
+    column_number: int,
+    column_kind: str | None,
+    col_stats: dict,
+    sample_data: list,
+    row_count: int,
+    approx: bool,
+) -> dict:
+    """
+    Get the profile of a DataFrame column from its statistics.
+    """
+
+    n_missing_vals = int(col_stats["n_missing"])
+    n_unique_vals = int(col_stats["n_unique"])
+
+    # If there are missing values, subtract 1 from the number of unique values
+    # to account for the missing value which shouldn't be included in the count (the
+    # approximate count already excludes missing values)
+    if not approx and (n_missing_vals > 0) and (n_unique_vals > 0):
+        n_unique_vals = n_unique_vals - 1
+
+    f_missing_vals = _round_to_sig_figs(n_missing_vals / row_count, 3)
+    f_unique_vals = _round_to_sig_figs(n_unique_vals / row_count, 3)
+
+    col_profile = {
+        "column_name": column_name,
+        "column_type": column_type,
+        "column_number": column_number,
+        "n_missing_values": n_missing_vals,
+        "f_missing_values": f_missing_vals,
+        "n_unique_values": n_unique_vals,
+        "f_unique_values": f_unique_vals,
+    }
+
+    #
+    # Numerical columns
+    #
+    if column_kind == "numerical":
+        n_negative_vals = int(col_stats["n_negative"])
+        f_negative_vals = _round_to_sig_figs(n_negative_vals / row_count, 3)
+
+        n_zero_vals = int(col_stats["n_zero"])
+        f_zero_vals = _round_to_sig_figs(n_zero_vals / row_count, 3)
+
+        n_positive_vals = row_count - n_missing_vals - n_negative_vals - n_zero_vals
+        f_positive_vals = _round_to_sig_figs(n_positive_vals / row_count, 3)
+
+        col_profile_additional = {
+            "n_negative_values": n_negative_vals,
+            "f_negative_values": f_negative_vals,
+            "n_zero_values": n_zero_vals,
+            "f_zero_values": f_zero_vals,
+            "n_positive_values": n_positive_vals,
+            "f_positive_values": f_positive_vals,
+            "sample_data": sample_data,
+        }
+        col_profile.update(col_profile_additional)
+
+        col_profile_stats = {
+            "statistics": {
+                "numerical": {
+                    "descriptive": {
+                        "mean": round(float(col_stats["mean"]), 2),
+                        "std_dev": round(float(col_stats["std"]), 4),
+                    },
+                    "quantiles": {
+                        "min": float(col_stats["min"]),
+                        "p05": round(float(col_stats["p05"]), 2),
+                        "q_1": round(float(col_stats["q_1"]), 2),
+                        "med": float(col_stats["med"]),
+                        "q_3": round(float(col_stats["q_3"]), 2),
+                        "p95": round(float(col_stats["p95"]), 2),
+                        "max": float(col_stats["max"]),
+                        "iqr": round(float(col_stats["q_3"]) - float(col_stats["q_1"]), 2),
+                    },
+                }
+            }
+        }
+        col_profile.update(col_profile_stats)
+
+    #
+    # String columns
+    #
+    elif column_kind == "string":
+        col_profile_additional = {
+            "sample_data": sample_data,
+        }
+        col_profile.update(col_profile_additional)
+
+        # The statistics are those of the string lengths
+        col_profile_stats = {
+            "statistics": {
+                "string_lengths": {
+                    "descriptive": {
+                        "mean": round(float(col_stats["mean"]), 2),
+                        "std_dev": round(float(col_stats["std"]), 4),
+                    },
+                    "quantiles": {
+                        "min": int(col_stats["min"]),
+                        "p05": int(col_stats["p05"]),
+                        "q_1": int(col_stats["q_1"]),
+                        "med": int(col_stats["med"]),
+                        "q_3": int(col_stats["q_3"]),
+                        "p95": int(col_stats["p95"]),
+                        "max": int(col_stats["max"]),
+                        "iqr": int(col_stats["q_3"]) - int(col_stats["q_1"]),
+                    },
+                }
+            }
+        }
+        col_profile.update(col_profile_stats)
+
+    #
+    # Date and datetime columns
+    #
+    elif column_kind == "datetime":
+        col_profile_additional = {
+            "sample_data": sample_data,
+        }
+        col_profile.update(col_profile_additional)
+
+        col_profile_stats = {
+            "statistics": {
+                "datetime": {
+                    "min": str(col_stats["min"]),
+                    "max": str(col_stats["max"]),
+                }
+            }
+        }
+        col_profile.update(col_profile_stats)
+
+    #
+    # Boolean columns
+    #
+    elif column_kind == "boolean":
+        col_profile_additional = {
+            "sample_data": sample_data,
+        }
+        col_profile.update(col_profile_additional)
+
+        n_true_values = int(col_stats["n_true"])
+        f_true_values = _round_to_sig_figs(n_true_values / row_count, 3)
+
+        n_false_values = row_count - n_missing_vals - n_true_values
+        f_false_values = _round_to_sig_figs(n_false_values / row_count, 3)
+
+        col_profile_stats = {
+            "statistics": {
+                "boolean": {
+                    "n_true_values": n_true_values,
+                    "f_true_values": f_true_values,
+                    "n_false_values": n_false_values,
+                    "f_false_values": f_false_values,
+                }
+            }
+        }
+        col_profile.update(col_profile_stats)
+
+    # Add the methods and error bounds of any approximate statistics
+    if approx:
+        col_profile["approx"] = col_stats["approx"]
+
+    return col_profile
+
+
+def _merge_column_stats(
+    column_stats: list[dict], row_counts: list[int], column_kind: str | None
+) -> dict:
+    """
+    Merge the statistics of a column across partitions of a table.
+
+    Counts are added up and the sketches are merged. The means and standard deviations are
+    combined from the number of (non-missing) values, the mean, and the sum of squared deviations
+    from the mean of each partition.
+    """
+
+    hll_sketch = reduce(
+        lambda sketch, other: sketch.merge(other), [stats["hll"] for stats in column_stats]
+    )
+
+    merged = {
+        "column_kind": column_kind,
+        "n_missing": sum(int(stats["n_missing"]) for stats in column_stats),
+        "n_unique": hll_sketch.estimate(),
+        "hll": hll_sketch,
+        "sample_data": [value for stats in column_stats for value in stats["sample_data"]][:5],
+    }
+
+    if column_kind == "numerical":
+        merged["n_negative"] = sum(int(stats["n_negative"]) for stats in column_stats)
+        merged["n_zero"] = sum(int(stats["n_zero"]) for stats in column_stats)
+
+    if column_kind == "boolean":
+        merged["n_true"] = sum(int(stats["n_true"]) for stats in column_stats)
+
+    rank_error = None
+
+    if column_kind in ["numerical", "string", "datetime"]:
+        min_vals = [stats["min"] for stats in column_stats if stats["min"] is not None]
+        max_vals = [stats["max"] for stats in column_stats if stats["max"] is not None]
+
+        merged["min"] = min(min_vals) if min_vals else None
+        merged["max"] = max(max_vals) if max_vals else None
+
+    if column_kind in ["numerical", "string"]:
+        n_values = [
+            row_count - int(stats["n_missing"])
+            for stats, row_count in zip(column_stats, row_counts)
+        ]
+        partitions = [
+            (n, stats["mean"], stats["std"])
+            for n, stats in zip(n_values, column_stats)
+            if n > 0 and stats["mean"] is not None
+        ]
+        n_total = sum(n for n, _, _ in partitions)
+
+        if n_total > 0:
+            mean = sum(n * mean for n, mean, _ in partitions) / n_total
+
+            # The standard deviation of a single value is missing (and adds no deviation)
+            sum_sq_dev = sum(
+                (n - 1) * (std**2 if n > 1 and std is not None else 0.0)
+                + n * (part_mean - mean) ** 2
+                for n, part_mean, std in partitions
+            )
+
+            merged["mean"] = mean
+            merged["std"] = sqrt(sum_sq_dev / (n_total - 1)) if n_total > 1 else None
+        else:
+            merged["mean"] = None
+            merged["std"] = None
+
+        quantile_sketch = reduce(
+            lambda sketch, other: sketch.merge(other),
+            [stats["quantile_sketch"] for stats in column_stats],
+        )
+
+        merged.update(
+            {
+                "quantile_sketch": quantile_sketch,
+                "p05": quantile_sketch.quantile(0.05),
+                "q_1": quantile_sketch.quantile(0.25),
+                "med": quantile_sketch.quantile(0.5),
+                "q_3": quantile_sketch.quantile(0.75),
+                "p95": quantile_sketch.quantile(0.95),
+            }
+        )
+
+        rank_error = round(quantile_sketch.rank_error(), 4)
+
+    merged["approx"] = _get_approx_info(
+        column_kind=column_kind,
+        method="hyperloglog",
+        rel_std_error=round(hll_sketch.rel_std_error(), 4),
+        rank_error=rank_error,
+        quantile_method="kll",
+    )
+
+    return merged
+
+
+def _check_sample_params(sample_n: int | None, sample_frac: int | float | None) -> None:
+    if sample_n is not None and sample_frac is not None:
+        raise ValueError("Only one of `sample_n=` or `sample_frac=` can be provided.")
+
+    if sample_n is not None and (
+        isinstance(sample_n, bool) or not isinstance(sample_n, int) or sample_n < 1
+    ):
+        raise ValueError("The `sample_n=` value must be a positive integer.")
+
+    if sample_frac is not None and (
+        isinstance(sample_frac, bool)
+        or not isinstance(sample_frac, (int, float))
+        or not 0 < sample_frac <= 1
+    ):
+        raise ValueError("The `sample_frac=` value must be a number greater than 0 and up to 1.")
+
+
+def _resolve_n_jobs(n_jobs: int) -> int:
+    if isinstance(n_jobs, bool) or not isinstance(n_jobs, int) or n_jobs == 0 or n_jobs < -1:
+        raise ValueError("The `n_jobs=` value must be a positive integer or `-1` (for all CPUs).")
+
+    if n_jobs == -1:
+        return os.cpu_count() or 1
+
+    return n_jobs
+
+
+def _partition_columns(n_columns: int, n_partitions: int) -> list[list[int]]:
+    """
+    Split the column indices into (at most) `n_partitions` contiguous partitions of similar size.
+    """
+
+    n_partitions = max(min(n_partitions, n_columns), 1)
+    partition_size, n_larger = divmod(n_columns, n_partitions)
+
+    partitions = []
+    start = 0
+
+    for i in range(n_partitions):
+        end = start + partition_size + (1 if i < n_larger else 0)
+        partitions.append(list(range(start, end)))
+        start = end
+
+    return partitions
+
+
+def _get_column_kind(dtype_str: str) -> str | None:
+    """
+    Get the kind of column (which determines the statistics in its profile) from its dtype.
+    """
+
+    dtype_str = dtype_str.lower()
+
+    if "int" in dtype_str or "float" in dtype_str:
+        return "numerical"
+    if "string" in dtype_str or "categorical" in dtype_str:
+        return "string"
+    if "date" in dtype_str:
+        return "datetime"
+    if "bool" in dtype_str:
+        return "boolean"
+
+    return None
+
+
+def _get_column_agg_exprs(
+    column: str, column_kind: str | None, approx: bool = False
+) -> dict[str, nw.Expr]:
+    """
+    Get the aggregate expressions for all of the statistics in the profile of a column.
+
+    With `approx=True`, the number of unique values and the quantiles are left out (these are
+    estimated with sketches instead).
+    """
+
+    col_expr = nw.col(column)
+
+    exprs = {"n_missing": col_expr.null_count()}
+
+    if not approx:
+        exprs["n_unique"] = col_expr.n_unique()
+
+    if column_kind == "numerical":
+        exprs.update(
+            {
+                "n_negative": col_expr.is_between(-1e26, -1e-26).sum(),
+                "n_zero": col_expr.is_between(0, 0).sum(),
+            }
+        )
+
+    if column_kind == "string":
+        # The statistics for string columns are based on the string lengths
+        col_expr = col_expr.str.len_chars()
+
+    if column_kind in ["numerical", "string"]:
+        exprs.update({"mean": col_expr.mean(), "std": col_expr.std(), "min": col_expr.min()})
+
+        if not approx:
+            exprs.update(
+                {
+                    "p05": col_expr.quantile(0.05, interpolation="linear"),
+                    "q_1": col_expr.quantile(0.25, interpolation="linear"),
+                    "med": col_expr.median(),
+                    "q_3": col_expr.quantile(0.75, interpolation="linear"),
+                    "p95": col_expr.quantile(0.95, interpolation="linear"),
+                }
+            )
+
+        exprs["max"] = col_expr.max()
+
+    if column_kind == "datetime":
+        exprs.update({"min": col_expr.min(), "max": col_expr.max()})
+
+    if column_kind == "boolean":
+        exprs["n_true"] = col_expr.sum()
+
+    return exprs
+
+
+def _get_ibis_column_kind(dtype_str: str) -> str | None:
+    """
+    Get the kind of column (which determines the statistics in its profile) from its Ibis dtype.
+    """
+
+    dtype_str = dtype_str.lower()
+
+    if "int" in dtype_str or "float" in dtype_str:
+        return "numerical"
+    if "string" in dtype_str or "char" in dtype_str:
+        return "string"
+    if "date" in dtype_str or "timestamp" in dtype_str:
+        return "datetime"
+    if "bool" in dtype_str:
+        return "boolean"
+
+    return None
+
+
+def _get_ibis_column_agg_exprs(
+    col_data: Any, column_kind: str | None, approx: bool = False
+) -> dict[str, Any]:
+    """
+    Get the Ibis aggregate expressions for all of the statistics in the profile of a column.
+
+    With `approx=True`, the backend's approximate aggregations are used for the number of unique
+    values and for all quantiles.
+    """
+
+    exprs = {
+        "n_missing": col_data.isnull().sum(),
+        "n_unique": col_data.approx_nunique() if approx else col_data.nunique(),
+    }
+
+    if column_kind == "numerical":
+        exprs.update(
+            {
+                "n_negative": col_data.between(-1e26, -1e-26).sum(),
+                "n_zero": col_data.between(0, 0).sum(),
+            }
+        )
+
+        # The IQR of numerical columns is otherwise based on exact quartiles
+        if not approx:
+            exprs.update(
+                {"q_1_exact": col_data.quantile(0.25), "q_3_exact": col_data.quantile(0.75)}
+            )
+
+    if column_kind == "string":
+        # The statistics for string columns are based on the string lengths
+        col_data = col_data.length()
+
+    if column_kind in ["numerical", "string"]:
+        exprs.update(
+            {
+                "mean": col_data.mean(),
+                "std": col_data.std(),
+                "min": col_data.min(),
+                "p05": col_data.approx_quantile(0.05),
+                "q_1": col_data.approx_quantile(0.25),
+                "med": col_data.approx_median() if approx else col_data.median(),
+                "q_3": col_data.approx_quantile(0.75),
+                "p95": col_data.approx_quantile(0.95),
+                "max": col_data.max(),
+            }
+        )
+
+    if column_kind == "datetime":
+        exprs.update({"min": col_data.min(), "max": col_data.max()})
+
+    if column_kind == "boolean":
+        exprs["n_true"] = col_data.cast(int).sum()
+
+    return exprs
+
+
+def _get_approx_info(
+    column_kind: str | None,
+    method: str,
+    rel_std_error: float | None,
+    rank_error: float | None,
+    quantile_method: str | None = None,
+) -> dict:
+    """
+    Get the methods and error bounds of the approximate statistics in the profile of a column.
+    """
+
+    approx_info = {"n_unique_values": {"method": method, "rel_std_error": rel_std_error}}
+
+    if column_kind in ["numerical", "string"]:
+        approx_info["quantiles"] = {"method": quantile_method or method, "rank_error": rank_error}
+
+    return approx_info
+
+
 def _to_df_lib(expr: any, df_lib: str) -> any:
     if df_lib == "polars":
         return expr.to_polars()
@@ -3,8 +3,11 @@ from __future__ import annotations
 import copy
 from dataclasses import dataclass
 
+from narwhals.dependencies import get_pyarrow
+
 from pointblank._constants import IBIS_BACKENDS
 from pointblank._utils import _get_tbl_type, _is_lib_present
+from pointblank._utils_parquet import _get_table_file_schema
 
 __all__ = ["Schema"]
 
@@ -29,9 +32,11 @@ class Schema:
     `column_name=dtype`)
 
     The schema object can also be constructed by providing a DataFrame or Ibis table object (using
-    the `tbl=` parameter) and the schema will be collected from either type of object. The schema
-    object can be printed to display the column names and dtypes. Note that if `tbl=` is provided
-    then there shouldn't be any other inputs provided through either `columns=` or `**kwargs`.
+    the `tbl=` parameter) and the schema will be collected from either type of object. The `tbl=`
+    parameter also accepts the path to a Parquet or Arrow IPC file (or a PyArrow schema), in which
+    case the schema is read from the file's metadata without reading any data. The schema object
+    can be printed to display the column names and dtypes. Note that if `tbl=` is provided then
+    there shouldn't be any other inputs provided through either `columns=` or `**kwargs`.
 
     Parameters
     ----------
@@ -40,9 +45,9 @@ class Schema:
         dtypes), or a dictionary containing column and dtype information. If any of these inputs are
         provided here, it will take precedence over any column arguments provided via `**kwargs`.
     tbl
-        A DataFrame (Polars or Pandas) or an Ibis table object from which the schema will be
-        collected. Read the *Supported Input Table Types* section for details on the supported
-        table types.
+        A DataFrame (Polars or Pandas), an Ibis table object, the path to a Parquet or Arrow IPC
+        file, or a PyArrow schema from which the schema will be collected. Read the *Supported
+        Input Table Types* section for details on the supported table types.
     **kwargs
         Individual column arguments that are in the form of `column=dtype` or
         `column=[dtype1, dtype2, ...]`. These will be ignored if the `columns=` parameter is not
@@ -64,12 +69,20 @@ class Schema:
     - PostgreSQL table (`"postgresql"`)*
     - SQLite table (`"sqlite"`)*
     - Parquet table (`"parquet"`)*
+    - Parquet file path (`"parquet_file"`)**
+    - Arrow IPC (Feather) file path (`"arrow_file"`)**
+    - PyArrow schema (`"pyarrow"`)**
 
     The table types marked with an asterisk need to be prepared as Ibis tables (with type of
     `ibis.expr.types.relations.Table`). Furthermore, using `Schema(tbl=)` with these types of tables
     requires the Ibis library (`v9.5.0` or above) to be installed. If the input table is a Polars or
     Pandas DataFrame, the availability of Ibis is not needed.
 
+    The inputs marked with two asterisks require the PyArrow library. A file is recognized by its
+    extension (`.parquet` or `.pq` for Parquet files and `.arrow`, `.feather`, or `.ipc` for Arrow
+    IPC files) and the dtypes are those of the file's Arrow schema (e.g., `"int64"`, `"double"`,
+    or `"string"`).
+
     Additional Notes on Schema Construction
     ---------------------------------------
     While there is flexibility in how a schema can be constructed, there is the potential for some
@@ -294,6 +307,10 @@ class Schema:
         self.__post_init__()
 
     def __post_init__(self):
+        # Normalized columns used for comparisons are computed when first needed
+        self._normalized_columns = {}
+        self._normalized_columns_src = None
+
         if self.columns is not None:
             self._validate_schema_inputs()
         if self.tbl is not None:
@@ -301,7 +318,7 @@ class Schema:
 
         # Get the table type and store as an attribute (only if a table is provided)
         if self.tbl is not None:
-            self.tbl_type = _get_tbl_type(self.tbl)
+            self.tbl_type = "pyarrow" if _is_arrow_schema(self.tbl) else _get_tbl_type(self.tbl)
 
     def _validate_schema_inputs(self):
         if not isinstance(self.columns, list):
@@ -311,11 +328,21 @@ class Schema:
             raise ValueError("All elements of `columns` must be tuples.")
 
     def _collect_schema_from_table(self):
+        # A PyArrow schema provides the column names and dtypes directly
+        if _is_arrow_schema(self.tbl):
+            self.columns = [(field.name, str(field.type)) for field in self.tbl]
+            return
+
         # Determine if this table can be converted to a Narwhals DataFrame
         table_type = _get_tbl_type(self.tbl)
 
         # Collect column names and dtypes from the DataFrame and store as a list of tuples
-        if table_type == "pandas":
+        if table_type in ["parquet_file", "arrow_file"]:
+            # Only the schema in the file's metadata is read
+            arrow_schema = _get_table_file_schema(path=self.tbl, file_type=table_type)
+            self.columns = [(field.name, str(field.type)) for field in arrow_schema]
+
+        elif table_type == "pandas":
             schema_dict = dict(self.tbl.dtypes)
             schema_dict = {k: str(v) for k, v in schema_dict.items()}
             self.columns = list(schema_dict.items())
@@ -335,24 +362,55 @@ class Schema:
                 "The provided table object cannot be converted to a Narwhals DataFrame."
             )
 
-    def _compare_schema_columns_complete_in_order(
+    def _get_normalized_columns(
+        self, case_sensitive_colnames: bool, case_sensitive_dtypes: bool
+    ) -> _NormalizedColumns:
+        """
+        Get the column names and dtypes of the schema, normalized for comparisons.
+
+        The normalized columns are computed once for each combination of the case-sensitivity
+        options and then reused by every comparison involving this schema.
+        """
+
+        # Any cached values are out of date if the columns were replaced
+        if self._normalized_columns_src is not self.columns:
+            self._normalized_columns = {}
+            self._normalized_columns_src = self.columns
+
+        key = (case_sensitive_colnames, case_sensitive_dtypes)
+
+        if key not in self._normalized_columns:
+            self._normalized_columns[key] = _normalize_columns(
+                columns=self.columns,
+                case_sensitive_colnames=case_sensitive_colnames,
+                case_sensitive_dtypes=case_sensitive_dtypes,
+            )
+
+        return self._normalized_columns[key]
+
+    def _compare_schema_columns(
         self,
         other: Schema,
+        complete: bool,
+        in_order: bool,
         case_sensitive_colnames: bool,
         case_sensitive_dtypes: bool,
         full_match_dtypes: bool,
     ) -> bool:
         """
-        Compare the columns of the schema with another schema. Ensure that all column names are the
-        same and that they are in the same order. This method is performed when:
+        Compare the columns of the schema with another schema in a single pass.
 
-        - `complete`: True
-        - `in_order`: True
+        Each column of the schema is looked up by name in the other schema (instead of searching
+        through its list of columns) so the comparison takes linear time in the number of columns.
 
         Parameters
         ----------
         other
             The other schema to compare against.
+        complete
+            Whether all columns of the other schema must be in the schema.
+        in_order
+            Whether the columns must be in the same order in both schemas.
 
         Returns
         -------
@@ -360,57 +418,98 @@ class Schema:
             True if the columns are the same, False otherwise.
         """
 
-        if not case_sensitive_colnames:
-            this_column_list = [col.lower() for col in self.get_column_list()]
-            other_column_list = [col.lower() for col in other.get_column_list()]
-        else:
-            this_column_list = self.get_column_list()
-            other_column_list = other.get_column_list()
+        this_columns = self._get_normalized_columns(
+            case_sensitive_colnames=case_sensitive_colnames,
+            case_sensitive_dtypes=case_sensitive_dtypes,
+        )
+        other_columns = other._get_normalized_columns(
+            case_sensitive_colnames=case_sensitive_colnames,
+            case_sensitive_dtypes=case_sensitive_dtypes,
+        )
 
         # Check if the column lists are the same length, this is a quick check to determine
-        # if the schemas are different
-        if len(this_column_list) != len(other_column_list):
+        # if complete schemas are different
+        if complete and len(this_columns.colnames) != len(other_columns.colnames):
             return False
 
         # Check that the column names are the same in both schemas and in the same order
-        if this_column_list != other_column_list:
+        if complete and in_order and this_columns.colnames != other_columns.colnames:
             return False
 
-        # Iteratively move through the columns in `this_column_list` and determine if the dtype of
-        # the column in `this_column_list` is the same as the dtype in `other_column_list`
-        for col in this_column_list:
-            # Skip dtype checks if the tuple value of `col` only contains the column name
-            # (i.e., is a single element tuple)
-            if len(self.columns[this_column_list.index(col)]) == 1:
-                continue
+        # Move through the columns of the schema and determine if:
+        # - the column is present in the other schema
+        # - the dtype of the column matches the dtype in the other schema (if a dtype is given)
+        for col, position in this_columns.positions.items():
+            other_position = other_columns.positions.get(col)
 
-            this_dtype = self.columns[this_column_list.index(col)][1]
-            other_dtype = other.columns[other_column_list.index(col)][1]
+            if other_position is None:
+                return False
 
-            # There may be multiple dtypes for a column, so we need to promote scalar dtypes to
-            # lists before iterating through them
-            if isinstance(this_dtype, str):
-                this_dtype = [this_dtype]
+            this_dtypes = this_columns.dtypes[position]
 
-            dtype_matches = []
+            # Skip dtype checks if the column only has a name
+            if this_dtypes is None:
+                continue
 
-            for i in range(len(this_dtype)):
-                if not case_sensitive_dtypes:
-                    this_dtype[i] = this_dtype[i].lower()
-                    other_dtype = other_dtype.lower()
+            other_dtypes = other_columns.dtypes[other_position]
 
-                if full_match_dtypes and this_dtype[i] == other_dtype:
-                    dtype_matches.append(True)
+            if (
+                other_dtypes is None
+                or _get_dtype_match_pos(
+                    dtypes=this_dtypes,
+                    dtype_tgt=other_dtypes[0],
+                    full_match_dtypes=full_match_dtypes,
+                )
+                is None
+            ):
+                return False
 
-                if not full_match_dtypes and this_dtype[i] in other_dtype:
-                    dtype_matches.append(True)
+        # With the subset of columns in the schema, ensure that the columns are in the same order
+        # in the other schema
+        if in_order and not complete:
+            other_colnames_subset = [
+                col for col in other_columns.colnames if col in this_columns.positions
+            ]
 
-            # If there are no matches for any of the dtypes provided, return False
-            if not any(dtype_matches):
+            if this_columns.colnames != other_colnames_subset:
                 return False
 
         return True
 
+    def _compare_schema_columns_complete_in_order(
+        self,
+        other: Schema,
+        case_sensitive_colnames: bool,
+        case_sensitive_dtypes: bool,
+        full_match_dtypes: bool,
+    ) -> bool:
+        """
+        Compare the columns of the schema with another schema. Ensure that all column names are the
+        same and that they are in the same order. This method is performed when:
+
+        - `complete`: True
+        - `in_order`: True
+
+        Parameters
+        ----------
+        other
+            The other schema to compare against.
+
+        Returns
+        -------
+        bool
+            True if the columns are the same, False otherwise.
+        """
+
+        return self._compare_schema_columns(
+            other=other,
+            complete=True,
+            in_order=True,
+            case_sensitive_colnames=case_sensitive_colnames,
+            case_sensitive_dtypes=case_sensitive_dtypes,
+            full_match_dtypes=full_match_dtypes,
+        )
+
     def _compare_schema_columns_complete_any_order(
         self,
         other: Schema,
@@ -436,63 +535,14 @@ class Schema:
             True if the columns are the same, False otherwise.
         """
 
-        if not case_sensitive_colnames:
-            this_column_list = [col.lower() for col in self.get_column_list()]
-            other_column_list = [col.lower() for col in other.get_column_list()]
-        else:
-            this_column_list = self.get_column_list()
-            other_column_list = other.get_column_list()
-
-        # Check if the column names lists are the same length, this is a quick check to determine
-        # if the schemas are different
-        if len(this_column_list) != len(other_column_list):
-            return False
-
-        # Iteratively move through the columns in `this_column_list` and determine if:
-        # - the column is present in `other_column_list` at the same index
-        # - the dtype of the column in `this_column_list` is the same as the dtype in
-        #   `other_column_list`
-        for col in this_column_list:
-            if col not in other_column_list:
-                return False
-            else:
-                # Skip dtype checks if the tuple value of `col` only contains the column name
-                # (i.e., is a single element tuple)
-                if len(self.columns[this_column_list.index(col)]) == 1:
-                    continue
-
-                this_dtype = self.columns[this_column_list.index(col)][1]
-
-                # The corresponding column in the other schema is present but not necessarily at
-                # the same index; get the index of the column in the other schema
-                other_col_index = other_column_list.index(col)
-
-                # Get the dtype of the column in the other schema
-                other_dtype = other.columns[other_col_index][1]
-
-                # There may be multiple dtypes for a column, so we need to promote scalar dtypes to
-                # lists before iterating through them
-                if isinstance(this_dtype, str):
-                    this_dtype = [this_dtype]
-
-                dtype_matches = []
-
-                for i in range(len(this_dtype)):
-                    if not case_sensitive_dtypes:
-                        this_dtype[i] = this_dtype[i].lower()
-                        other_dtype = other_dtype.lower()
-
-                    if full_match_dtypes and this_dtype[i] == other_dtype:
-                        dtype_matches.append(True)
-
-                    if not full_match_dtypes and this_dtype[i] in other_dtype:
-                        dtype_matches.append(True)
-
-                # If there are no matches for any of the dtypes provided, return False
-                if not any(dtype_matches):
-                    return False
-
-        return True
+        return self._compare_schema_columns(
+            other=other,
+            complete=True,
+            in_order=False,
+            case_sensitive_colnames=case_sensitive_colnames,
+            case_sensitive_dtypes=case_sensitive_dtypes,
+            full_match_dtypes=full_match_dtypes,
+        )
 
     def _compare_schema_columns_subset_in_order(
         self,
@@ -520,65 +570,14 @@ class Schema:
             True if the columns are the same, False otherwise.
         """
 
-        if not case_sensitive_colnames:
-            this_column_list = [col.lower() for col in self.get_column_list()]
-            other_column_list = [col.lower() for col in other.get_column_list()]
-        else:
-            this_column_list = self.get_column_list()
-            other_column_list = other.get_column_list()
-
-        # Iteratively move through the columns in `this_column_list` and determine if:
-        # - the column is present in `other_column_list`
-        # - the dtype of the column in `this_column_list` is the same as the dtype in
-        #   `other_column_list`
-        for col in this_column_list:
-            if col not in other_column_list:
-                return False
-            else:
-                # Skip dtype checks if the tuple value of `col` only contains the column name
-                # (i.e., is a single element tuple)
-                if len(self.columns[this_column_list.index(col)]) == 1:
-                    continue
-
-                this_dtype = self.columns[this_column_list.index(col)][1]
-
-                # The corresponding column in the other schema is present but not necessarily at
-                # the same index; get the index of the column in the other schema
-                other_col_index = other_column_list.index(col)
-
-                # Get the dtype of the column in the other schema
-                other_dtype = other.columns[other_col_index][1]
-
-                # There may be multiple dtypes for a column, so we need to promote scalar dtypes to
-                # lists before iterating through them
-                if isinstance(this_dtype, str):
-                    this_dtype = [this_dtype]
-
-                dtype_matches = []
-
-                for i in range(len(this_dtype)):
-                    if not case_sensitive_dtypes:
-                        this_dtype[i] = this_dtype[i].lower()
-                        other_dtype = other_dtype.lower()
-
-                    if full_match_dtypes and this_dtype[i] == other_dtype:
-                        dtype_matches.append(True)
-
-                    if not full_match_dtypes and this_dtype[i] in other_dtype:
-                        dtype_matches.append(True)
-
-                # If there are no matches for any of the dtypes provided, return False
-                if not any(dtype_matches):
-                    return False
-
-        # With the subset of columns in `this_column_list`, ensure that the columns are in the same
-        # order in `other_column_list`
-        other_column_list_subset = [col for col in other_column_list if col in this_column_list]
-
-        if this_column_list != other_column_list_subset:
-            return False
-
-        return True
+        return self._compare_schema_columns(
+            other=other,
+            complete=False,
+            in_order=True,
+            case_sensitive_colnames=case_sensitive_colnames,
+            case_sensitive_dtypes=case_sensitive_dtypes,
+            full_match_dtypes=full_match_dtypes,
+        )
 
     def _compare_schema_columns_subset_any_order(
         self,
@@ -606,53 +605,14 @@ class Schema:
             True if the columns are the same, False otherwise.
         """
 
-        if not case_sensitive_colnames:
-            this_column_list = [col.lower() for col in self.get_column_list()]
-            other_column_list = [col.lower() for col in other.get_column_list()]
-        else:
-            this_column_list = self.get_column_list()
-            other_column_list = other.get_column_list()
-
-        # Iteratively move through the columns in `this_column_list` and determine if:
-        # - the column is present in `other_column_list`
-        # - the dtype of the column in `this_column_list` is the same as the dtype in
-        #   `other_column_list`
-
-        for col in this_column_list:
-            if col not in other_column_list:
-                return False
-            else:
-                # Skip dtype checks if the tuple value of `col` only contains the column name
-                # (i.e., is a single element tuple)
-                if len(self.columns[this_column_list.index(col)]) == 1:
-                    continue
-
-                this_dtype = self.columns[this_column_list.index(col)][1]
-                other_dtype = other.columns[other_column_list.index(col)][1]
-
-                # There may be multiple dtypes for a column, so we need to promote scalar dtypes to
-                # lists before iterating through them
-                if isinstance(this_dtype, str):
-                    this_dtype = [this_dtype]
-
-                dtype_matches = []
-
-                for i in range(len(this_dtype)):
-                    if not case_sensitive_dtypes:
-                        this_dtype[i] = this_dtype[i].lower()
-                        other_dtype = other_dtype.lower()
-
-                    if full_match_dtypes and this_dtype[i] == other_dtype:
-                        dtype_matches.append(True)
-
-                    if not full_match_dtypes and this_dtype[i] in other_dtype:
-                        dtype_matches.append(True)
-
-                # If there are no matches for any of the dtypes provided, return False
-                if not any(dtype_matches):
-                    return False
-
-        return True
+        return self._compare_schema_columns(
+            other=other,
+            complete=False,
+            in_order=False,
+            case_sensitive_colnames=case_sensitive_colnames,
+            case_sensitive_dtypes=case_sensitive_dtypes,
+            full_match_dtypes=full_match_dtypes,
+        )
 
     def get_tbl_type(self) -> str:
         """
@@ -734,6 +694,12 @@ class Schema:
         return f"Schema(columns={self.columns})"
 
 
+def _is_arrow_schema(obj: any) -> bool:
+    pa = get_pyarrow()
+
+    return pa is not None and isinstance(obj, pa.Schema)
+
+
 def _process_columns(
     *, columns: str | list[str] | list[tuple[str, str]] | dict[str, str] | None = None, **kwargs
 ) -> list[tuple[str, str]]:
@@ -770,6 +736,60 @@ def _process_columns(
     return list(kwargs.items())
 
 
+@dataclass
+class _NormalizedColumns:
+    """
+    The column names and dtypes of a schema, normalized for comparisons.
+
+    The `colnames` and `dtypes` lists follow the order of the columns in the schema (where
+    `dtypes` holds a tuple of the acceptable dtypes for each column, or `None` if the column only
+    has a name). The `positions` dictionary maps each column name to its first position.
+    """
+
+    colnames: list[str]
+    positions: dict[str, int]
+    dtypes: list[tuple[str, ...] | None]
+
+
+def _normalize_columns(
+    columns: list[tuple], case_sensitive_colnames: bool, case_sensitive_dtypes: bool
+) -> _NormalizedColumns:
+    colnames = []
+    positions = {}
+    dtypes = []
+
+    for position, column in enumerate(columns):
+        colname = column[0] if case_sensitive_colnames else column[0].lower()
+
+        if len(column) == 1:
+            dtype = None
+        else:
+            dtype = (column[1],) if isinstance(column[1], str) else tuple(column[1])
+
+            if not case_sensitive_dtypes:
+                dtype = tuple(x.lower() for x in dtype)
+
+        colnames.append(colname)
+        positions.setdefault(colname, position)
+        dtypes.append(dtype)
+
+    return _NormalizedColumns(colnames=colnames, positions=positions, dtypes=dtypes)
+
+
+def _get_dtype_match_pos(
+    dtypes: tuple[str, ...], dtype_tgt: str, full_match_dtypes: bool
+) -> int | None:
+    """
+    Get the position of the first dtype in `dtypes` that matches the target dtype (if any).
+    """
+
+    for i, dtype in enumerate(dtypes):
+        if dtype == dtype_tgt if full_match_dtypes else dtype in dtype_tgt:
+            return i
+
+    return None
+
+
 def _schema_info_generate_colname_dict(
     colname_matched: bool,
     index_matched: bool,
@@ -944,42 +964,57 @@ def _get_schema_validation_info(
     # Get the columns of the expected schema
     exp_colnames = schema_exp.get_column_list()
 
+    # Get the (case-sensitive) positions of the columns and the normalized dtypes of both schemas;
+    # all lookups of columns below are made with these instead of searching the column lists
+    tgt_columns = schema_tgt._get_normalized_columns(
+        case_sensitive_colnames=True, case_sensitive_dtypes=case_sensitive_dtypes
+    )
+    exp_columns = schema_exp._get_normalized_columns(
+        case_sensitive_colnames=True, case_sensitive_dtypes=case_sensitive_dtypes
+    )
+
     # Create a mapping of lowercased column names to original names in the target table schema
     tgt_colname_mapping = {col.lower(): col for col in tgt_colnames}
 
     if case_sensitive_colnames:
         # Which columns are in both the target table and the expected schema?
-        columns_found = [col for col in exp_colnames if col in tgt_colnames]
+        columns_found = [col for col in exp_colnames if col in tgt_columns.positions]
 
         # Which columns from the expected schema aren't in the target table?
-        columns_unmatched = [col for col in exp_colnames if col not in tgt_colnames]
+        columns_unmatched = [col for col in exp_colnames if col not in tgt_columns.positions]
 
         # Which columns are in the target table but not in the expected schema?
-        columns_not_found = [col for col in tgt_colnames if col not in exp_colnames]
+        columns_not_found = [col for col in tgt_colnames if col not in exp_columns.positions]
 
     else:
-        # Convert expected column names to lowercase for case-insensitive comparison
-        exp_colnames_lower = [col.lower() for col in exp_colnames]
+        # Get the set of lowercased expected column names for case-insensitive comparison
+        exp_colnames_lower = {col.lower() for col in exp_colnames}
 
         # Which columns are in both the target table and the expected schema?
         columns_found = [
-            tgt_colname_mapping[col.lower()] for col in exp_colnames if col.lower() in tgt_colnames
+            tgt_colname_mapping[col.lower()]
+            for col in exp_colnames
+            if col.lower() in tgt_columns.positions
         ]
 
         # Which columns from the expected schema aren't in the target table?
-        columns_unmatched = [col for col in exp_colnames if col.lower() not in tgt_colnames]
+        columns_unmatched = [
+            col for col in exp_colnames if col.lower() not in tgt_columns.positions
+        ]
 
         # Which columns are in the target table but not in the expected schema?
         columns_not_found = [col for col in tgt_colnames if col.lower() not in exp_colnames_lower]
 
     # Sort `columns_found` based on the order of tgt_colnames
-    columns_found_sorted = sorted(columns_found, key=lambda col: tgt_colnames.index(col))
+    columns_found_sorted = sorted(columns_found, key=lambda col: tgt_columns.positions[col])
 
     # Update the schema information dictionary
     schema_info["columns_found"] = columns_found_sorted
     schema_info["columns_not_found"] = columns_not_found
     schema_info["columns_unmatched"] = columns_unmatched
 
+    columns_found_set = set(columns_found)
+
     # If the number of columns matched is the same as the number of columns in the expected schema,
     # test if:
     # - all columns are matched in the target table in the same order
@@ -996,7 +1031,7 @@ def _get_schema_validation_info(
             # Check if the columns are matched in order
             schema_info["columns_matched_in_order"] = True
 
-        elif set(columns_found) == set(tgt_colnames):
+        elif columns_found_set == set(tgt_colnames):
             # Check if the columns are matched in any order
             schema_info["columns_matched_any_order"] = True
 
@@ -1009,7 +1044,7 @@ def _get_schema_validation_info(
         schema_info["columns_subset"] = True
 
         # Filter the columns in the target table that are matched
-        tgt_colnames_matched = [col for col in tgt_colnames if col in columns_found]
+        tgt_colnames_matched = [col for col in tgt_colnames if col in columns_found_set]
 
         # If the columns are matched in order, set `columns_matched_in_order` to True; do this
         # for case-sensitive and case-insensitive comparisons
@@ -1017,7 +1052,7 @@ def _get_schema_validation_info(
             if columns_found == tgt_colnames_matched:
                 schema_info["columns_matched_in_order"] = True
 
-            elif set(columns_found) == set(tgt_colnames_matched):
+            elif columns_found_set == set(tgt_colnames_matched):
                 schema_info["columns_matched_any_order"] = True
 
         else:
@@ -1031,6 +1066,14 @@ def _get_schema_validation_info(
             ):
                 schema_info["columns_matched_any_order"] = True
 
+    # For case-insensitive matching, map each lowercased column name to the first found column
+    # with that name
+    columns_found_by_lower = {}
+
+    if not case_sensitive_colnames:
+        for col in columns_found:
+            columns_found_by_lower.setdefault(col.lower(), col)
+
     # For each column in the expected schema, determine if the column name is matched
     # and if the dtype is matched
     colname_dict = []
@@ -1042,7 +1085,7 @@ def _get_schema_validation_info(
 
         if case_sensitive_colnames:
             # Does the column name have a match in the expected schema?
-            colname_matched = col in columns_found
+            colname_matched = col in columns_found_set
 
             # If the column name is matched, get the column name in the target table
             if colname_matched:
@@ -1052,29 +1095,29 @@ def _get_schema_validation_info(
         else:
             # Does the column name have a match in the expected schema? A lowercase comparison
             # is used here to determine if the column name is matched
-            colname_matched = col.lower() in columns_found
+            colname_matched = col.lower() in columns_found_set
 
             # If the column name is matched, get the column name in the target table; this involves
             # mapping the lowercase column name to the original column name in the target table
             if colname_matched:
-                matched_to = tgt_colname_mapping[
-                    columns_found[[col.lower() for col in columns_found].index(col.lower())]
-                ]
+                matched_to = tgt_colname_mapping[columns_found_by_lower[col.lower()]]
             else:
                 matched_to = None
 
+        exp_position = exp_columns.positions[col]
+
         # Does the index match that of the target table?
         if matched_to is not None:
-            index_matched = exp_colnames.index(col) == tgt_colnames.index(matched_to)
+            index_matched = exp_position == tgt_columns.positions[matched_to]
         else:
             index_matched = False
 
         # Get the dtype of the column in the expected schema
         # If there is a dtype for the column in the expected schema, get it
-        if len(schema_exp.columns[exp_colnames.index(col)]) == 1:
+        if len(schema_exp.columns[exp_position]) == 1:
             dtype_input = None
         else:
-            dtype_input = schema_exp.columns[exp_colnames.index(col)][1]
+            dtype_input = schema_exp.columns[exp_position][1]
 
         if isinstance(dtype_input, str):
             dtype_input = [dtype_input]
@@ -1087,41 +1130,23 @@ def _get_schema_validation_info(
         #
 
         if colname_matched and dtype_present:
-            # Get the dtype of the column in the target table
-            dtype_tgt = schema_tgt.columns[tgt_colnames.index(matched_to)][1]
-
-            # Determine if the dtype of the column in the expected schema is matched
-            dtype_matches = []
-            dtype_matches_pos = []
-
-            # Iterate through the dtypes of the column in the expected schema and determine if
-            # any of them match the dtype of the column in the target table
-            for i in range(len(dtype_input)):
-                if not case_sensitive_dtypes:
-                    dtype_input[i] = dtype_input[i].lower()
-                    dtype_tgt = dtype_tgt.lower()
-
-                if full_match_dtypes and dtype_input[i] == dtype_tgt:
-                    dtype_matches.append(True)
-                    dtype_matches_pos.append(i)
-
-                if not full_match_dtypes and dtype_input[i] in dtype_tgt:
-                    dtype_matches.append(True)
-                    dtype_matches_pos.append(i)
+            # Use the normalized dtypes of the column in both schemas
+            dtype_input = list(exp_columns.dtypes[exp_position])
+            dtype_tgt = tgt_columns.dtypes[tgt_columns.positions[matched_to]][0]
+
+            # Get the position of the first dtype in the expected schema that matches the dtype
+            # of the column in the target table (if there is a match)
+            dtype_matched_pos = _get_dtype_match_pos(
+                dtypes=exp_columns.dtypes[exp_position],
+                dtype_tgt=dtype_tgt,
+                full_match_dtypes=full_match_dtypes,
+            )
 
-            # If there are no matches for any of the dtypes provided, set `dtype_matched` to False
-            dtype_matched = any(dtype_matches)
+            dtype_matched = dtype_matched_pos is not None
 
             # If there are multiple dtypes for a column, set `dtype_multiple` to True
             dtype_multiple = len(dtype_input) > 1
 
-            # Even if there are multiple matches for the dtype, we simply get the first position
-            # of the matched dtype
-            if dtype_matched:
-                dtype_matched_pos = dtype_matches_pos[0]
-            else:
-                dtype_matched_pos = None
-
         else:
             dtype_matched = False
             dtype_multiple = False
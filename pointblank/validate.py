@@ -3,18 +3,22 @@ from __future__ import annotations
 import base64
 import copy
 import datetime
+import hashlib
 import inspect
 import json
 import re
 from dataclasses import dataclass
+from functools import reduce
+from html import unescape
 from importlib.metadata import version
 from typing import TYPE_CHECKING, Any, Callable, Literal
 from zipfile import ZipFile
 
 import commonmark
 import narwhals as nw
-from great_tables import GT, from_column, google_font, html, loc, style, vals
+from great_tables import GT, google_font, html, loc, style, vals
 from importlib_resources import files
+from narwhals.dependencies import is_pandas_dataframe
 from narwhals.typing import FrameT
 
 from pointblank._constants import (
@@ -30,6 +34,7 @@ from pointblank._constants import (
     SEVERITY_LEVEL_COLORS,
     SVG_ICONS_FOR_ASSERTION_TYPES,
     SVG_ICONS_FOR_TBL_STATUS,
+    TABLE_FILE_VALIDATION_TYPES,
     VALIDATION_REPORT_FIELDS,
 )
 from pointblank._constants_expect_fail import EXPECT_FAIL_TEXT
@@ -45,13 +50,20 @@ from pointblank._interrogation import (
     NumberOfTestUnits,
     RowCountMatch,
     RowsDistinct,
+    _get_ibis_extract,
+    _get_ibis_row_number,
+    _get_ibis_sampled_extract,
+    _get_ibis_test_unit_counts,
+    _get_local_extract,
 )
+from pointblank._predicates import And, FillNull, _build_predicate
 from pointblank._utils import (
     _check_any_df_lib,
     _check_invalid_fields,
     _derive_bounds,
     _format_to_integer_value,
     _get_fn_name,
+    _get_table_file_type,
     _get_tbl_type,
     _is_lib_present,
     _is_value_a_df,
@@ -65,8 +77,30 @@ from pointblank._utils_check_args import (
     _check_thresholds,
     _check_value_float_int,
 )
+from pointblank._utils_extract import (
+    _collect_extract_with_budget,
+    _ExtractBudget,
+    _get_spilled_extract_preview,
+    _is_spilled_extract,
+    _iter_ibis_extract_batches,
+    _iter_local_extract_batches,
+    _parse_extract_limit,
+)
 from pointblank._utils_html import _create_table_dims_html, _create_table_type_html
-from pointblank.column import Column, ColumnLiteral, ColumnSelector, ColumnSelectorNarwhals, col
+from pointblank._utils_parquet import (
+    _get_parquet_row_count,
+    _get_parquet_step_counts,
+    _get_table_file_row_count,
+    _get_table_file_schema,
+)
+from pointblank.column import (
+    Column,
+    ColumnLiteral,
+    ColumnSelector,
+    ColumnSelectorNarwhals,
+    _resolve_column_expr,
+    col,
+)
 from pointblank.schema import Schema, _get_schema_validation_info
 from pointblank.thresholds import (
     Actions,
@@ -472,8 +506,8 @@ def _generate_display_table(
     mark_missing_values: bool = True,
     row_number_list: list[int] | None = None,
 ) -> GT:
-    # Make a copy of the data to avoid modifying the original
-    data = copy.deepcopy(data)
+    # The input table is never copied: only the head and tail rows are materialized for display
+    # and any changes (like adding row numbers) are made to those rows
 
     # Does the data table already have a leading row number column?
     if "_row_num_" in data.columns:
@@ -520,6 +554,8 @@ def _generate_display_table(
     n_columns = len(data.columns)
 
     # If `columns_subset=` is not None, resolve the columns to display
+    resolved_columns = None
+
     if columns_subset is not None:
         col_names = _get_column_names(data, ibis_tbl=ibis_tbl, df_lib_name_gt=df_lib_name_gt)
 
@@ -532,56 +568,52 @@ def _generate_display_table(
                 "The `columns_subset=` value doesn't resolve to any columns in the table."
             )
 
-        # Select the columns to display in the table with the `resolved_columns` value
-        data = _select_columns(
-            data, resolved_columns=resolved_columns, ibis_tbl=ibis_tbl, tbl_type=tbl_type
-        )
+        # Select the columns to display in an Ibis table with the `resolved_columns` value (the
+        # columns of a DataFrame are selected once its head and tail rows are sliced off)
+        if ibis_tbl:
+            data = _select_columns(
+                data, resolved_columns=resolved_columns, ibis_tbl=ibis_tbl, tbl_type=tbl_type
+            )
 
-    # From an Ibis table:
-    # - get the row count
-    # - subset the table to get the first and last n rows (if small, don't filter the table)
-    # - get the row numbers for the table
-    # - convert the table to a Polars or Pandas DF
+    # From an Ibis table (with a row count query and then a single query for the rows):
+    # - get the row count (a cheap aggregate, often answered from metadata)
+    # - get the first and last n rows, in order (if small, this is the entire table)
+    # - get the row numbers for these rows
+    # - convert the rows to a Polars or Pandas DF
     if ibis_tbl:
         # Get the Schema of the table
         tbl_schema = Schema(tbl=data)
 
-        # Get the row count for the table
-        ibis_rows = data.count()
-        n_rows = ibis_rows.to_polars() if df_lib_name_gt == "polars" else int(ibis_rows.to_pandas())
+        # Get the row count for the table (through PyArrow, since `execute()` requires Pandas)
+        n_rows = int(data.count().to_pyarrow().as_py())
 
         # If n_head + n_tail is greater than the row count, display the entire table
-        if n_head + n_tail > n_rows:
+        if n_head + n_tail >= n_rows:
             full_dataset = True
-            data_subset = data
 
             if row_number_list is None:
                 row_number_list = range(1, n_rows + 1)
-        else:
-            # Get the first and last n rows of the table
-            data_head = data.head(n_head)
-            row_numbers_head = range(1, n_head + 1)
-            data_tail = data[(n_rows - n_tail) : n_rows]
-            row_numbers_tail = range(n_rows - n_tail + 1, n_rows + 1)
-            data_subset = data_head.union(data_tail)
 
-            if row_number_list is None:
-                row_number_list = list(row_numbers_head) + list(row_numbers_tail)
+        elif row_number_list is None:
+            row_number_list = list(range(1, n_head + 1)) + list(
+                range(n_rows - n_tail + 1, n_rows + 1)
+            )
+
+        preview_query = _get_ibis_head_tail_query(data, n_head=n_head, n_tail=n_tail, n_rows=n_rows)
 
         # Convert either to Polars or Pandas depending on the available library
         if df_lib_name_gt == "polars":
-            data = data_subset.to_polars()
+            preview_tbl = nw.from_native(preview_query.to_polars())
         else:
-            data = data_subset.to_pandas()
+            preview_tbl = nw.from_native(preview_query.to_pandas())
+
+        data = nw.maybe_reset_index(preview_tbl.drop("_pb_part_", "_pb_pos_")).to_native()
 
     # From a DataFrame:
     # - get the row count
     # - subset the table to get the first and last n rows (if small, don't filter the table)
     # - get the row numbers for the table
     if pl_pb_tbl:
-        # Get the Schema of the table
-        tbl_schema = Schema(tbl=data)
-
         if tbl_type == "polars":
             n_rows = int(data.height)
 
@@ -589,6 +621,10 @@ def _generate_display_table(
             if n_head + n_tail >= n_rows:
                 full_dataset = True
 
+                # Row numbers may be inserted into the table, so use a clone (which doesn't copy
+                # the data) to leave the input table unchanged
+                data = data.clone()
+
                 if row_number_list is None:
                     row_number_list = range(1, n_rows + 1)
 
@@ -606,7 +642,10 @@ def _generate_display_table(
             # If n_head + n_tail is greater than the row count, display the entire table
             if n_head + n_tail >= n_rows:
                 full_dataset = True
-                data_subset = data
+
+                # Row numbers may be inserted into the table, so use a shallow copy (which doesn't
+                # copy the data) to leave the input table unchanged
+                data = data.copy(deep=False)
 
                 row_number_list = range(1, n_rows + 1)
             else:
@@ -616,6 +655,15 @@ def _generate_display_table(
                     range(n_rows - n_tail + 1, n_rows + 1)
                 )
 
+        # Select the columns to display from the head and tail rows
+        if resolved_columns is not None:
+            data = _select_columns(
+                data, resolved_columns=resolved_columns, ibis_tbl=ibis_tbl, tbl_type=tbl_type
+            )
+
+        # Get the Schema of the table
+        tbl_schema = Schema(tbl=data)
+
     # From the table schema, get a list of tuples containing column names and data types
     col_dtype_dict = tbl_schema.columns
 
@@ -877,21 +925,9 @@ def missing_vals_tbl(data: FrameT | Any) -> GT:
     sector. Many columns have no missing values at all, and those sectors are colored light blue.
     """
 
-    # Make a copy of the data to avoid modifying the original
-    data = copy.deepcopy(data)
-
-    # Get the number of rows in the table
-    n_rows = get_row_count(data)
-
     # Define the number of cut points for the missing values table
     n_cut_points = 9
 
-    # Get the cut points for the table preview
-    cut_points = _get_cut_points(n_rows=n_rows, n_cuts=n_cut_points)
-
-    # Get the row ranges for the table
-    row_ranges = _get_row_ranges(cut_points=cut_points, n_rows=n_rows)
-
     # Determine if the table is a DataFrame or an Ibis table
     tbl_type = _get_tbl_type(data=data)
     ibis_tbl = "ibis.expr.types.relations.Table" in str(type(data))
@@ -906,173 +942,39 @@ def missing_vals_tbl(data: FrameT | Any) -> GT:
     if pl_pb_tbl:
         df_lib_name_gt = "polars" if "polars" in tbl_type else "pandas"
 
-        # Handle imports of Polars or Pandas here
-        if df_lib_name_gt == "polars":
-            import polars as pl
-        else:
-            import pandas as pd
-
-    # From an Ibis table:
-    # - get the row count
-    # - get 10 cut points for table preview, these are row numbers used as buckets for determining
-    #   the proportion of missing values in each 'sector' in each column
-    if ibis_tbl:
-        # Get the column names from the table
-        col_names = list(data.columns)
-
-        # Use the `row_ranges` list of lists to query, for each column, the proportion of missing
-        # values in each 'sector' of the table (a sector is a range of rows)
-        if df_lib_name_gt == "polars":
-            missing_vals = {
-                col: [
-                    (
-                        data[(cut_points[i - 1] if i > 0 else 0) : cut_points[i]][col]
-                        .isnull()
-                        .sum()
-                        .to_polars()
-                        / (cut_points[i] - (cut_points[i - 1] if i > 0 else 0))
-                        * 100
-                        if cut_points[i] > (cut_points[i - 1] if i > 0 else 0)
-                        else 0
-                    )
-                    for i in range(len(cut_points))
-                ]
-                + [
-                    (
-                        data[cut_points[-1] : n_rows][col].isnull().sum().to_polars()
-                        / (n_rows - cut_points[-1])
-                        * 100
-                        if n_rows > cut_points[-1]
-                        else 0
-                    )
-                ]
-                for col in data.columns
-            }
-
-        else:
-            missing_vals = {
-                col: [
-                    (
-                        data[(cut_points[i - 1] if i > 0 else 0) : cut_points[i]][col]
-                        .isnull()
-                        .sum()
-                        .to_pandas()
-                        / (cut_points[i] - (cut_points[i - 1] if i > 0 else 0))
-                        * 100
-                        if cut_points[i] > (cut_points[i - 1] if i > 0 else 0)
-                        else 0
-                    )
-                    for i in range(len(cut_points))
-                ]
-                + [
-                    (
-                        data[cut_points[-1] : n_rows][col].isnull().sum().to_pandas()
-                        / (n_rows - cut_points[-1])
-                        * 100
-                        if n_rows > cut_points[-1]
-                        else 0
-                    )
-                ]
-                for col in data.columns
-            }
-
-        # Pivot the `missing_vals` dictionary to create a table with the missing value proportions
-        missing_vals = {
-            "columns": list(missing_vals.keys()),
-            **{
-                str(i + 1): [missing_vals[col][i] for col in missing_vals.keys()]
-                for i in range(len(cut_points) + 1)
-            },
-        }
-
-        # Get a dictionary of counts of missing values in each column
-        if df_lib_name_gt == "polars":
-            missing_val_counts = {col: data[col].isnull().sum().to_polars() for col in data.columns}
-        else:
-            missing_val_counts = {col: data[col].isnull().sum().to_pandas() for col in data.columns}
-
-    if pl_pb_tbl:
-        # Get the column names from the table
-        col_names = list(data.columns)
-
-        # Iterate over the cut points and get the proportion of missing values in each 'sector'
-        # for each column
-        if "polars" in tbl_type:
-            # Polars case
-            missing_vals = {
-                col: [
-                    (
-                        data[(cut_points[i - 1] if i > 0 else 0) : cut_points[i]][col]
-                        .is_null()
-                        .sum()
-                        / (cut_points[i] - (cut_points[i - 1] if i > 0 else 0))
-                        * 100
-                        if cut_points[i] > (cut_points[i - 1] if i > 0 else 0)
-                        else 0
-                    )
-                    for i in range(len(cut_points))
-                ]
-                + [
-                    (
-                        data[cut_points[-1] : n_rows][col].is_null().sum()
-                        / (n_rows - cut_points[-1])
-                        * 100
-                        if n_rows > cut_points[-1]
-                        else 0
-                    )
-                ]
-                for col in data.columns
-            }
+    # Get the column names from the table
+    col_names = list(data.columns)
 
-            missing_vals = {
-                "columns": list(missing_vals.keys()),
-                **{
-                    str(i + 1): [missing_vals[col][i] for col in missing_vals.keys()]
-                    for i in range(len(cut_points) + 1)
-                },
-            }
+    # Count the rows and the missing values of each column in each 'sector' of the table (a sector
+    # is a range of rows) with a single grouped aggregation
+    n_rows, sector_sizes, sector_missing_counts = _get_missing_vals_by_sector(
+        data=data, n_cuts=n_cut_points, ibis_tbl=ibis_tbl
+    )
 
-            # Get a dictionary of counts of missing values in each column
-            missing_val_counts = {col: data[col].is_null().sum() for col in data.columns}
+    # Get the cut points for the table preview, these are row numbers used as buckets for
+    # determining the proportion of missing values in each 'sector' in each column
+    cut_points = _get_cut_points(n_rows=n_rows, n_cuts=n_cut_points)
 
-        if "pandas" in tbl_type:
-            missing_vals = {
-                col: [
-                    (
-                        data[(cut_points[i - 1] if i > 0 else 0) : cut_points[i]][col]
-                        .isnull()
-                        .sum()
-                        / (cut_points[i] - (cut_points[i - 1] if i > 0 else 0))
-                        * 100
-                        if cut_points[i] > (cut_points[i - 1] if i > 0 else 0)
-                        else 0
-                    )
-                    for i in range(len(cut_points))
-                ]
-                + [
-                    (
-                        data[cut_points[-1] : n_rows][col].isnull().sum()
-                        / (n_rows - cut_points[-1])
-                        * 100
-                        if n_rows > cut_points[-1]
-                        else 0
-                    )
-                ]
-                for col in data.columns
-            }
+    # Get the proportion of missing values in each 'sector' for each column
+    missing_vals = {
+        col: [
+            missing_count / sector_size * 100 if sector_size > 0 else 0
+            for missing_count, sector_size in zip(sector_missing_counts[col], sector_sizes)
+        ]
+        for col in col_names
+    }
 
-            # Pivot the `missing_vals` dictionary to create a table with the missing
-            # value proportions
-            missing_vals = {
-                "columns": list(missing_vals.keys()),
-                **{
-                    str(i + 1): [missing_vals[col][i] for col in missing_vals.keys()]
-                    for i in range(len(cut_points) + 1)
-                },
-            }
+    # Pivot the `missing_vals` dictionary to create a table with the missing value proportions
+    missing_vals = {
+        "columns": list(missing_vals.keys()),
+        **{
+            str(i + 1): [missing_vals[col][i] for col in missing_vals.keys()]
+            for i in range(len(cut_points) + 1)
+        },
+    }
 
-            # Get a dictionary of counts of missing values in each column
-            missing_val_counts = {col: data[col].isnull().sum() for col in data.columns}
+    # Get a dictionary of counts of missing values in each column
+    missing_val_counts = {col: sum(sector_missing_counts[col]) for col in col_names}
 
     # From `missing_vals`, create the DataFrame with the missing value proportions
     if df_lib_name_gt == "polars":
@@ -1233,6 +1135,96 @@ def missing_vals_tbl(data: FrameT | Any) -> GT:
     return missing_vals_tbl
 
 
+def _get_missing_vals_by_sector(
+    data: FrameT | Any, n_cuts: int, ibis_tbl: bool
+) -> tuple[int, list[int], dict[str, list[int]]]:
+    """
+    Count the missing values of each column in each sector of a table.
+
+    The table is divided into `n_cuts + 1` sectors (ranges of rows) by the cut points of
+    `_get_cut_points()`: each sector has `n_rows // (n_cuts + 1)` rows, with the remaining rows in
+    the last sector. The sector of a row is its row number divided by that sector size (and capped
+    at the last sector), so all counts are obtained in one grouped aggregation: a single query for
+    an Ibis table and a single `group_by()` for a DataFrame.
+
+    Returns
+    -------
+    tuple[int, list[int], dict[str, list[int]]]
+        The number of rows in the table, the number of rows in each sector, and a dictionary with
+        the number of missing values in each sector for each column.
+    """
+
+    col_names = list(data.columns)
+    n_sectors = n_cuts + 1
+
+    if ibis_tbl:
+        import ibis
+
+        n_rows_expr = data.count().over(ibis.window())
+        sector_size = n_rows_expr // n_sectors
+
+        # Tables with fewer rows than sectors have all rows in the last sector
+        sector_expr = ibis.ifelse(
+            sector_size > 0,
+            ibis.least(ibis.row_number() // ibis.greatest(sector_size, 1), n_cuts),
+            n_cuts,
+        )
+
+        sectored = data.mutate(_pb_sector_=sector_expr)
+
+        sector_counts = (
+            sectored.group_by("_pb_sector_")
+            .aggregate(
+                _pb_n_rows_=sectored.count(),
+                **{f"_pb_{i}_": sectored[col].isnull().sum() for i, col in enumerate(col_names)},
+            )
+            .to_pyarrow()
+            .to_pylist()
+        )
+
+    else:
+        tbl = nw.from_native(data)
+        n_rows = len(tbl)
+        sector_size = n_rows // n_sectors
+
+        if sector_size > 0:
+            sector_expr = (nw.col("_pb_row_") // sector_size).clip(upper_bound=n_cuts)
+        else:
+            sector_expr = nw.lit(n_cuts)
+
+        # Only the missing-value flags of the table are used (with row numbers for the sectors)
+        sector_counts = (
+            tbl.select(
+                *[nw.col(col).is_null().alias(f"_pb_{i}_") for i, col in enumerate(col_names)]
+            )
+            .with_row_index(name="_pb_row_")
+            .with_columns(sector_expr.alias("_pb_sector_"))
+            .group_by("_pb_sector_")
+            .agg(
+                nw.len().alias("_pb_n_rows_"),
+                *[nw.col(f"_pb_{i}_").sum() for i in range(len(col_names))],
+            )
+            .rows(named=True)
+        )
+
+    sector_counts = {row["_pb_sector_"]: row for row in sector_counts}
+
+    sector_sizes = [
+        int(sector_counts[sector]["_pb_n_rows_"]) if sector in sector_counts else 0
+        for sector in range(n_sectors)
+    ]
+
+    sector_missing_counts = {
+        col: [
+            int(sector_counts[sector][f"_pb_{i}_"] or 0) if sector in sector_counts else 0
+            for sector in range(n_sectors)
+        ]
+        for i, col in enumerate(col_names)
+    }
+
+    return sum(sector_sizes), sector_sizes, sector_missing_counts
+
+
 def _get_cut_points(n_rows: int, n_cuts: int) -> list[int]:
     """
     Get the cut points for a table.
@@ -1323,6 +1315,35 @@ def _validate_columns_subset(
     return columns_subset.resolve(columns=col_names)
 
 
+def _get_ibis_head_tail_query(data: Any, n_head: int, n_tail: int, n_rows: int) -> Any:
+    """
+    Get a single query for the first and last rows of an Ibis table that has `n_rows` rows.
+
+    The head is a `LIMIT` query and the tail is a `LIMIT` query with an `OFFSET` of `n_rows -
+    n_tail` rows (a literal, since many backends don't accept an expression there and the others
+    can't use one to skip rows cheaply). The two parts are combined with `UNION ALL` and ordered by
+    the part (`_pb_part_`) and the position of each row within it (`_pb_pos_`), which is numbered
+    over the limited rows only. A small table (with no more than `n_head + n_tail` rows) is fetched
+    in full as a single part.
+    """
+
+    import ibis
+
+    if n_head + n_tail >= n_rows:
+        parts = [data.limit(n_rows)]
+    else:
+        parts = [data.limit(n_head), data.limit(n_tail, offset=n_rows - n_tail)]
+
+    parts = [
+        part.mutate(_pb_part_=ibis.literal(i, "int8"), _pb_pos_=ibis.row_number())
+        for i, part in enumerate(parts)
+    ]
+
+    return reduce(lambda x, y: x.union(y, distinct=False), parts).order_by(
+        ["_pb_part_", "_pb_pos_"]
+    )
+
+
 def _select_columns(
     data: FrameT | Any, resolved_columns: list[str], ibis_tbl: bool, tbl_type: str
 ) -> FrameT | Any:
@@ -1364,12 +1385,18 @@ def get_column_count(data: FrameT | Any) -> int:
     - PostgreSQL table (`"postgresql"`)*
     - SQLite table (`"sqlite"`)*
     - Parquet table (`"parquet"`)*
+    - Parquet file path (`"parquet_file"`)
+    - Arrow IPC (Feather) file path (`"arrow_file"`)
 
     The table types marked with an asterisk need to be prepared as Ibis tables (with type of
     `ibis.expr.types.relations.Table`). Furthermore, using `get_column_count()` with these types of
     tables requires the Ibis library (`v9.5.0` or above) to be installed. If the input table is a
     Polars or Pandas DataFrame, the availability of Ibis is not needed.
 
+    A Parquet or Arrow IPC file can be given as a path (recognized by its extension) and then
+    the number of columns is read from the file's schema, without reading any data. This requires
+    the PyArrow library.
+
     Examples
     --------
     To get the number of columns in a table, we can use the `get_column_count()` function. Here's an
@@ -1398,6 +1425,12 @@ def get_column_count(data: FrameT | Any) -> int:
     `8` for the `small_table` dataset.
     """
 
+    # For a Parquet or Arrow IPC file, the columns are read from the file's schema
+    file_type = _get_table_file_type(data=data)
+
+    if file_type is not None:
+        return len(_get_table_file_schema(path=data, file_type=file_type))
+
     if "ibis.expr.types.relations.Table" in str(type(data)):
         return len(data.columns)
 
@@ -1442,12 +1475,18 @@ def get_row_count(data: FrameT | Any) -> int:
     - PostgreSQL table (`"postgresql"`)*
     - SQLite table (`"sqlite"`)*
     - Parquet table (`"parquet"`)*
+    - Parquet file path (`"parquet_file"`)
+    - Arrow IPC (Feather) file path (`"arrow_file"`)
 
     The table types marked with an asterisk need to be prepared as Ibis tables (with type of
     `ibis.expr.types.relations.Table`). Furthermore, using `get_row_count()` with these types of
     tables requires the Ibis library (`v9.5.0` or above) to be installed. If the input table is a
     Polars or Pandas DataFrame, the availability of Ibis is not needed.
 
+    A Parquet or Arrow IPC file can be given as a path (recognized by its extension) and then
+    the number of rows is read from the file's metadata, without reading any data. This requires
+    the PyArrow library.
+
     Examples
     --------
     Getting the number of rows in a table is easily done by using the `get_row_count()` function.
@@ -1476,7 +1515,20 @@ def get_row_count(data: FrameT | Any) -> int:
     for the `game_revenue` dataset.
     """
 
+    # For a Parquet or Arrow IPC file, the row count is read from the file's metadata
+    file_type = _get_table_file_type(data=data)
+
+    if file_type is not None:
+        return _get_table_file_row_count(path=data, file_type=file_type)
+
     if "ibis.expr.types.relations.Table" in str(type(data)):
+        # For a table read from Parquet files, get the row count from the file footers
+        if _get_tbl_type(data=data) == "parquet":
+            row_count = _get_parquet_row_count(data=data)
+
+            if row_count is not None:
+                return row_count
+
         # Determine whether Pandas or Polars is available to get the row count
         _check_any_df_lib(method_used="get_row_count")
 
@@ -1499,6 +1551,117 @@ def get_row_count(data: FrameT | Any) -> int:
         raise ValueError("The input table type supplied in `data=` is not supported.")
 
 
+@dataclass
+class _DeferredExtract:
+    """
+    The recipe for the extract of failing rows in a validation step.
+
+    For a DataFrame, this holds the table that was checked and the boolean mask of the step's
+    results. For an Ibis table, this holds the unexecuted query for the extract (and no mask); the
+    sampling options are only set for seeded samples, which are drawn from the query when the
+    extract is collected. If an extract budget is given, the failing rows are streamed in batches
+    and the extract is written to a Parquet file (and returned as a lazy scan of that file) once it
+    exceeds the budget.
+    """
+
+    tbl: FrameT | Any
+    mask: nw.Series | None = None
+    get_first_n: int | None = None
+    sample_n: int | None = None
+    sample_frac: int | float | None = None
+    sample_limit: int = 5000
+    seed: int | None = None
+    budget: _ExtractBudget | None = None
+    step: int = 0
+
+    def collect(self) -> FrameT:
+        if self.budget is not None:
+            return self._collect_with_budget()
+
+        if self.mask is None:
+            df_lib = _select_df_lib(preference="polars")
+            query = self._get_ibis_query()
+
+            return query.to_polars() if df_lib.__name__ == "polars" else query.to_pandas()
+
+        return _get_local_extract(
+            tbl=self.tbl,
+            mask=self.mask,
+            get_first_n=self.get_first_n,
+            sample_n=self.sample_n,
+            sample_frac=self.sample_frac,
+            sample_limit=self.sample_limit,
+            seed=self.seed,
+        )
+
+    def _get_ibis_query(self) -> Any:
+        if self.sample_n is None and self.sample_frac is None:
+            return self.tbl
+
+        return _get_ibis_sampled_extract(
+            extract_tbl=self.tbl,
+            sample_n=self.sample_n,
+            sample_frac=self.sample_frac,
+            sample_limit=self.sample_limit,
+            seed=self.seed,
+        )
+
+    def _collect_with_budget(self) -> FrameT | Any:
+        if self.mask is None:
+            batches = _iter_ibis_extract_batches(query=self._get_ibis_query())
+            df_lib_name = _select_df_lib(preference="polars").__name__
+        else:
+            if self.sample_n is None and self.sample_frac is None:
+                batches = _iter_local_extract_batches(
+                    tbl=self.tbl, mask=self.mask, get_first_n=self.get_first_n
+                )
+            else:
+                # A sample of failing rows is already bounded in size so it's taken all at once
+                extract = _get_local_extract(
+                    tbl=self.tbl,
+                    mask=self.mask,
+                    sample_n=self.sample_n,
+                    sample_frac=self.sample_frac,
+                    sample_limit=self.sample_limit,
+                    seed=self.seed,
+                )
+                batches = iter([nw.maybe_reset_index(nw.from_native(extract)).to_arrow()])
+
+            df_lib_name = "pandas" if is_pandas_dataframe(self.tbl) else "polars"
+
+        return _collect_extract_with_budget(
+            batches=batches, budget=self.budget, step=self.step, df_lib_name=df_lib_name
+        )
+
+
+class _LazyExtract:
+    """
+    Descriptor for the `extract` attribute of `_ValidationInfo`.
+
+    A `_DeferredExtract` value is collected when the attribute is first accessed and the resulting
+    table replaces it, so the cost of obtaining an extract is paid once and only if it's needed.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        # The class-level access (used by `@dataclass` to get the default value) gives `None`
+        if instance is None:
+            return None
+
+        value = instance.__dict__.get(self.name)
+
+        if isinstance(value, _DeferredExtract):
+            value = value.collect()
+            instance.__dict__[self.name] = value
+
+        return value
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.name] = value
+
+
 @dataclass
 class _ValidationInfo:
     """
@@ -1560,7 +1723,8 @@ class _ValidationInfo:
         include a new column called `pb_is_good_` that is a boolean column that indicates whether
         the row passed the validation or not.
     extract
-        The extracted rows from the table that failed the validation step.
+        The extracted rows from the table that failed the validation step. This is obtained when
+        first accessed (the interrogation only stores how to get it).
     time_processed
         The time the validation step was processed. This is in the ISO 8601 format in UTC time.
     proc_duration_s
@@ -1596,7 +1760,7 @@ class _ValidationInfo:
     error: bool | None = None
     critical: bool | None = None
     tbl_checked: FrameT | None = None
-    extract: FrameT | None = None
+    extract: FrameT | None = _LazyExtract()
     val_info: dict[str, any] | None = None
     time_processed: str | None = None
     proc_duration_s: float | None = None
@@ -1685,12 +1849,23 @@ class Validate:
     - PostgreSQL table (`"postgresql"`)*
     - SQLite table (`"sqlite"`)*
     - Parquet table (`"parquet"`)*
+    - Parquet file path (`"parquet_file"`)**
+    - Arrow IPC (Feather) file path (`"arrow_file"`)**
 
     The table types marked with an asterisk need to be prepared as Ibis tables (with type of
     `ibis.expr.types.relations.Table`). Furthermore, the use of `Validate` with such tables requires
     the Ibis library v9.5.0 and above to be installed. If the input table is a Polars or Pandas
     DataFrame, the Ibis library is not required.
 
+    The table types marked with two asterisks are paths to files (recognized by their extensions:
+    `.parquet` or `.pq` for Parquet files and `.arrow`, `.feather`, or `.ipc` for Arrow IPC files).
+    These are only read through their metadata, so no data is loaded. That makes them useful for
+    checking the structure of many files but limits the validation plan to the
+    [`col_schema_match()`](`pointblank.Validate.col_schema_match`),
+    [`row_count_match()`](`pointblank.Validate.row_count_match`), and
+    [`col_count_match()`](`pointblank.Validate.col_count_match`) validation steps. Using such paths
+    requires the PyArrow library.
+
     Examples
     --------
     ## Creating a validation plan and interrogating
@@ -1797,6 +1972,10 @@ class Validate:
 
         self.validation_info = []
 
+        # The preview of the target table and the column positions that are shared by the step
+        # reports (these are generated on first use and reset by `interrogate()`)
+        self._clear_step_report_cache()
+
     def _repr_html_(self) -> str:
         return self.get_tabular_report()._repr_html_()  # pragma: no cover
 
@@ -3959,7 +4138,11 @@ class Validate:
             A column expression that will evaluate each row in the table, returning a boolean value
             per table row. If the target table is a Polars DataFrame, the expression should either
             be a Polars column expression or a Narwhals one. For a Pandas DataFrame, the expression
-            should either be a lambda expression or a Narwhals column expression.
+            should either be a lambda expression or a Narwhals column expression. For an Ibis table,
+            the expression can be an Ibis expression (including deferred expressions like
+            `ibis._.a + ibis._.b > 0`) or a Narwhals column expression; in either case, the
+            expression is evaluated by the backend and only the counts of passing and failing test
+            units are fetched.
         pre
             A optional preprocessing function or lambda to apply to the data table during
             interrogation.
@@ -4544,8 +4727,9 @@ class Validate:
         ----------
         count
             The expected row count of the table. This can be an integer value, a Polars or Pandas
-            DataFrame object, or an Ibis backend table. If a DataFrame/table is provided, the row
-            count of that object will be used as the expected count.
+            DataFrame object, an Ibis backend table, or the path to a Parquet or Arrow IPC file. If
+            a DataFrame/table/file is provided, the row count of that object will be used as the
+            expected count.
         tol
             The tolerance allowable for the row count match. This can be specified as a single
             numeric value (integer or float) or as a tuple of two integers representing the lower
@@ -4666,7 +4850,11 @@ class Validate:
 
         # If `count` is a DataFrame or table then use the row count of the DataFrame as
         # the expected count
-        if _is_value_a_df(count) or "ibis.expr.types.relations.Table" in str(type(count)):
+        if (
+            _is_value_a_df(count)
+            or "ibis.expr.types.relations.Table" in str(type(count))
+            or _get_table_file_type(data=count) is not None
+        ):
             count = get_row_count(count)
 
         # Check the integrity of tolerance
@@ -4714,8 +4902,9 @@ class Validate:
         ----------
         count
             The expected column count of the table. This can be an integer value, a Polars or Pandas
-            DataFrame object, or an Ibis backend table. If a DataFrame/table is provided, the column
-            count of that object will be used as the expected count.
+            DataFrame object, an Ibis backend table, or the path to a Parquet or Arrow IPC file. If
+            a DataFrame/table/file is provided, the column count of that object will be used as the
+            expected count.
         inverse
             Should the validation step be inverted? If `True`, then the expectation is that the
             column count of the target table should not match the specified `count=` value.
@@ -4797,7 +4986,11 @@ class Validate:
 
         # If `count` is a DataFrame or table then use the column count of the DataFrame as
         # the expected count
-        if _is_value_a_df(count) or "ibis.expr.types.relations.Table" in str(type(count)):
+        if (
+            _is_value_a_df(count)
+            or "ibis.expr.types.relations.Table" in str(type(count))
+            or _get_table_file_type(data=count) is not None
+        ):
             count = get_column_count(count)
 
         # Package up the `count=` and boolean params into a dictionary for later interrogation
@@ -4825,6 +5018,10 @@ class Validate:
         sample_n: int | None = None,
         sample_frac: int | float | None = None,
         sample_limit: int = 5000,
+        seed: int | None = None,
+        extract_limit: int | str | None = None,
+        extract_limit_total: int | str | None = None,
+        extract_spill_dir: str | None = None,
     ) -> Validate:
         """
         Execute each validation step against the table and store the results.
@@ -4838,6 +5035,13 @@ class Validate:
         `get_first_n=`, `sample_n=`, and `sample_frac=` options. The `sample_limit=` option will
         enforce a hard limit on the number of rows collected when using the `sample_frac=` option.
 
+        When the table is a Parquet table (read in with `ibis.read_parquet()`), range checks on
+        integer columns (e.g., [`col_vals_ge()`](`pointblank.Validate.col_vals_ge`),
+        [`col_vals_between()`](`pointblank.Validate.col_vals_between`)) and null checks make use of
+        the row-group statistics in the file footers. Row groups whose statistics show that all of
+        their values pass (or fail) aren't read at all; only row groups with statistics straddling
+        the bound(s) are scanned. This requires the PyArrow library to be installed.
+
         After interrogation is complete, the `Validate` object will have gathered information, and
         we can use methods like [`n_passed()`](`pointblank.Validate.n_passed`),
         [`f_failed()`](`pointblank.Validate.f_failed`)`, etc., to understand how the table performed
@@ -4850,14 +5054,18 @@ class Validate:
         collect_extracts
             An option to collect rows of the input table that didn't pass a particular validation
             step. The default is `True` and further options (i.e., `get_first_n=`, `sample_*=`)
-            allow for fine control of how these rows are collected.
+            allow for fine control of how these rows are collected. For Ibis tables, the limiting
+            and sampling of rows is done by the backend and the rows are only fetched when the
+            extracts are first requested (e.g., through
+            [`get_data_extracts()`](`pointblank.Validate.get_data_extracts`)).
         collect_tbl_checked
             The processed data frames produced by executing the validation steps is collected and
             stored in the `Validate` object if `collect_tbl_checked=True`. This information is
             necessary for some methods (e.g.,
             [`get_sundered_data()`](`pointblank.Validate.get_sundered_data`)), but it potentially
             makes the object grow to a large size. To opt out of attaching this data, set this
-            argument to `False`.
+            argument to `False`. In that case, the extracts for DataFrames are collected during
+            interrogation (rather than when first accessed) so that no per-step tables are kept.
         get_first_n
             If the option to collect rows where test units is chosen, there is the option here to
             collect the first `n` rows. Supply an integer number of rows to extract from the top of
@@ -4876,6 +5084,32 @@ class Validate:
         sample_limit
             A value that limits the possible number of rows returned when sampling non-passing rows
             using the `sample_frac=` option.
+        seed
+            An optional seed for sampling non-passing rows with `sample_n=` or `sample_frac=`. The
+            sample is drawn in a single pass over the validation results (by reservoir sampling)
+            and a given seed always gives the same rows, so extracts are reproducible across
+            interrogations. For Ibis tables, providing a seed means that only the row numbers of
+            the non-passing rows are streamed from the backend to draw the sample.
+        extract_limit
+            The largest extract of non-passing rows that is held in memory for any single validation
+            step. This can be an integer number of rows or a string with a size in bytes (e.g.,
+            `"250MB"`, `"1GB"`). The non-passing rows are streamed in batches and, once an extract
+            exceeds this limit, it's written to a Parquet file in `extract_spill_dir=`. Such an
+            extract is then available as a lazy scan of that file: a Polars LazyFrame when the
+            extracts are Polars DataFrames, or a PyArrow dataset when they are Pandas DataFrames
+            (use `.to_table().to_pandas()` to read it). Setting this option requires the PyArrow
+            library.
+        extract_limit_total
+            The largest amount of non-passing rows that is held in memory across all extracts, given
+            as an integer number of rows or a string with a size in bytes. Extracts are counted
+            against this budget in the order that they are first accessed, and any extract that
+            would exceed the remaining budget is written to a Parquet file (as with
+            `extract_limit=`).
+        extract_spill_dir
+            The directory where extracts that exceed `extract_limit=` or `extract_limit_total=` are
+            written as Parquet files. The files in a directory given here are left for the caller
+            to remove. By default, a new temporary directory is used and it's removed when the
+            Python process exits.
 
         Returns
         -------
@@ -4935,20 +5169,52 @@ class Validate:
                 "The `sample_n=` and `sample_frac=` arguments cannot both be provided."
             )
 
+        max_rows, max_bytes = _parse_extract_limit(extract_limit, param_name="extract_limit")
+        max_rows_total, max_bytes_total = _parse_extract_limit(
+            extract_limit_total, param_name="extract_limit_total"
+        )
+
+        # Set up a budget for the extracts of non-passing rows if any limit was provided
+        if any(
+            limit is not None for limit in [max_rows, max_bytes, max_rows_total, max_bytes_total]
+        ):
+            if not _is_lib_present(lib_name="pyarrow"):
+                raise ImportError(
+                    "The PyArrow library is not installed but is required when specifying "
+                    "`extract_limit=` or `extract_limit_total=`."
+                )
+
+            extract_budget = _ExtractBudget(
+                max_rows=max_rows,
+                max_bytes=max_bytes,
+                max_rows_total=max_rows_total,
+                max_bytes_total=max_bytes_total,
+                spill_dir=extract_spill_dir,
+            )
+        else:
+            extract_budget = None
+
         data_tbl = self.data
 
         # Determine if the table is a DataFrame or a DB table
         tbl_type = _get_tbl_type(data=data_tbl)
 
+        # A Parquet or Arrow IPC file given as a path is only read through its metadata, so only
+        # the steps that check the schema or the dimensions of the table can be used with it
+        if tbl_type in ["parquet_file", "arrow_file"]:
+            _check_table_file_steps(validation_info=self.validation_info)
+
         self.time_start = datetime.datetime.now(datetime.timezone.utc)
 
+        # Any cached state of the step reports is out of date after a new interrogation
+        self._clear_step_report_cache()
+
         # Expand `validation_info` by evaluating any column expressions in `column`
         # (the `_evaluate_column_exprs()` method will eval and expand as needed)
         self._evaluate_column_exprs(validation_info=self.validation_info)
 
-        for validation in self.validation_info:
+        for index_value, validation in enumerate(self.validation_info, start=1):
             # Set the `i` value for the validation step (this is 1-indexed)
-            index_value = self.validation_info.index(validation) + 1
             validation.i = index_value
 
             start_time = datetime.datetime.now(datetime.timezone.utc)
@@ -5033,9 +5299,12 @@ class Validate:
                 elif isinstance(validation.pre, Callable):
                     data_tbl_step = validation.pre(data_tbl_step)
 
-            validation.n = NumberOfTestUnits(df=data_tbl_step, column=column).get_test_units(
-                tbl_type=tbl_type
-            )
+            # Steps that check the table's metadata have a single test unit (set below) so the
+            # rows of the table don't need to be counted for them
+            if assertion_type not in TABLE_FILE_VALIDATION_TYPES:
+                validation.n = NumberOfTestUnits(df=data_tbl_step, column=column).get_test_units(
+                    tbl_type=tbl_type
+                )
 
             if tbl_type not in IBIS_BACKENDS:
                 tbl_type = "local"
@@ -5194,19 +5463,40 @@ class Validate:
                 "ROW_COUNT_MATCH",
                 "COL_COUNT_MATCH",
             ]:
-                # Extract the `pb_is_good_` column from the table as a results list
-                if tbl_type in IBIS_BACKENDS:
-                    results_list = (
-                        results_tbl.select("pb_is_good_").to_pandas()["pb_is_good_"].to_list()
+                # For Parquet-backed tables, try to obtain the test unit counts from the row-group
+                # statistics in the file footers (only straddling row groups are then scanned)
+                parquet_counts = None
+
+                if tbl_type == "parquet" and validation.pre is None:
+                    parquet_counts = _get_parquet_step_counts(
+                        data=data_tbl_step,
+                        assertion_method=assertion_method,
+                        column=column,
+                        values=value,
+                        inclusive=inclusive,
+                        na_pass=na_pass,
+                    )
+
+                if parquet_counts is not None:
+                    validation.n, validation.n_passed, validation.n_failed = parquet_counts
+                    validation.all_passed = validation.n_failed == 0
+
+                elif tbl_type in IBIS_BACKENDS:
+                    # Aggregate the `pb_is_good_` column on the backend so that only the counts
+                    # are fetched (and not the results for every row)
+                    validation.n, validation.n_passed, validation.n_failed = (
+                        _get_ibis_test_unit_counts(results_tbl=results_tbl)
                     )
+                    validation.all_passed = validation.n_passed == validation.n
 
                 else:
+                    # Extract the `pb_is_good_` column from the table as a results list
                     results_list = nw.from_native(results_tbl)["pb_is_good_"].to_list()
 
-                validation.all_passed = all(results_list)
-                validation.n = len(results_list)
-                validation.n_passed = results_list.count(True)
-                validation.n_failed = results_list.count(False)
+                    validation.all_passed = all(results_list)
+                    validation.n = len(results_list)
+                    validation.n_passed = results_list.count(True)
+                    validation.n_failed = results_list.count(False)
 
             # Calculate fractions of passing and failing test units
             # - `f_passed` is the fraction of test units that passed
@@ -5301,37 +5591,50 @@ class Validate:
                                 elif callable(act):
                                     act()
 
-            # If this is a row-based validation step, then extract the rows that failed
-            # TODO: Add support for extraction of rows for Ibis backends
-            if (
-                collect_extracts
-                and assertion_type in ROW_BASED_VALIDATION_TYPES
-                and tbl_type not in IBIS_BACKENDS
-            ):
-                # Add row numbers to the results table
-                validation_extract_nw = (
-                    nw.from_native(results_tbl)
-                    .with_row_index(name="_row_num_")
-                    .filter(nw.col("pb_is_good_") == False)  # noqa
-                    .drop("pb_is_good_")
-                )
-
-                # Add 1 to the row numbers to make them 1-indexed
-                validation_extract_nw = validation_extract_nw.with_columns(nw.col("_row_num_") + 1)
-
-                # Apply any sampling or limiting to the number of rows to extract
-                if get_first_n is not None:
-                    validation_extract_nw = validation_extract_nw.head(get_first_n)
-                elif sample_n is not None:
-                    validation_extract_nw = validation_extract_nw.sample(n=sample_n)
-                elif sample_frac is not None:
-                    validation_extract_nw = validation_extract_nw.sample(fraction=sample_frac)
-
-                    # Ensure a limit is set on the number of rows to extract
-                    if len(validation_extract_nw) > sample_limit:
-                        validation_extract_nw = validation_extract_nw.head(sample_limit)
+            # If this is a row-based validation step, then prepare the extract of failing rows;
+            # the extract is only obtained when it's first accessed (e.g., by
+            # `get_data_extracts()`), so the interrogation doesn't pay for it
+            if collect_extracts and assertion_type in ROW_BASED_VALIDATION_TYPES:
+                if tbl_type in IBIS_BACKENDS and seed is None:
+                    # The (unexecuted) query already includes any limiting or sampling of rows
+                    validation.extract = _DeferredExtract(
+                        tbl=_get_ibis_extract(
+                            results_tbl=results_tbl,
+                            get_first_n=get_first_n,
+                            sample_n=sample_n,
+                            sample_frac=sample_frac,
+                            sample_limit=sample_limit,
+                        ),
+                        budget=extract_budget,
+                        step=validation.i,
+                    )
+                elif tbl_type in IBIS_BACKENDS:
+                    # A seeded sample is drawn from the query of all failing rows when collected
+                    validation.extract = _DeferredExtract(
+                        tbl=_get_ibis_extract(results_tbl=results_tbl, get_first_n=get_first_n),
+                        sample_n=sample_n,
+                        sample_frac=sample_frac,
+                        sample_limit=sample_limit,
+                        seed=seed,
+                        budget=extract_budget,
+                        step=validation.i,
+                    )
+                else:
+                    extract = _DeferredExtract(
+                        tbl=data_tbl_step,
+                        mask=nw.from_native(results_tbl)["pb_is_good_"],
+                        get_first_n=get_first_n,
+                        sample_n=sample_n,
+                        sample_frac=sample_frac,
+                        sample_limit=sample_limit,
+                        seed=seed,
+                        budget=extract_budget,
+                        step=validation.i,
+                    )
 
-                validation.extract = nw.to_native(validation_extract_nw)
+                    # Deferring the extract keeps the step's table and mask alive, so without
+                    # `collect_tbl_checked=True` the extract is obtained now and they're released
+                    validation.extract = extract if collect_tbl_checked else extract.collect()
 
             # Get the end time for this step
             end_time = datetime.datetime.now(datetime.timezone.utc)
@@ -6271,6 +6574,16 @@ class Validate:
         extracted rows are a subset of the original table and are useful for further analysis or for
         understanding the nature of the failing test units.
 
+        Row Numbers in Extracts from Ibis Tables
+        ----------------------------------------
+        The `_row_num_` column of an extract from an Ibis table is computed by the backend. If the
+        table was sorted with `order_by()`, the rows are numbered in that order (which is
+        deterministic when the sort keys are unique). Otherwise, the rows are numbered in the order
+        that the backend reads them: this is the insertion order for backends like DuckDB, SQLite,
+        and Polars, but engines that scan in parallel (e.g., PySpark, BigQuery, or Snowflake) may
+        number the rows differently from one run to the next. Sort the table by a key column before
+        validating it if stable row numbers are needed.
+
         Examples
         --------
         ```{python}
@@ -6405,6 +6718,88 @@ class Validate:
 
         return json.dumps(report, indent=4, default=str)
 
+    def get_summary(self, format: str = "text") -> str | dict[str, Any]:
+        """
+        Get a lightweight summary of the validation results.
+
+        The `get_summary()` method gives a summary of the validation steps and their results as
+        plain text, as a Markdown table, or as a dictionary (or compact JSON string) of values.
+        Unlike [`get_tabular_report()`](`pointblank.Validate.get_tabular_report`), the summary is
+        built directly from the validation results without creating a table object, so it's fast
+        to produce even for validation plans with many thousands of steps. This makes it a good fit
+        for headless pipelines, where the results end up in log lines, in messages, or in a metrics
+        system.
+
+        Parameters
+        ----------
+        format
+            The format of the summary. Options are `"text"` (the default) for a plain-text table,
+            `"markdown"` for a Markdown table, `"dict"` for a dictionary, and `"json"` for the
+            dictionary as a compact JSON string.
+
+        Returns
+        -------
+        str | dict[str, Any]
+            The summary as a string, or as a dictionary with `format="dict"`.
+
+        Summary Contents
+        ----------------
+        The summary has the counts of steps that passed (all test units passing), that failed
+        (some test units failing), and that exceeded the 'warning', 'error', and 'critical'
+        thresholds. For each step, the step number, the assertion type, the column(s), the values,
+        and the numbers (and fractions) of passing and failing test units are given. The status of
+        each threshold is shown with `●` (exceeded), `○` (not exceeded), or `—` (no threshold).
+
+        Examples
+        --------
+        ```{python}
+        import pointblank as pb
+        import polars as pl
+
+        tbl = pl.DataFrame({"x": [1, 2, 3, 4], "y": [4, 5, 6, 7]})
+
+        validation = (
+            pb.Validate(data=tbl, tbl_name="tbl_xy", thresholds=(1, 2, 3))
+            .col_vals_gt(columns="x", value=1)
+            .col_vals_le(columns="y", value=7)
+            .interrogate()
+        )
+
+        print(validation.get_summary())
+        ```
+
+        The same summary can be obtained as a Markdown table (e.g., for a pull request comment or a
+        chat message) with `format="markdown"`, or as a dictionary with `format="dict"`.
+
+        ```{python}
+        validation.get_summary(format="dict")
+        ```
+        """
+
+        if format not in ["text", "markdown", "dict", "json"]:
+            raise ValueError(
+                "The `format=` value must be one of `'text'`, `'markdown'`, `'dict'`, or `'json'`."
+            )
+
+        summary = _get_validation_summary(
+            validation_info=self.validation_info,
+            tbl_name=self.tbl_name,
+            label=self.label,
+            time_start=self.time_start,
+            time_end=self.time_end,
+        )
+
+        if format == "dict":
+            return summary
+
+        if format == "json":
+            return json.dumps(summary, separators=(",", ":"), default=str)
+
+        if format == "markdown":
+            return _format_summary_markdown(summary=summary)
+
+        return _format_summary_text(summary=summary)
+
     def get_sundered_data(self, type="pass") -> FrameT:
         """
         Get the data that passed or failed the validation steps.
@@ -6431,6 +6826,11 @@ class Validate:
         with the rows that passed all validation steps and another with the rows that failed at
         least one validation step.
 
+        When the target table is an Ibis table, the returned table is a lazy Ibis expression that
+        filters the target table with the combined predicates of the validation steps. Nothing is
+        fetched from the backend, so the result can be written directly to a table in the same
+        database (e.g., with the backend's `create_table()` method).
+
         Parameters
         ----------
         type
@@ -6513,64 +6913,194 @@ class Validate:
             if type == "fail":
                 return self.data[0:0]
 
-        # Get an indexed version of the data
-        # TODO: add argument for user to specify the index column name
-        index_name = "pb_index_"
-
-        data_nw = nw.from_native(self.data).with_row_index(name=index_name)
-
-        # Get all validation step result tables and join together the `pb_is_good_` columns
-        # ensuring that the columns are named uniquely (e.g., `pb_is_good_1`, `pb_is_good_2`, ...)
-        # and that the index is reset
-        for i, validation in enumerate(validation_info):
-            results_tbl = nw.from_native(validation.tbl_checked)
+        # For Ibis tables, return a lazy query that filters the target table with the conjunction
+        # of the step predicates (or its negation) so that no data is moved to the client
+        if _get_tbl_type(data=self.data) in IBIS_BACKENDS:
+            return _get_ibis_sundered_data(
+                data=self.data, validation_info=validation_info, type=type
+            )
 
-            # Add row numbers to the results table
-            results_tbl = results_tbl.with_row_index(name=index_name)
+        # Get the boolean mask of each step (the `pb_is_good_` column of its results table); masks
+        # from steps where a `pre=` function changed the number of rows cannot be aligned with the
+        # rows of the target table and so they aren't used
+        data_nw = nw.from_native(self.data)
 
-            # Add numerical suffix to the `pb_is_good_` column to make it unique
-            results_tbl = results_tbl.select([index_name, "pb_is_good_"]).rename(
-                {"pb_is_good_": f"pb_is_good_{i}"}
-            )
+        step_masks = [
+            mask
+            for mask in (_get_step_mask(validation=validation) for validation in validation_info)
+            if len(mask) == len(data_nw)
+        ]
 
-            # Add the results table to the list of tables
-            if i == 0:
-                labeled_tbl_nw = results_tbl
-            else:
-                labeled_tbl_nw = labeled_tbl_nw.join(results_tbl, on=index_name, how="left")
+        if len(step_masks) == 0:
+            return self.data if type == "pass" else self.data[0:0]
 
-        # Get list of columns that are the `pb_is_good_` columns
-        pb_is_good_cols = [f"pb_is_good_{i}" for i in range(len(validation_steps_i))]
+        # Combine the masks with a vectorized AND and then filter the target table just once
+        all_passed = reduce(lambda x, y: x & y, step_masks)
 
-        # Determine the rows that passed all validation steps by checking if all `pb_is_good_`
-        # columns are `True`
-        labeled_tbl_nw = (
-            labeled_tbl_nw.with_columns(pb_is_good_all=nw.all_horizontal(pb_is_good_cols))
-            .join(data_nw, on=index_name, how="left")
-            .drop(index_name)
-        )
+        # A missing result is taken as a failure, so that every row is in exactly one of the pieces
+        if all_passed.null_count() > 0:
+            all_passed = all_passed.fill_null(False)
 
         bool_val = True if type == "pass" else False
 
         sundered_tbl = (
-            labeled_tbl_nw.filter(nw.col("pb_is_good_all") == bool_val)
-            .drop(pb_is_good_cols + ["pb_is_good_all"])
+            data_nw.with_columns(pb_is_good_all=all_passed)
+            .filter(nw.col("pb_is_good_all") == bool_val)
+            .drop("pb_is_good_all")
             .to_native()
         )
 
         return sundered_tbl
 
-    def get_tabular_report(
-        self, title: str | None = ":default:", incl_header: bool = None, incl_footer: bool = None
-    ) -> GT:
+    def get_failure_matrix(self, type: str = "bitmask") -> FrameT | Any:
         """
-        Validation report as a GT table.
+        Get the validation steps that each row of the table failed.
 
-        The `get_tabular_report()` method returns a GT table object that represents the validation
-        report. This validation table provides a summary of the validation results, including the
-        validation steps, the number of test units, the number of failing test units, and the
-        fraction of failing test units. The table also includes status indicators for the 'warning',
-        'error', and 'critical' levels.
+        After interrogation, the `get_failure_matrix()` method gives a row-by-row account of the
+        row-based validation steps that failed. The returned table has a `_row_num_` column (the
+        1-indexed row number in the target table, the same as in the extracts obtained with
+        [`get_data_extracts()`](`pointblank.Validate.get_data_extracts`)) and either a packed
+        bitmask of the failed steps or a list of the failed step numbers. This is useful for
+        routing failing rows to different places depending on the checks that they failed.
+
+        Details
+        -------
+        With `type="bitmask"`, step `i` is represented by the bit `2 ** (i - 1)` in the unsigned
+        64-bit integer column `_failed_steps_`. A row that passed every step has a value of `0`.
+        If the validation plan has more than 64 steps, the bitmask is split across several columns
+        of 64 steps each: `_failed_steps_1_` (steps 1-64), `_failed_steps_2_` (steps 65-128), and
+        so on. With `type="list"`, the `_failed_steps_` column contains a list of the step numbers
+        that failed for each row.
+
+        The same validation steps as in
+        [`get_sundered_data()`](`pointblank.Validate.get_sundered_data`) are considered here: they
+        must be row-based and active. A test unit with a missing result (e.g., from a custom
+        expression) isn't considered as failing. For Ibis tables, the returned table is a lazy Ibis
+        expression.
+
+        Parameters
+        ----------
+        type
+            The representation of the failed steps. Options are `"bitmask"` (the default) or
+            `"list"`. For DataFrames, `"list"` requires the NumPy and PyArrow libraries.
+
+        Returns
+        -------
+        FrameT | Any
+            A table with one row per row of the target table.
+
+        Examples
+        --------
+        ```{python}
+        #| echo: false
+        #| output: false
+        import pointblank as pb
+        pb.config(preview_incl_header=False)
+        ```
+        Let's validate a table with two row-based validation steps.
+
+        ```{python}
+        import pointblank as pb
+        import polars as pl
+
+        tbl = pl.DataFrame(
+            {
+                "a": [7, 6, 9, 7, 3, 2],
+                "c": ["c", "d", "a", "b", "a", "b"]
+            }
+        )
+
+        validation = (
+            pb.Validate(data=tbl)
+            .col_vals_gt(columns="a", value=5)
+            .col_vals_in_set(columns="c", set=["a", "b"])
+            .interrogate()
+        )
+
+        validation.get_failure_matrix(type="list")
+        ```
+
+        The first two rows failed step 2, the last two rows failed step 1, and the middle two rows
+        passed both steps.
+        """
+
+        if type not in ["bitmask", "list"]:
+            raise ValueError("The `type=` argument must be either 'bitmask' or 'list'.")
+
+        validation_info = [
+            validation
+            for validation in self.validation_info
+            if validation.assertion_type in ROW_BASED_VALIDATION_TYPES and validation.active
+        ]
+
+        if _get_tbl_type(data=self.data) in IBIS_BACKENDS:
+            return _get_ibis_failure_matrix(
+                data=self.data, validation_info=validation_info, type=type
+            )
+
+        data_nw = nw.from_native(self.data)
+
+        # Get the mask of failing rows for each step (missing results don't count as failures);
+        # as with sundering, masks that can't be aligned with the target table aren't used
+        step_failures = {}
+
+        for validation in validation_info:
+            mask = _get_step_mask(validation=validation)
+
+            if len(mask) == len(data_nw):
+                step_failures[validation.i] = mask == False  # noqa: E712
+
+        failure_matrix = data_nw.with_row_index(name="_row_num_").select(nw.col("_row_num_") + 1)
+
+        if type == "list":
+            if not _is_lib_present(lib_name="numpy") or not _is_lib_present(lib_name="pyarrow"):
+                raise ImportError(
+                    "The NumPy and PyArrow libraries are required for `type='list'` with a "
+                    "DataFrame; use `type='bitmask'` if either one isn't installed."
+                )
+
+            return _get_failure_lists(
+                failure_matrix=failure_matrix, step_failures=step_failures
+            ).to_native()
+
+        # Add the failure masks to the table and then pack them into one or more bitmask columns
+        failure_matrix = failure_matrix.with_columns(
+            **{f"pb_failed_{i}": failures for i, failures in step_failures.items()}
+        )
+
+        bitmask_exprs = {
+            name: reduce(
+                lambda x, y: x + y,
+                [
+                    nw.when(nw.col(f"pb_failed_{i}"))
+                    .then(nw.lit(1 << bit, dtype=nw.UInt64))
+                    .otherwise(nw.lit(0, dtype=nw.UInt64))
+                    for i, bit in step_bits
+                ],
+                nw.lit(0, dtype=nw.UInt64),
+            )
+            for name, step_bits in _get_failure_bitmask_layout(steps=list(step_failures)).items()
+        }
+
+        return failure_matrix.select("_row_num_", **bitmask_exprs).to_native()
+
+    def get_tabular_report(
+        self,
+        title: str | None = ":default:",
+        incl_header: bool = None,
+        incl_footer: bool = None,
+        collapse_passing: bool = False,
+        page_size: int | None = None,
+        page: int = 1,
+    ) -> GT:
+        """
+        Validation report as a GT table.
+
+        The `get_tabular_report()` method returns a GT table object that represents the validation
+        report. This validation table provides a summary of the validation results, including the
+        validation steps, the number of test units, the number of failing test units, and the
+        fraction of failing test units. The table also includes status indicators for the 'warning',
+        'error', and 'critical' levels.
 
         You could simply display the validation table without the use of the `get_tabular_report()`
         method. However, the method provides a way to customize the title of the report. In the
@@ -6584,6 +7114,22 @@ class Validate:
             name of the table as the title for the report. If no title is wanted, then `":none:"`
             can be used. Aside from keyword options, text can be provided for the title. This will
             be interpreted as Markdown text and transformed internally to HTML.
+        incl_header
+            Should the header (with the title, label, table type, and thresholds) be included in
+            the report? By default, this is taken from the global configuration (see `config()`).
+        incl_footer
+            Should the footer (with the interrogation time) be included in the report? By default,
+            this is taken from the global configuration (see `config()`).
+        collapse_passing
+            Should the steps where all test units passed be left out of the report? This is useful
+            for validation plans with many steps, where the steps needing attention are the ones
+            with failing test units. A note in the footer states how many steps were left out.
+        page_size
+            The maximum number of steps to show in the report. With many steps, the report can be
+            split into pages of this size (the page to show is given by `page=`). By default, all
+            steps are shown.
+        page
+            The page of steps to show when `page_size=` is set. Pages are numbered from `1`.
 
         Returns
         -------
@@ -6637,8 +7183,18 @@ class Validate:
 
         The title of the report is now set to 'Report for Table XY'. This can be useful if you want
         to provide a more descriptive title for the report.
+
+        For validation plans with many steps, the report can be limited to the steps that need
+        attention by using `collapse_passing=True`. The remaining steps can also be split into
+        pages with `page_size=` (and the page to show is selected with `page=`).
+
+        ```{python}
+        validation.get_tabular_report(collapse_passing=True, page_size=1, page=1)
+        ```
         """
 
+        _check_boolean_input(param=collapse_passing, param_name="collapse_passing")
+
         if incl_header is None:
             incl_header = global_config.report_incl_header
         if incl_footer is None:
@@ -6795,13 +7351,24 @@ class Validate:
 
             return gt_tbl
 
-        # Convert the `validation_info` object to a dictionary
-        validation_info_dict = _validation_info_as_dict(validation_info=self.validation_info)
+        # Has the validation been performed? We can check the first `proc_duration_s` entry to see
+        # if it is `None` or not; The output of many cells in the reporting table will be made blank
+        # if the validation has not been performed
+        interrogation_performed = self.validation_info[0].proc_duration_s is not None
+
+        # Get the steps to show in the report (passing steps may be collapsed and the remaining
+        # steps may be split into pages) along with a note about any steps that aren't shown
+        report_steps, report_steps_note = _get_report_steps(
+            validation_info=self.validation_info,
+            collapse_passing=collapse_passing and interrogation_performed,
+            page_size=page_size,
+            page=page,
+        )
 
-        # Has the validation been performed? We can check the first `time_processed` entry in the
-        # dictionary to see if it is `None` or not; The output of many cells in the reporting table
-        # will be made blank if the validation has not been performed
-        interrogation_performed = validation_info_dict.get("proc_duration_s", [None])[0] is not None
+        # Convert the `validation_info` object (for the steps in the report) to a dictionary
+        validation_info_dict = _validation_info_as_dict(
+            validation_info=[self.validation_info[i] for i in report_steps]
+        )
 
         # ------------------------------------------------
         # Process the `type_upd` entry
@@ -6816,33 +7383,15 @@ class Validate:
         # Process the `columns_upd` entry
         # ------------------------------------------------
 
-        columns_upd = []
-
-        columns = validation_info_dict["column"]
-
         assertion_type = validation_info_dict["assertion_type"]
-
-        # Iterate over the values in the `column` entry
-        for i, column in enumerate(columns):
-            if assertion_type[i] in [
-                "col_schema_match",
-                "row_count_match",
-                "col_count_match",
-                "col_vals_expr",
-            ]:
-                columns_upd.append("&mdash;")
-            elif assertion_type[i] in ["rows_distinct"]:
-                if not column:
-                    # If there is no column subset, then all columns are used
-                    columns_upd.append("ALL COLUMNS")
-                else:
-                    # With a column subset list, format with commas between the column names
-                    columns_upd.append(", ".join(column))
-            else:
-                columns_upd.append(str(column))
+        active = validation_info_dict["active"]
+        eval_error = validation_info_dict["eval_error"]
 
         # Add the `columns_upd` entry to the dictionary
-        validation_info_dict["columns_upd"] = columns_upd
+        validation_info_dict["columns_upd"] = [
+            _format_step_columns(assertion_type=assertion_type[i], column=column)
+            for i, column in enumerate(validation_info_dict["column"])
+        ]
 
         # ------------------------------------------------
         # Process the `values_upd` entry
@@ -6850,68 +7399,14 @@ class Validate:
 
         # Here, `values` will be transformed in ways particular to the assertion type (e.g.,
         # single values, ranges, sets, etc.)
-
-        # Create a list to store the transformed values
-        values_upd = []
-
-        values = validation_info_dict["values"]
-        assertion_type = validation_info_dict["assertion_type"]
-        inclusive = validation_info_dict["inclusive"]
-        active = validation_info_dict["active"]
-        eval_error = validation_info_dict["eval_error"]
-
-        # Iterate over the values in the `values` entry
-        for i, value in enumerate(values):
-            # If the assertion type is a comparison of one value then add the value as a string
-            if assertion_type[i] in [
-                "col_vals_gt",
-                "col_vals_lt",
-                "col_vals_eq",
-                "col_vals_ne",
-                "col_vals_ge",
-                "col_vals_le",
-            ]:
-                values_upd.append(str(value))
-
-            # If the assertion type is a comparison of values within or outside of a range, add
-            # the appropriate brackets (inclusive or exclusive) to the values
-            elif assertion_type[i] in ["col_vals_between", "col_vals_outside"]:
-                left_bracket = "[" if inclusive[i][0] else "("
-                right_bracket = "]" if inclusive[i][1] else ")"
-                values_upd.append(f"{left_bracket}{value[0]}, {value[1]}{right_bracket}")
-
-            # If the assertion type is a comparison of a set of values; strip the leading and
-            # trailing square brackets and single quotes
-            elif assertion_type[i] in ["col_vals_in_set", "col_vals_not_in_set"]:
-                values_upd.append(str(value)[1:-1].replace("'", ""))
-
-            # Certain assertion types don't have an associated value, so use an em dash for those
-            elif assertion_type[i] in [
-                "col_vals_null",
-                "col_vals_not_null",
-                "col_exists",
-                "rows_distinct",
-            ]:
-                values_upd.append("&mdash;")
-
-            elif assertion_type[i] in ["col_schema_match"]:
-                values_upd.append("SCHEMA")
-
-            elif assertion_type[i] in ["col_vals_expr"]:
-                values_upd.append("COLUMN EXPR")
-
-            elif assertion_type[i] in ["row_count_match", "col_count_match"]:
-                count = values[i]["count"]
-                inverse = values[i]["inverse"]
-
-                if inverse:
-                    count = f"&ne; {count}"
-
-                values_upd.append(str(count))
-
-            # If the assertion type is not recognized, add the value as a string
-            else:
-                values_upd.append(str(value))
+        values_upd = [
+            _format_step_values(
+                assertion_type=assertion_type[i],
+                value=value,
+                inclusive=validation_info_dict["inclusive"][i],
+            )
+            for i, value in enumerate(validation_info_dict["values"])
+        ]
 
         # Remove the `inclusive` entry from the dictionary
         validation_info_dict.pop("inclusive")
@@ -7033,8 +7528,17 @@ class Validate:
                 # No status entered (W, S, N) but also not all passed
                 status_color_list.append(SEVERITY_LEVEL_COLORS["green"] + "66")
 
-        # Add the `status_color` entry to the dictionary
-        validation_info_dict["status_color"] = status_color_list
+        # Add the `status_color` entry to the dictionary; the status color is drawn as a bar that
+        # fills the cell (steps that are inactive or have evaluation errors use a row fill instead)
+        validation_info_dict["status_color"] = [
+            (
+                '<div style="position: absolute; top: 0; right: 0; bottom: 0; left: 0; '
+                f'background-color: {color};"></div>'
+                if interrogation_performed and active[i] and not eval_error[i]
+                else ""
+            )
+            for i, color in enumerate(status_color_list)
+        ]
 
         # ------------------------------------------------
         # Process the extract entry
@@ -7060,17 +7564,27 @@ class Validate:
             # Get the extract for this step
             extract = validation_info_dict["extract"][i]
 
-            # Transform to Narwhals DataFrame
-            extract_nw = nw.from_native(extract)
+            # An extract that was written to a Parquet file (because it exceeded the extract
+            # budget) isn't read back in for the report; produce a label instead of a button
+            if _is_spilled_extract(extract):
+                extract_upd.append(
+                    '<span title="This extract was written to a Parquet file" '
+                    'style="background-color: #FFFFFF; color: #67C2DC; border: solid 1px #67C2DC; '
+                    'padding: 4px; font-weight: bold; border-radius: 4px;">PARQUET</span>'
+                )
+                continue
 
             # Get the number of rows in the extract
-            n_rows = len(extract_nw)
+            n_rows = len(extract)
 
             # If the number of rows is zero, then produce an em dash then go to the next iteration
             if n_rows == 0:
                 extract_upd.append("&mdash;")
                 continue
 
+            # Transform to Narwhals DataFrame
+            extract_nw = nw.from_native(extract)
+
             # Write the CSV text
             csv_text = extract_nw.write_csv()
 
@@ -7138,10 +7652,31 @@ class Validate:
         validation_info_dict.pop("active")
         validation_info_dict.pop("all_passed")
 
-        # If no interrogation performed, populate the `i` entry with a sequence of integers
-        # from `1` to the number of validation steps
+        # If no interrogation performed, populate the `i` entry with the step numbers
         if not interrogation_performed:
-            validation_info_dict["i"] = list(range(1, len(validation_info_dict["type_upd"]) + 1))
+            validation_info_dict["i"] = [i + 1 for i in report_steps]
+
+        # The SVG icons are defined once (as symbols placed in the first row) and every row
+        # references its icons instead of repeating them
+        if report_steps:
+            report_icons = {
+                **{
+                    icon: SVG_ICONS_FOR_ASSERTION_TYPES[icon]
+                    for icon in dict.fromkeys(assertion_type)
+                },
+                **{
+                    icon: SVG_ICONS_FOR_TBL_STATUS[icon]
+                    for icon in dict.fromkeys(
+                        "unchanged" if self.validation_info[i].pre is None else "modified"
+                        for i in report_steps
+                    )
+                    if interrogation_performed
+                },
+            }
+
+            validation_info_dict["type_upd"][0] = (
+                _create_svg_symbol_defs(icons=report_icons) + validation_info_dict["type_upd"][0]
+            )
 
         # Create a table time string
         table_time = _create_table_time_html(time_start=self.time_start, time_end=self.time_end)
@@ -7171,17 +7706,47 @@ class Validate:
         # (it is either Polars or Pandas)
         df = df_lib.DataFrame(validation_info_dict)
 
-        # Return the DataFrame as a Great Tables table
+        # The column order of the report
+        report_columns = [
+            "status_color",
+            "i",
+            "type_upd",
+            "columns_upd",
+            "values_upd",
+            "tbl",
+            "eval",
+            "test_units",
+            "pass",
+            "fail",
+            "w_upd",
+            "s_upd",
+            "n_upd",
+            "extract_upd",
+        ]
+
+        # Return the DataFrame as a Great Tables table; the body cells are styled by column with
+        # CSS rules (styling each cell makes the rendering time grow with the square of the number
+        # of steps), which are scoped to the table's ID so that they don't apply to other reports
+        # on the same page
+        table_id = _get_report_table_id(
+            report_columns=report_columns, interrogation_performed=interrogation_performed
+        )
+
         gt_tbl = (
-            GT(df, id="pb_tbl")
-            .fmt_markdown(columns=["pass", "fail", "extract_upd"])
+            GT(df, id=table_id)
             .opt_table_font(font=google_font(name="IBM Plex Sans"))
-            .opt_align_table_header(align="left")
-            .tab_style(style=style.css("height: 40px;"), locations=loc.body())
-            .tab_style(
-                style=style.text(weight="bold", color="#666666", size="13px"),
-                locations=loc.body(columns="i"),
+            .tab_options(
+                table_additional_css=[
+                    google_font(name="IBM Plex Sans").make_import_stmt(),
+                    google_font(name="IBM Plex Mono").make_import_stmt(),
+                    _create_report_body_css(
+                        table_id=table_id,
+                        report_columns=report_columns,
+                        interrogation_performed=interrogation_performed,
+                    ),
+                ]
             )
+            .opt_align_table_header(align="left")
             .tab_style(
                 style=style.text(weight="bold", color="#666666"), locations=loc.column_labels()
             )
@@ -7189,76 +7754,6 @@ class Validate:
                 style=style.text(size="28px", weight="bold", align="left", color="#444444"),
                 locations=loc.title(),
             )
-            .tab_style(
-                style=style.text(
-                    color="black", font=google_font(name="IBM Plex Mono"), size="11px"
-                ),
-                locations=loc.body(
-                    columns=["type_upd", "columns_upd", "values_upd", "test_units", "pass", "fail"]
-                ),
-            )
-            .tab_style(
-                style=style.borders(sides="left", color="#E5E5E5", style="dashed"),
-                locations=loc.body(columns=["columns_upd", "values_upd"]),
-            )
-            .tab_style(
-                style=style.borders(
-                    sides="left",
-                    color="#E5E5E5",
-                    style="dashed" if interrogation_performed else "none",
-                ),
-                locations=loc.body(columns=["pass", "fail"]),
-            )
-            .tab_style(
-                style=style.fill(color="#FCFCFC" if interrogation_performed else "white"),
-                locations=loc.body(columns=["w_upd", "s_upd", "n_upd"]),
-            )
-            .tab_style(
-                style=style.borders(
-                    sides="right",
-                    color="#D3D3D3",
-                    style="solid" if interrogation_performed else "none",
-                ),
-                locations=loc.body(columns="n_upd"),
-            )
-            .tab_style(
-                style=style.borders(
-                    sides="left",
-                    color="#D3D3D3",
-                    style="solid" if interrogation_performed else "none",
-                ),
-                locations=loc.body(columns="w_upd"),
-            )
-            .tab_style(
-                style=style.fill(color="#FCFCFC" if interrogation_performed else "white"),
-                locations=loc.body(columns=["tbl", "eval"]),
-            )
-            .tab_style(
-                style=style.borders(
-                    sides="right",
-                    color="#D3D3D3",
-                    style="solid" if interrogation_performed else "none",
-                ),
-                locations=loc.body(columns="eval"),
-            )
-            .tab_style(
-                style=style.borders(sides="left", color="#D3D3D3", style="solid"),
-                locations=loc.body(columns="tbl"),
-            )
-            .tab_style(
-                style=style.fill(
-                    color=from_column(column="status_color") if interrogation_performed else "white"
-                ),
-                locations=loc.body(columns="status_color"),
-            )
-            .tab_style(
-                style=style.text(color="transparent", size="0px"),
-                locations=loc.body(columns="status_color"),
-            )
-            .tab_style(
-                style=style.css("white-space: nowrap; text-overflow: ellipsis; overflow: hidden;"),
-                locations=loc.body(columns=["columns_upd", "values_upd"]),
-            )
             .cols_label(
                 cases={
                     "status_color": "",
@@ -7299,24 +7794,7 @@ class Validate:
                 align="center", columns=["tbl", "eval", "w_upd", "s_upd", "n_upd", "extract_upd"]
             )
             .cols_align(align="right", columns=["test_units", "pass", "fail"])
-            .cols_move_to_start(
-                [
-                    "status_color",
-                    "i",
-                    "type_upd",
-                    "columns_upd",
-                    "values_upd",
-                    "tbl",
-                    "eval",
-                    "test_units",
-                    "pass",
-                    "fail",
-                    "w_upd",
-                    "s_upd",
-                    "n_upd",
-                    "extract_upd",
-                ]
-            )
+            .cols_move_to_start(report_columns)
             .tab_options(table_font_size="90%")
         )
 
@@ -7326,15 +7804,9 @@ class Validate:
         if incl_footer:
             gt_tbl = gt_tbl.tab_source_note(source_note=html(table_time))
 
-        # If the interrogation has not been performed, then style the table columns dealing with
-        # interrogation data as grayed out
-        if not interrogation_performed:
-            gt_tbl = gt_tbl.tab_style(
-                style=style.fill(color="#F2F2F2"),
-                locations=loc.body(
-                    columns=["tbl", "eval", "test_units", "pass", "fail", "w_upd", "s_upd", "n_upd"]
-                ),
-            )
+        # State which steps (if any) are not shown in the report
+        if report_steps_note is not None:
+            gt_tbl = gt_tbl.tab_source_note(source_note=html(report_steps_note))
 
         # Transform `active` to a list of indices of inactive validations
         inactive_steps = [i for i, active in enumerate(active) if not active]
@@ -7452,42 +7924,154 @@ class Validate:
         debug_return_df = True if i == -99 else False
         i = 1 if debug_return_df else i
 
-        # If the step number is not valid, raise an error
-        if i <= 0 and not debug_return_df:
-            raise ValueError("Step number must be an integer value greater than 0.")
+        if not debug_return_df:
+            self._check_step_report_steps(steps=[i])
+
+        return self._get_step_report(i=i, debug_return_df=debug_return_df)
 
-        # If the step number is not valid, raise an error
-        if i not in self._get_validation_dict(i=None, attr="i") and not debug_return_df:
-            raise ValueError(f"Step {i} does not exist in the validation plan.")
+    def get_step_reports(self, steps: int | list[int] | None = None) -> dict[int, GT | str | None]:
+        """
+        Get detailed reports for several validation steps.
 
-        # Convert the `validation_info` object to a dictionary
-        validation_info_dict = _validation_info_as_dict(validation_info=self.validation_info)
+        The `get_step_reports()` method returns the same reports as
+        [`get_step_report()`](`pointblank.Validate.get_step_report`) but for several steps at
+        once. The preview of the target table that is shared by the reports (for steps where all
+        test units passed) is only generated once, making this much faster than calling
+        `get_step_report()` in a loop for a large validation plan.
 
-        # Filter the dictionary to include only the information for the selected step
-        validation_step = {
-            key: value[i - 1] for key, value in validation_info_dict.items() if key != "i"
-        }
+        Parameters
+        ----------
+        steps
+            The step number or a list of step numbers for which to get detailed reports. By
+            default, this is `None` and reports for all steps in the validation plan are returned.
+
+        Returns
+        -------
+        dict[int, GT | str | None]
+            A dictionary with the step numbers as keys and the reports as values. The value for an
+            inactive step is a message stating that the step is inactive and the value for a step
+            that doesn't have a detailed report is `None`.
+
+        Examples
+        --------
+        ```{python}
+        #| echo: false
+        #| output: false
+        import pointblank as pb
+        pb.config(report_incl_header=False, report_incl_footer=False, preview_incl_header=False)
+        ```
+        Let's create a validation plan with a few validation steps and interrogate the data.
+
+        ```{python}
+        import pointblank as pb
+
+        validation = (
+            pb.Validate(data=pb.load_dataset(dataset="small_table", tbl_type="polars"))
+            .col_vals_lt(columns="d", value=3500)
+            .col_vals_gt(columns="a", value=0)
+            .col_vals_regex(columns="b", pattern=r"[0-9]-[a-z]{3}-[0-9]{3}")
+            .interrogate()
+        )
+        ```
+
+        We can get the reports for the first and third steps with a single call of
+        `get_step_reports()`.
+
+        ```{python}
+        step_reports = validation.get_step_reports(steps=[1, 3])
+
+        step_reports[3]
+        ```
+        """
+
+        if steps is None:
+            steps = [validation.i for validation in self.validation_info]
+        elif isinstance(steps, int):
+            steps = [steps]
+
+        self._check_step_report_steps(steps=steps)
+
+        return {i: self._get_step_report(i=i) for i in steps}
+
+    def _check_step_report_steps(self, steps: list[int]) -> None:
+        valid_steps = set(self._get_validation_dict(i=None, attr="i").values())
+
+        for i in steps:
+            # If the step number is not valid, raise an error
+            if i <= 0:
+                raise ValueError("Step number must be an integer value greater than 0.")
+
+            # If the step number is not valid, raise an error
+            if i not in valid_steps:
+                raise ValueError(f"Step {i} does not exist in the validation plan.")
 
-        # From `validation_step` pull out key values for the report
-        assertion_type = validation_step["assertion_type"]
-        column = validation_step["column"]
-        values = validation_step["values"]
-        inclusive = validation_step["inclusive"]
-        all_passed = validation_step["all_passed"]
-        n = validation_step["n"]
-        n_failed = validation_step["n_failed"]
-        active = validation_step["active"]
+    def _get_step_report_preview(self) -> GT:
+        """
+        Get the preview of the target table that's used in the step reports.
+
+        The preview is generated once and then reused by all step reports until the validation is
+        interrogated again (or the target table is replaced). GT methods don't modify the object
+        they're called on so the reports can safely add their own header and styling to it.
+        """
+
+        self._check_step_report_cache()
+
+        if self._step_report_preview is None:
+            # Create a table with a sample of ten rows
+            self._step_report_preview = preview(
+                data=self.data, n_head=5, n_tail=5, limit=10, incl_header=False
+            )
+
+        return self._step_report_preview
+
+    def _get_column_positions(self) -> dict[str, int]:
+        """
+        Get the 1-indexed positions of the columns in the target table (cached like the preview).
+        """
+
+        self._check_step_report_cache()
+
+        if self._column_positions is None:
+            self._column_positions = {
+                column: position for position, column in enumerate(self.data.columns, start=1)
+            }
+
+        return self._column_positions
+
+    def _check_step_report_cache(self) -> None:
+        # The cached state only applies to the table it was generated from
+        if self._step_report_data is not self.data:
+            self._clear_step_report_cache()
+            self._step_report_data = self.data
+
+    def _clear_step_report_cache(self) -> None:
+        self._step_report_data = None
+        self._step_report_preview = None
+        self._column_positions = None
+
+    def _get_step_report(self, i: int, debug_return_df: bool = False) -> GT | str | None:
+        validation = self.validation_info[i - 1]
+
+        # Pull out key values for the report
+        assertion_type = validation.assertion_type
+        column = validation.column
+        values = validation.values
+        inclusive = validation.inclusive
+        all_passed = validation.all_passed
+        n = validation.n
+        n_failed = validation.n_failed
+        active = validation.active
 
         # Get the `val_info` dictionary for the step
-        val_info = self.validation_info[i - 1].val_info
+        val_info = validation.val_info
 
         # Get the column position in the table
         if column is not None:
             if isinstance(column, str):
-                column_list = list(self.data.columns)
-                column_position = column_list.index(column) + 1
+                column_position = self._get_column_positions().get(column)
             elif isinstance(column, list):
-                column_position = [list(self.data.columns).index(col) + 1 for col in column]
+                column_positions = self._get_column_positions()
+                column_position = [column_positions.get(col) for col in column]
             else:
                 column_position = None
         else:
@@ -7498,9 +8082,6 @@ class Validate:
         if not active:
             return "This validation step is inactive."
 
-        # Create a table with a sample of ten rows, highlighting the column of interest
-        tbl_preview = preview(data=self.data, n_head=5, n_tail=5, limit=10, incl_header=False)
-
         # If no rows were extracted, create a message to indicate that no rows were extracted
         # if get_row_count(extract) == 0:
         #    return "No rows were extracted."
@@ -7509,6 +8090,12 @@ class Validate:
             # Get the extracted data for the step
             extract = self.get_data_extracts(i=i, frame=True)
 
+            # Only the rows shown in the report are read from an extract written to Parquet
+            if _is_spilled_extract(extract):
+                extract, extract_length = _get_spilled_extract_preview(extract=extract, n=2000)
+            else:
+                extract_length = None
+
             step_report = _step_report_row_based(
                 assertion_type=assertion_type,
                 i=i,
@@ -7520,12 +8107,14 @@ class Validate:
                 n_failed=n_failed,
                 all_passed=all_passed,
                 extract=extract,
-                tbl_preview=tbl_preview,
+                # The preview of the target table is only shown when all test units passed
+                tbl_preview=self._get_step_report_preview() if all_passed else None,
+                extract_length=extract_length,
             )
 
         elif assertion_type == "col_schema_match":
             # Get the parameters for column-schema matching
-            values_dict = validation_step["values"]
+            values_dict = values
 
             # complete = values_dict["complete"]
             in_order = values_dict["in_order"]
@@ -7582,6 +8171,10 @@ class Validate:
         # Create a list to store the expanded validation steps
         expanded_validation_info = []
 
+        # The tables used for resolving column expressions, for each `pre=` function (or for
+        # `None`, which is the target table itself)
+        resolution_tables = {}
+
         # Iterate over the validation steps
         for i, validation in enumerate(validation_info):
             # Get the column expression
@@ -7594,24 +8187,24 @@ class Validate:
                 continue
 
             # Evaluate the column expression
+            columns_resolved = []
+
             try:
                 # Get the table for this step, it can either be:
-                # 1. the target table itself
-                # 2. the target table modified by a `pre` attribute
-
-                if validation.pre is None:
-                    table = self.data
-                else:
-                    table = validation.pre(self.data)
-
-                # Get the columns from the table as a list
-                columns = list(table.columns)
+                # 1. the target table itself (only its schema is needed, so a zero-row slice is
+                #    used here)
+                # 2. the target table modified by a `pre` attribute (the function is applied to
+                #    the full table, since its output columns may depend on the data)
+                pre_key = None if validation.pre is None else id(validation.pre)
+
+                if pre_key not in resolution_tables:
+                    resolution_tables[pre_key] = _get_column_resolution_table(
+                        data=self.data, pre=validation.pre
+                    )
 
-                # Evaluate the column expression
-                if isinstance(column_expr, ColumnSelectorNarwhals):
-                    columns_resolved = ColumnSelectorNarwhals(column_expr).resolve(table=table)
-                else:
-                    columns_resolved = column_expr.resolve(columns=columns, table=table)
+                columns_resolved = _resolve_column_expr(
+                    column_expr=column_expr, table=resolution_tables[pre_key]
+                )
 
             except Exception:  # pragma: no cover
                 validation.eval_error = True
@@ -7669,9 +8262,219 @@ class Validate:
         }
 
 
-def _normalize_reporting_language(lang: str | None) -> str:
-    if lang is None:
-        return "en"
+def _get_step_mask(validation: _ValidationInfo) -> nw.Series:
+    """
+    Get the boolean mask of passing rows for a row-based validation step.
+
+    Parameters
+    ----------
+    validation
+        An interrogated, row-based validation step.
+
+    Returns
+    -------
+    nw.Series
+        A boolean Series where `True` indicates a passing row.
+    """
+
+    if validation.tbl_checked is None:
+        raise ValueError(
+            f"The results of step {validation.i} are not available. Use "
+            "`interrogate(collect_tbl_checked=True)` to keep the results of each step."
+        )
+
+    return nw.from_native(validation.tbl_checked)["pb_is_good_"]
+
+
+def _get_failure_bitmask_layout(steps: list[int]) -> dict[str, list[tuple[int, int]]]:
+    """
+    Get the bitmask column (and the bit within it) used for each step in a failure matrix.
+
+    Step `i` uses bit `(i - 1) % 64` of the `(i - 1) // 64`-th column. A single column (named
+    `_failed_steps_`) is used for plans with up to 64 steps.
+
+    Returns
+    -------
+    dict[str, list[tuple[int, int]]]
+        A dictionary of bitmask column names and their (step, bit) pairs.
+    """
+
+    n_columns = max([(i - 1) // 64 + 1 for i in steps], default=1)
+
+    if n_columns == 1:
+        names = ["_failed_steps_"]
+    else:
+        names = [f"_failed_steps_{k + 1}_" for k in range(n_columns)]
+
+    layout = {name: [] for name in names}
+
+    for i in steps:
+        layout[names[(i - 1) // 64]].append((i, (i - 1) % 64))
+
+    return layout
+
+
+def _get_failure_lists(failure_matrix: nw.DataFrame, step_failures: dict[int, nw.Series]) -> Any:
+    """
+    Add the list of failed steps for each row to a failure matrix, in one vectorized pass.
+
+    The failure masks are stacked into a row-major array, and the step numbers of its nonzero
+    entries become the values of a PyArrow list array (with offsets from the per-row counts).
+    """
+
+    import numpy as np
+    import pyarrow as pa
+
+    n_rows = len(failure_matrix)
+    steps = np.array(list(step_failures), dtype=np.int64)
+
+    matrix = np.zeros((n_rows, len(steps)), dtype=bool)
+
+    for k, failures in enumerate(step_failures.values()):
+        matrix[:, k] = np.asarray(failures.fill_null(False).to_numpy(), dtype=bool)
+
+    _, step_idx = np.nonzero(matrix)
+
+    offsets = np.zeros(n_rows + 1, dtype=np.int32)
+    np.cumsum(matrix.sum(axis=1), out=offsets[1:])
+
+    failed_steps = pa.ListArray.from_arrays(
+        pa.array(offsets, type=pa.int32()), pa.array(steps[step_idx], type=pa.int64())
+    )
+
+    native_matrix = failure_matrix.to_native()
+
+    if nw.get_native_namespace(failure_matrix).__name__ == "polars":
+        import polars as pl
+
+        return nw.from_native(
+            native_matrix.with_columns(_failed_steps_=pl.from_arrow(failed_steps))
+        )
+
+    if is_pandas_dataframe(native_matrix):
+        import pandas as pd
+
+        return nw.from_native(
+            native_matrix.assign(
+                _failed_steps_=pd.Series(
+                    pd.arrays.ArrowExtensionArray(failed_steps), index=native_matrix.index
+                )
+            )
+        )
+
+    return failure_matrix.with_columns(
+        nw.new_series(
+            name="_failed_steps_",
+            values=failed_steps.to_pylist(),
+            dtype=nw.List(nw.Int64),
+            native_namespace=nw.get_native_namespace(failure_matrix),
+        )
+    )
+
+
+def _get_ibis_failure_matrix(
+    data: Any, validation_info: list[_ValidationInfo], type: str = "bitmask"
+) -> Any:
+    """
+    Get the failure matrix for an Ibis table as a lazy Ibis query.
+
+    The predicate of each row-based step is rebuilt against the target table (steps with a `pre=`
+    function are not considered) and the failures are packed in the same way as for DataFrames.
+    """
+
+    import ibis
+
+    step_failures = {}
+
+    for validation in validation_info:
+        if validation.pre is not None:
+            continue
+
+        predicate = _build_predicate(
+            assertion_method=ASSERTION_TYPE_METHOD_MAP[validation.assertion_type],
+            column=validation.column,
+            values=validation.values,
+            inclusive=validation.inclusive,
+            na_pass=validation.na_pass,
+        ).to_ibis(data)
+
+        step_failures[validation.i] = predicate == False  # noqa: E712
+
+    row_num = _get_ibis_row_number(data) + 1
+
+    if type == "list":
+        failed_steps = ibis.array(
+            [ibis.ifelse(failures, i, ibis.null("int64")) for i, failures in step_failures.items()]
+        ).filter(lambda x: x.notnull())
+
+        return data.select(_row_num_=row_num, _failed_steps_=failed_steps)
+
+    bitmasks = {
+        name: reduce(
+            lambda x, y: x + y,
+            [
+                ibis.ifelse(step_failures[i], ibis.literal(1 << bit, "uint64"), 0)
+                for i, bit in step_bits
+            ],
+            ibis.literal(0, "uint64"),
+        )
+        for name, step_bits in _get_failure_bitmask_layout(steps=list(step_failures)).items()
+    }
+
+    return data.select(_row_num_=row_num, **bitmasks)
+
+
+def _get_ibis_sundered_data(
+    data: Any, validation_info: list[_ValidationInfo], type: str = "pass"
+) -> Any:
+    """
+    Get the data that passed or failed the row-based validation steps as a lazy Ibis query.
+
+    The predicate for each step is rebuilt against the target table and the predicates are combined
+    into a single conjunction. The 'pass' piece keeps rows where the conjunction is `True` and the
+    'fail' piece keeps rows where it's `False`. Steps with a `pre=` function are not considered here
+    since their predicates don't apply to the target table.
+
+    Parameters
+    ----------
+    data
+        The target table (an Ibis table).
+    validation_info
+        The row-based, active validation steps to use for the split.
+    type
+        Either `"pass"` or `"fail"`.
+
+    Returns
+    -------
+    Any
+        An unexecuted Ibis table expression.
+    """
+
+    predicates = [
+        _build_predicate(
+            assertion_method=ASSERTION_TYPE_METHOD_MAP[validation.assertion_type],
+            column=validation.column,
+            values=validation.values,
+            inclusive=validation.inclusive,
+            na_pass=validation.na_pass,
+        )
+        for validation in validation_info
+        if validation.pre is None
+    ]
+
+    if len(predicates) == 0:
+        return data if type == "pass" else data.limit(0)
+
+    # A missing result from the conjunction (e.g., a set membership check on a NULL value) is taken
+    # as a failure, so that every row is in exactly one of the two pieces
+    all_passed = FillNull(operand=And(operands=tuple(predicates)), value=False).to_ibis(data)
+
+    return data.filter(all_passed if type == "pass" else ~all_passed)
+
+
+def _normalize_reporting_language(lang: str | None) -> str:
+    if lang is None:
+        return "en"
 
     if lang.lower() not in REPORTING_LANGUAGES:
         raise ValueError(
@@ -8019,6 +8822,468 @@ def _prep_values_text(
     return values_str
 
 
+def _format_step_columns(assertion_type: str, column: Any) -> str:
+    """
+    Format the column(s) of a validation step for a report (as HTML).
+    """
+
+    if assertion_type in [
+        "col_schema_match",
+        "row_count_match",
+        "col_count_match",
+        "col_vals_expr",
+    ]:
+        return "&mdash;"
+
+    if assertion_type in ["rows_distinct"]:
+        if not column:
+            # If there is no column subset, then all columns are used
+            return "ALL COLUMNS"
+
+        # With a column subset list, format with commas between the column names
+        return ", ".join(column)
+
+    return str(column)
+
+
+def _format_step_values(
+    assertion_type: str, value: Any, inclusive: tuple[bool, bool] | None
+) -> str:
+    """
+    Format the values of a validation step for a report (as HTML).
+    """
+
+    # If the assertion type is a comparison of one value then use the value as a string
+    if assertion_type in [
+        "col_vals_gt",
+        "col_vals_lt",
+        "col_vals_eq",
+        "col_vals_ne",
+        "col_vals_ge",
+        "col_vals_le",
+    ]:
+        return str(value)
+
+    # If the assertion type is a comparison of values within or outside of a range, add the
+    # appropriate brackets (inclusive or exclusive) to the values
+    if assertion_type in ["col_vals_between", "col_vals_outside"]:
+        left_bracket = "[" if inclusive[0] else "("
+        right_bracket = "]" if inclusive[1] else ")"
+        return f"{left_bracket}{value[0]}, {value[1]}{right_bracket}"
+
+    # If the assertion type is a comparison of a set of values; strip the leading and trailing
+    # square brackets and single quotes
+    if assertion_type in ["col_vals_in_set", "col_vals_not_in_set"]:
+        return str(value)[1:-1].replace("'", "")
+
+    # Certain assertion types don't have an associated value, so use an em dash for those
+    if assertion_type in [
+        "col_vals_null",
+        "col_vals_not_null",
+        "col_exists",
+        "rows_distinct",
+    ]:
+        return "&mdash;"
+
+    if assertion_type in ["col_schema_match"]:
+        return "SCHEMA"
+
+    if assertion_type in ["col_vals_expr"]:
+        return "COLUMN EXPR"
+
+    if assertion_type in ["row_count_match", "col_count_match"]:
+        count = value["count"]
+
+        if value["inverse"]:
+            count = f"&ne; {count}"
+
+        return str(count)
+
+    # If the assertion type is not recognized, use the value as a string
+    return str(value)
+
+
+def _get_validation_summary(
+    validation_info: list[_ValidationInfo],
+    tbl_name: str | None,
+    label: str | None,
+    time_start: datetime.datetime | None,
+    time_end: datetime.datetime | None,
+) -> dict[str, Any]:
+    """
+    Get a summary of the validation results (with JSON-serializable values) for `get_summary()`.
+    """
+
+    interrogated = len(validation_info) > 0 and validation_info[0].proc_duration_s is not None
+
+    def format_cell(cell: str) -> str | None:
+        # A step without columns or values is shown with an em dash in reports, that's `None` here
+        return None if cell == "&mdash;" else unescape(cell)
+
+    steps = [
+        {
+            "i": step.i if step.i is not None else i + 1,
+            "assertion_type": step.assertion_type,
+            "columns": format_cell(_format_step_columns(step.assertion_type, column=step.column)),
+            "values": format_cell(
+                _format_step_values(
+                    step.assertion_type, value=step.values, inclusive=step.inclusive
+                )
+            ),
+            "active": step.active,
+            "eval_error": bool(step.eval_error),
+            "n": step.n,
+            "n_passed": step.n_passed,
+            "n_failed": step.n_failed,
+            "f_passed": step.f_passed,
+            "f_failed": step.f_failed,
+            "warning": step.warning,
+            "error": step.error,
+            "critical": step.critical,
+        }
+        for i, step in enumerate(validation_info)
+    ]
+
+    def count_steps(condition: Callable[[_ValidationInfo], bool]) -> int | None:
+        return sum(1 for step in validation_info if condition(step)) if interrogated else None
+
+    # Only an active step that could be evaluated can pass (some steps, like `col_exists()`, record
+    # `all_passed` as an integer, so it's tested for truthiness)
+    def is_passing(step: _ValidationInfo) -> bool:
+        return bool(step.active) and not step.eval_error and bool(step.all_passed)
+
+    return {
+        "tbl_name": tbl_name,
+        "label": label,
+        "interrogated": interrogated,
+        "time_start": time_start.isoformat() if time_start is not None else None,
+        "time_end": time_end.isoformat() if time_end is not None else None,
+        "all_passed": all(step.all_passed for step in validation_info) if interrogated else None,
+        "n_steps": len(steps),
+        "n_steps_passed": count_steps(is_passing),
+        "n_steps_failed": count_steps(lambda step: step.active and not step.all_passed),
+        "n_steps_warning": count_steps(lambda step: bool(step.warning)),
+        "n_steps_error": count_steps(lambda step: bool(step.error)),
+        "n_steps_critical": count_steps(lambda step: bool(step.critical)),
+        "steps": steps,
+    }
+
+
+# The columns of the text and Markdown summaries, with their alignment
+SUMMARY_COLUMNS = {
+    "STEP": ">",
+    "TYPE": "<",
+    "COLUMNS": "<",
+    "VALUES": "<",
+    "EVAL": "^",
+    "UNITS": ">",
+    "PASS": ">",
+    "FAIL": ">",
+    "W": "^",
+    "E": "^",
+    "C": "^",
+}
+
+# The maximum number of characters in the columns and values cells of the text summary
+SUMMARY_MAX_CELL_WIDTH = 40
+
+# The symbols for a threshold level that was exceeded, not exceeded, or not set
+SUMMARY_THRESHOLD_SYMBOLS = {True: "●", False: "○", None: "—"}
+
+
+def _get_summary_cells(step: dict[str, Any], interrogated: bool) -> list[str]:
+    """
+    Get the cells of a step (in the order of `SUMMARY_COLUMNS`) for the text or Markdown summary.
+    """
+
+    cells = [
+        str(step["i"]),
+        f"{step['assertion_type']}()",
+        step["columns"] if step["columns"] is not None else "—",
+        step["values"] if step["values"] is not None else "—",
+    ]
+
+    if not interrogated:
+        return cells + [""] * 7
+
+    if step["eval_error"]:
+        return cells + ["✗"] + ["—"] * 6
+
+    if not step["active"]:
+        return cells + ["—"] * 7
+
+    return cells + [
+        "✓",
+        str(step["n"]),
+        f"{step['n_passed']} ({step['f_passed']:.2f})",
+        f"{step['n_failed']} ({step['f_failed']:.2f})",
+        SUMMARY_THRESHOLD_SYMBOLS[step["warning"]],
+        SUMMARY_THRESHOLD_SYMBOLS[step["error"]],
+        SUMMARY_THRESHOLD_SYMBOLS[step["critical"]],
+    ]
+
+
+def _get_summary_overview(summary: dict[str, Any]) -> str:
+    if not summary["interrogated"]:
+        return f"{summary['n_steps']} steps (no interrogation performed)"
+
+    return (
+        f"{summary['n_steps']} steps, {summary['n_steps_passed']} passed, "
+        f"{summary['n_steps_failed']} failed (warning: {summary['n_steps_warning']}, "
+        f"error: {summary['n_steps_error']}, critical: {summary['n_steps_critical']})"
+    )
+
+
+def _format_summary_text(summary: dict[str, Any]) -> str:
+    title = _get_default_title_text()
+
+    if summary["tbl_name"] is not None:
+        title = f"{title}: {summary['tbl_name']}"
+
+    lines = [title]
+
+    if summary["label"] is not None:
+        lines.append(summary["label"])
+
+    lines.append(_get_summary_overview(summary=summary))
+
+    if not summary["steps"]:
+        return "\n".join(lines)
+
+    rows = [
+        _get_summary_cells(step=step, interrogated=summary["interrogated"])
+        for step in summary["steps"]
+    ]
+
+    # Truncate long column names and values
+    for row in rows:
+        for j in (2, 3):
+            if len(row[j]) > SUMMARY_MAX_CELL_WIDTH:
+                row[j] = f"{row[j][: SUMMARY_MAX_CELL_WIDTH - 1]}…"
+
+    # Format all rows with a single template, sized by the widest cell of each column
+    widths = [
+        max(len(header), *map(len, column)) for header, column in zip(SUMMARY_COLUMNS, zip(*rows))
+    ]
+    row_template = "  ".join(
+        f"{{:{align}{width}}}" for align, width in zip(SUMMARY_COLUMNS.values(), widths)
+    )
+
+    lines.append("")
+    lines.extend(row_template.format(*row).rstrip() for row in [list(SUMMARY_COLUMNS), *rows])
+
+    return "\n".join(lines)
+
+
+def _format_summary_markdown(summary: dict[str, Any]) -> str:
+    title = _get_default_title_text()
+
+    if summary["tbl_name"] is not None:
+        title = f"{title}: `{summary['tbl_name']}`"
+
+    lines = [f"### {title}", ""]
+
+    if summary["label"] is not None:
+        lines += [summary["label"], ""]
+
+    lines.append(_get_summary_overview(summary=summary))
+
+    if not summary["steps"]:
+        return "\n".join(lines)
+
+    md_align = {"<": ":---", ">": "---:", "^": ":---:"}
+
+    lines += [
+        "",
+        "| " + " | ".join(SUMMARY_COLUMNS) + " |",
+        "| " + " | ".join(md_align[align] for align in SUMMARY_COLUMNS.values()) + " |",
+    ]
+
+    for step in summary["steps"]:
+        cells = _get_summary_cells(step=step, interrogated=summary["interrogated"])
+
+        # Show the assertion type as code and escape any pipes in the cells
+        cells[1] = f"`{cells[1]}`"
+        cells = [cell.replace("|", "\\|") for cell in cells]
+
+        lines.append("| " + " | ".join(cells) + " |")
+
+    return "\n".join(lines)
+
+
+def _get_report_steps(
+    validation_info: list[_ValidationInfo],
+    collapse_passing: bool,
+    page_size: int | None,
+    page: int,
+) -> tuple[list[int], str | None]:
+    """
+    Get the (0-indexed) steps to show in a validation report.
+
+    Steps where all test units passed are left out with `collapse_passing=True` and the remaining
+    steps are split into pages of `page_size=` steps.
+
+    Returns
+    -------
+    tuple[list[int], str | None]
+        The indices of the steps to show and an HTML note about the steps that aren't shown (or
+        `None` if all steps are shown).
+    """
+
+    if page_size is not None and (
+        not isinstance(page_size, int) or isinstance(page_size, bool) or page_size < 1
+    ):
+        raise ValueError("The `page_size=` value must be a positive integer.")
+
+    if not isinstance(page, int) or isinstance(page, bool) or page < 1:
+        raise ValueError("The `page=` value must be a positive integer.")
+
+    steps = list(range(len(validation_info)))
+    notes = []
+
+    if collapse_passing:
+        steps = [i for i in steps if not validation_info[i].all_passed]
+        n_collapsed = len(validation_info) - len(steps)
+
+        if n_collapsed > 0:
+            notes.append(f"{n_collapsed} passing step{'' if n_collapsed == 1 else 's'} not shown.")
+
+    if page_size is not None:
+        n_steps = len(steps)
+        n_pages = max((n_steps + page_size - 1) // page_size, 1)
+
+        if page > n_pages:
+            raise ValueError(
+                f"The `page=` value must not be greater than the number of pages ({n_pages})."
+            )
+
+        steps = steps[(page - 1) * page_size : page * page_size]
+
+        if n_pages > 1:
+            notes.append(f"Page {page} of {n_pages} (showing {len(steps)} of {n_steps} steps).")
+
+    if not notes:
+        return steps, None
+
+    return steps, (
+        "<div style='margin-top: 5px; margin-bottom: 5px; margin-left: 10px; color: #444;'>"
+        f"{' '.join(notes)}"
+        "</div>"
+    )
+
+
+def _get_report_table_id(report_columns: list[str], interrogation_performed: bool) -> str:
+    """
+    Get the ID of a validation report's table, which scopes the CSS rules for its body cells.
+
+    The ID is derived from everything that the rules depend on, so reports with different rules
+    never share an ID (and so never restyle each other's cells when shown on the same page), while
+    the same report always gets the same ID.
+    """
+
+    rules_key = f"{','.join(report_columns)}|{interrogation_performed}"
+
+    return f"pb_tbl_{hashlib.sha1(rules_key.encode('utf-8')).hexdigest()[:10]}"
+
+
+def _create_report_body_css(
+    table_id: str, report_columns: list[str], interrogation_performed: bool
+) -> str:
+    """
+    Create the CSS rules that style the body cells of a validation report, by column.
+
+    The rules are scoped to the report's table (with ID `table_id`).
+    """
+
+    mono_text = "color: black; font-family: 'IBM Plex Mono'; font-size: 11px;"
+    truncated_text = "white-space: nowrap; text-overflow: ellipsis; overflow: hidden;"
+
+    # Some dividers are only shown once the interrogation has been performed
+    results_divider = "dashed" if interrogation_performed else "none"
+    section_divider = "solid" if interrogation_performed else "none"
+
+    column_css = {
+        "status_color": "position: relative;",
+        "i": "color: #666666; font-size: 13px; font-weight: bold;",
+        "type_upd": mono_text,
+        "columns_upd": f"{mono_text} border-left: 1px dashed #E5E5E5; {truncated_text}",
+        "values_upd": f"{mono_text} border-left: 1px dashed #E5E5E5; {truncated_text}",
+        "tbl": "border-left: 1px solid #D3D3D3;",
+        "eval": f"border-right: 1px {section_divider} #D3D3D3;",
+        "test_units": mono_text,
+        "pass": f"{mono_text} border-left: 1px {results_divider} #E5E5E5;",
+        "fail": f"{mono_text} border-left: 1px {results_divider} #E5E5E5;",
+        "w_upd": f"border-left: 1px {section_divider} #D3D3D3;",
+        "s_upd": "",
+        "n_upd": f"border-right: 1px {section_divider} #D3D3D3;",
+    }
+
+    # The columns with interrogation data are lightly filled (or grayed out if the interrogation
+    # hasn't been performed)
+    if interrogation_performed:
+        filled_columns = ["tbl", "eval", "w_upd", "s_upd", "n_upd"]
+        fill_color = "#FCFCFC"
+    else:
+        filled_columns = ["tbl", "eval", "test_units", "pass", "fail", "w_upd", "s_upd", "n_upd"]
+        fill_color = "#F2F2F2"
+
+    for column in filled_columns:
+        column_css[column] = f"{column_css[column]} background-color: {fill_color};".strip()
+
+    css_rules = [f"#{table_id} tbody td.gt_row {{ height: 40px; }}"]
+
+    for i, column in enumerate(report_columns):
+        if column in column_css:
+            css_rules.append(
+                f"#{table_id} tbody td.gt_row:nth-child({i + 1}) {{ {column_css[column]} }}"
+            )
+
+    return "\n".join(css_rules)
+
+
+def _get_column_resolution_table(data: FrameT | Any, pre: Callable | None) -> FrameT | Any:
+    """
+    Get the table (after any `pre=` function) used for resolving columns.
+
+    Without a `pre=` function, a zero-row slice of the target table is returned since only its
+    schema is needed. A `pre=` function is applied to the full table because the columns it
+    produces can depend on the data (e.g., with a pivot or one-hot encoding); resolving columns
+    only reads the schema of its output, so lazy tables aren't computed.
+    """
+
+    if pre is not None:
+        return pre(data)
+
+    if "ibis.expr.types.relations.Table" in str(type(data)):
+        return data.limit(0)
+
+    return nw.to_native(nw.from_native(data).head(0))
+
+
+def _check_table_file_steps(validation_info: list[_ValidationInfo]) -> None:
+    """
+    Check that all active steps can be interrogated with a table file's metadata alone.
+    """
+
+    for validation in validation_info:
+        if not validation.active:
+            continue
+
+        if validation.assertion_type not in TABLE_FILE_VALIDATION_TYPES:
+            raise ValueError(
+                f"The `{validation.assertion_type}()` validation step cannot be used when `data=` "
+                "is a path to a Parquet or Arrow IPC file. Only the `col_schema_match()`, "
+                "`row_count_match()`, and `col_count_match()` validation steps (which use the "
+                "file's metadata) are supported; read the file into a table to use other steps."
+            )
+
+        if validation.pre is not None:
+            raise ValueError(
+                "The `pre=` argument cannot be used when `data=` is a path to a Parquet or Arrow "
+                "IPC file."
+            )
+
+
 def _validation_info_as_dict(validation_info: _ValidationInfo) -> dict:
     """
     Convert a `_ValidationInfo` object to a dictionary.
@@ -8078,14 +9343,19 @@ def _validation_info_as_dict(validation_info: _ValidationInfo) -> dict:
 
 
 def _get_assertion_icon(icon: list[str], length_val: int = 30) -> list[str]:
-    # For each icon, get the assertion icon SVG test from SVG_ICONS_FOR_ASSERTION_TYPES dictionary
-    icon_svg = [SVG_ICONS_FOR_ASSERTION_TYPES.get(icon) for icon in icon]
-
-    # Replace the width and height in the SVG string
-    for i in range(len(icon_svg)):
-        icon_svg[i] = _replace_svg_dimensions(icon_svg[i], height_width=length_val)
+    # For each distinct icon, get the assertion icon SVG text from the
+    # SVG_ICONS_FOR_ASSERTION_TYPES dictionary and replace the width and height in the SVG string
+    icon_svg = {
+        name: _replace_svg_dimensions(
+            SVG_ICONS_FOR_ASSERTION_TYPES.get(name), height_width=length_val
+        )
+        for name in dict.fromkeys(icon)
+    }
 
-    return icon_svg
+    # Each icon references its SVG symbol (defined once in the report) instead of repeating it
+    return [
+        _get_svg_symbol_ref(svg=icon_svg[name], symbol_id=_get_svg_symbol_id(name)) for name in icon
+    ]
 
 
 def _replace_svg_dimensions(svg: list[str], height_width: int | float) -> list[str]:
@@ -8095,6 +9365,53 @@ def _replace_svg_dimensions(svg: list[str], height_width: int | float) -> list[s
     return svg
 
 
+def _get_svg_symbol_id(icon: str) -> str:
+    return f"pb-icon-{icon}"
+
+
+def _get_svg_symbol(svg: str, symbol_id: str) -> str:
+    """
+    Convert an SVG icon to a `<symbol>` element, which can be referenced by `<use>` elements.
+    """
+
+    svg_tag = re.search(r"<svg[^>]*>", svg).group(0)
+    view_box = re.search(r'viewBox="([^"]*)"', svg_tag).group(1)
+    svg_content = svg[svg.index(svg_tag) + len(svg_tag) : svg.rindex("</svg>")]
+
+    return f'<symbol id="{symbol_id}" viewBox="{view_box}">{svg_content}</symbol>'
+
+
+def _get_svg_symbol_ref(svg: str, symbol_id: str) -> str:
+    """
+    Get an SVG element that displays a symbol at the size (and with the style) of the SVG icon.
+    """
+
+    svg_tag = re.search(r"<svg[^>]*>", svg).group(0)
+
+    # Only the size and style of the icon are needed (the symbol has the `viewBox`)
+    svg_attrs = "".join(
+        f" {attr.group(0)}" for attr in re.finditer(r'\b(?:width|height|style)="[^"]*"', svg_tag)
+    )
+
+    return f'<svg{svg_attrs}><use href="#{symbol_id}"></use></svg>'
+
+
+def _create_svg_symbol_defs(icons: dict[str, str]) -> str:
+    """
+    Create a hidden SVG element that defines a symbol for each of the icons used in a report.
+    """
+
+    symbols = "".join(
+        _get_svg_symbol(svg=svg, symbol_id=_get_svg_symbol_id(icon)) for icon, svg in icons.items()
+    )
+
+    return (
+        '<svg aria-hidden="true" style="position: absolute; width: 0; height: 0; overflow: hidden;">'
+        f"{symbols}"
+        "</svg>"
+    )
+
+
 def _get_title_text(title: str | None, tbl_name: str | None, interrogation_performed: bool) -> str:
     title = _process_title_text(title=title, tbl_name=tbl_name)
 
@@ -8159,10 +9476,14 @@ def _transform_tbl_preprocessed(pre: str, interrogation_performed: bool) -> list
 
 
 def _get_preprocessed_table_icon(icon: list[str]) -> list[str]:
-    # For each icon, get the SVG icon from the SVG_ICONS_FOR_TBL_STATUS dictionary
-    icon_svg = [SVG_ICONS_FOR_TBL_STATUS.get(icon) for icon in icon]
-
-    return icon_svg
+    # For each icon, reference the symbol of the SVG icon from the SVG_ICONS_FOR_TBL_STATUS
+    # dictionary
+    return [
+        _get_svg_symbol_ref(
+            svg=SVG_ICONS_FOR_TBL_STATUS.get(name), symbol_id=_get_svg_symbol_id(name)
+        )
+        for name in icon
+    ]
 
 
 def _transform_eval(
@@ -8198,24 +9519,43 @@ def _transform_test_units(
     if not interrogation_performed:
         return ["" for _ in range(len(test_units))]
 
-    return [
-        (
-            (
-                str(test_units[i])
-                if test_units[i] < 10000
-                else str(vals.fmt_number(test_units[i], n_sigfig=3, compact=True)[0])
-            )
-            if active[i]
-            else "&mdash;"
-        )
-        for i in range(len(test_units))
-    ]
+    test_units_fmt = iter(_fmt_counts([n for n, is_active in zip(test_units, active) if is_active]))
+
+    return [next(test_units_fmt) if is_active else "&mdash;" for is_active in active]
 
 
 def _fmt_lg(value: int) -> str:
     return vals.fmt_number(value, n_sigfig=3, compact=True)[0]
 
 
+def _fmt_counts(values: list[int]) -> list[str]:
+    """
+    Format counts for the report, using a compact form (e.g., `"12.3K"`) for large values.
+    """
+
+    large_values_fmt = _fmt_distinct_values(
+        [value for value in values if value >= 10000], n_sigfig=3, compact=True
+    )
+
+    return [str(value) if value < 10000 else str(large_values_fmt[value]) for value in values]
+
+
+def _fmt_distinct_values(values: list[int | float], **fmt_args) -> dict[int | float, str]:
+    """
+    Format the distinct values of a list with `vals.fmt_number()`, in a single call.
+
+    Formatting one value at a time is slow and many steps of a large validation plan share the
+    same values (e.g., a fraction of `1.00` passing), so each distinct value is formatted once.
+    """
+
+    distinct_values = list(dict.fromkeys(values))
+
+    if not distinct_values:
+        return {}
+
+    return dict(zip(distinct_values, vals.fmt_number(distinct_values, **fmt_args)))
+
+
 def _transform_passed_failed(
     n_passed_failed: list[int],
     f_passed_failed: list[float],
@@ -8225,14 +9565,18 @@ def _transform_passed_failed(
     if not interrogation_performed:
         return ["" for _ in range(len(n_passed_failed))]
 
+    active_steps = [i for i, is_active in enumerate(active) if is_active]
+
+    if not active_steps:
+        return ["&mdash;" for _ in range(len(n_passed_failed))]
+
+    # Format the counts and fractions of all active steps at once
+    n_fmt = iter(_fmt_counts([n_passed_failed[i] for i in active_steps]))
+    f_fmt = _fmt_distinct_values([f_passed_failed[i] for i in active_steps], decimals=2)
+
     passed_failed = [
-        (
-            f"{n_passed_failed[i] if n_passed_failed[i] < 10000 else _fmt_lg(n_passed_failed[i])}"
-            f"<br />{vals.fmt_number(f_passed_failed[i], decimals=2)[0]}"
-            if active[i]
-            else "&mdash;"
-        )
-        for i in range(len(n_passed_failed))
+        f"{next(n_fmt)}<br />{f_fmt[f_passed_failed[i]]}" if is_active else "&mdash;"
+        for i, is_active in enumerate(active)
     ]
 
     return passed_failed
@@ -8277,7 +9621,7 @@ def _transform_assertion_str(assertion_str: list[str]) -> list[str]:
     type_upd = [
         f"""
         <div style="margin:0;padding:0;display:inline-block;height:30px;vertical-align:middle;">
-        <!--?xml version="1.0" encoding="UTF-8"?-->{svg}
+        {svg}
         </div>
         <span style="font-family: 'IBM Plex Mono', monospace, courier; color: black; font-size:{size}px;"> {assertion}</span>
         """
@@ -8451,10 +9795,13 @@ def _step_report_row_based(
     n_failed: int,
     all_passed: bool,
     extract: any,
-    tbl_preview: GT,
+    tbl_preview: GT | None,
+    extract_length: int | None = None,
 ):
-    # Get the length of the extracted data for the step
-    extract_length = get_row_count(extract)
+    # Get the length of the extracted data for the step (unless given, as for an extract that is
+    # only partially read in)
+    if extract_length is None:
+        extract_length = get_row_count(extract)
 
     # Generate explantory text for the validation step
     if assertion_type == "col_vals_gt":
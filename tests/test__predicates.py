@@ -0,0 +1,142 @@
+import pytest
+import warnings
+
+import ibis
+import narwhals as nw
+import pandas as pd
+import polars as pl
+
+from pointblank.column import col
+from pointblank._interrogation import Interrogator
+from pointblank._predicates import (
+    ColRef,
+    Compare,
+    FillNull,
+    IsNull,
+    Lit,
+    Predicate,
+    _build_predicate,
+)
+
+
+@pytest.fixture
+def tbl_dict():
+    return {"a": [1, 2, None, 4, 5], "b": [1, None, 3, 2, 9]}
+
+
+def _eval_nw(tbl, predicate):
+    return nw.from_native(tbl).select(res=predicate.to_narwhals())["res"].to_list()
+
+
+def _eval_ibis(tbl, predicate):
+    return tbl.select(res=predicate.to_ibis(tbl)).to_pandas()["res"].tolist()
+
+
+def test_predicate_nodes(tbl_dict):
+    tbl = pl.DataFrame(tbl_dict)
+
+    assert _eval_nw(tbl, Compare(op="gt", left=ColRef(name="a"), right=Lit(value=2))) == [
+        False,
+        False,
+        None,
+        True,
+        True,
+    ]
+    assert _eval_nw(tbl, IsNull(operand=ColRef(name="a"))) == [False, False, True, False, False]
+    assert _eval_nw(
+        tbl, FillNull(operand=Compare(op="gt", left=ColRef(name="a"), right=Lit(value=2)))
+    ) == [False, False, False, True, True]
+
+
+@pytest.mark.parametrize(
+    "assertion_method, values, inclusive, na_pass, expected",
+    [
+        ("gt", 2, None, False, [False, False, False, True, True]),
+        ("gt", 2, None, True, [False, False, True, True, True]),
+        ("ne", 2, None, False, [True, False, False, True, True]),
+        ("eq", col("b"), None, False, [True, False, False, False, False]),
+        ("eq", col("b"), None, True, [True, True, True, False, False]),
+        ("ne", col("b"), None, True, [False, True, True, True, True]),
+        ("between", (2, 4), (True, True), False, [False, True, False, True, False]),
+        ("between", (2, 4), (False, True), True, [False, False, True, True, False]),
+        ("outside", (2, 4), (True, True), False, [True, False, False, False, True]),
+        ("outside", (col("b"), 4), (True, True), False, [False, False, False, False, True]),
+        ("null", None, None, False, [False, False, True, False, False]),
+        ("not_null", None, None, False, [True, True, False, True, True]),
+    ],
+)
+def test_build_predicate_all_backends(
+    tbl_dict, assertion_method, values, inclusive, na_pass, expected
+):
+    predicate = _build_predicate(
+        assertion_method=assertion_method,
+        column="a",
+        values=values,
+        inclusive=inclusive,
+        na_pass=na_pass,
+    )
+
+    assert _eval_nw(pl.DataFrame(tbl_dict), predicate) == expected
+    assert _eval_nw(pd.DataFrame(tbl_dict), predicate) == expected
+    assert _eval_ibis(ibis.memtable(pl.DataFrame(tbl_dict)), predicate) == expected
+
+
+def test_build_predicate_compare_by_difference():
+    # Object columns with `pd.NA` values can't be compared directly in Pandas
+    tbl = pd.DataFrame({"a": [1, pd.NA, 3, 4], "b": [pd.NA, 2, 3, 5]})
+
+    predicate = _build_predicate(
+        assertion_method="eq", column="a", values=col("b"), compare_by_difference=True
+    )
+
+    assert _eval_nw(tbl, predicate) == [False, False, True, False]
+
+
+def test_build_predicate_regex_and_sets():
+    tbl = pl.DataFrame({"a": ["x1", "y2", None, "x3"]})
+
+    regex = _build_predicate(assertion_method="regex", column="a", values=r"^x", na_pass=False)
+    in_set = _build_predicate(assertion_method="in_set", column="a", values=["x1", "y2"])
+    not_in_set = _build_predicate(assertion_method="not_in_set", column="a", values=["x1", "y2"])
+
+    assert _eval_nw(tbl, regex) == [True, False, False, True]
+    assert _eval_nw(tbl, in_set)[:2] == [True, True]
+    assert _eval_nw(tbl, not_in_set)[3] is True
+
+
+def test_build_predicate_regex_pd_no_warning():
+    tbl = pd.DataFrame({"a": ["x1", None, "y2"]})
+
+    regex = _build_predicate(assertion_method="regex", column="a", values=r"^x", na_pass=False)
+
+    # Filling the missing results of an object column shouldn't emit a Pandas downcasting warning
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", FutureWarning)
+
+        assert _eval_nw(tbl, regex) == [True, False, False]
+
+
+def test_predicate_is_abstract():
+    with pytest.raises(TypeError):
+        Predicate()
+
+
+def test_build_predicate_invalid_method():
+    with pytest.raises(ValueError):
+        _build_predicate(assertion_method="rows_distinct", column="a")
+
+
+@pytest.mark.parametrize("tbl_lib", ["polars", "pandas", "ibis"])
+def test_interrogator_no_intermediate_columns(tbl_dict, tbl_lib):
+    if tbl_lib == "polars":
+        tbl, tbl_type = nw.from_native(pl.DataFrame(tbl_dict)), "local"
+    elif tbl_lib == "pandas":
+        tbl, tbl_type = nw.from_native(pd.DataFrame(tbl_dict)), "local"
+    else:
+        tbl, tbl_type = ibis.memtable(pl.DataFrame(tbl_dict)), "memtable"
+
+    res = Interrogator(
+        x=tbl, column="a", low=2, high=col("b"), inclusive=(True, True), tbl_type=tbl_type
+    ).between()
+
+    assert list(nw.from_native(res).columns) == ["a", "b", "pb_is_good_"]
@@ -0,0 +1,236 @@
+import shutil
+
+import pytest
+
+import narwhals as nw
+import pyarrow.dataset as ds
+import pandas as pd
+import polars as pl
+
+from pointblank._utils_extract import (
+    _collect_extract_with_budget,
+    _ExtractBudget,
+    _ExtractReservoir,
+    _get_sample_size,
+    _get_spilled_extract_preview,
+    _is_spilled_extract,
+    _iter_failing_row_nums,
+    _iter_local_extract_batches,
+    _parse_extract_limit,
+)
+
+
+@pytest.fixture
+def tbl_mask():
+    tbl = pl.DataFrame({"a": list(range(10))})
+    mask = nw.from_native(tbl.select(pb_is_good_=pl.col("a") >= 4)["pb_is_good_"], series_only=True)
+
+    return tbl, mask
+
+
+@pytest.mark.parametrize(
+    "limit, expected",
+    [
+        (None, (None, None)),
+        (0, (0, None)),
+        (100, (100, None)),
+        ("500kB", (None, 500_000)),
+        ("250MB", (None, 250_000_000)),
+        ("1.5GB", (None, 1_500_000_000)),
+        ("2 MiB", (None, 2 * 1024**2)),
+    ],
+)
+def test_parse_extract_limit(limit, expected):
+    assert _parse_extract_limit(limit, param_name="extract_limit") == expected
+
+
+@pytest.mark.parametrize("limit", [-1, True, "100", "100 rows", 1.5])
+def test_parse_extract_limit_invalid(limit):
+    with pytest.raises(ValueError):
+        _parse_extract_limit(limit, param_name="extract_limit")
+
+
+def test_extract_budget_step_limits():
+    budget = _ExtractBudget(max_rows=10, max_rows_total=25)
+
+    assert budget.get_step_limits() == (10, None)
+
+    budget.used_rows = 20
+
+    assert budget.get_step_limits() == (5, None)
+
+    budget.used_rows = 30
+
+    assert budget.get_step_limits() == (0, None)
+
+
+def test_iter_local_extract_batches(tbl_mask, monkeypatch):
+    tbl, mask = tbl_mask
+
+    monkeypatch.setattr("pointblank._utils_extract.EXTRACT_CHUNK_SIZE", 3)
+
+    batches = list(_iter_local_extract_batches(tbl=tbl, mask=mask))
+
+    assert [batch.num_rows for batch in batches] == [3, 1, 0, 0]
+    assert sum((batch["_row_num_"].to_pylist() for batch in batches), []) == [1, 2, 3, 4]
+
+    batches = list(_iter_local_extract_batches(tbl=tbl, mask=mask, get_first_n=2))
+
+    assert sum((batch["_row_num_"].to_pylist() for batch in batches), []) == [1, 2]
+
+
+def test_collect_extract_in_memory(tbl_mask):
+    tbl, mask = tbl_mask
+    budget = _ExtractBudget(max_rows=4)
+
+    extract = _collect_extract_with_budget(
+        batches=_iter_local_extract_batches(tbl=tbl, mask=mask),
+        budget=budget,
+        step=1,
+        df_lib_name="pandas",
+    )
+
+    assert isinstance(extract, pd.DataFrame)
+    assert extract["a"].tolist() == [0, 1, 2, 3]
+    assert budget.used_rows == 4
+    assert budget.spill_dir is None
+
+
+def test_collect_extract_spilled(tbl_mask, tmp_path):
+    tbl, mask = tbl_mask
+    budget = _ExtractBudget(max_rows=3, spill_dir=str(tmp_path))
+
+    extract = _collect_extract_with_budget(
+        batches=_iter_local_extract_batches(tbl=tbl, mask=mask),
+        budget=budget,
+        step=2,
+        df_lib_name="polars",
+    )
+
+    assert _is_spilled_extract(extract)
+    assert extract.collect()["_row_num_"].to_list() == [1, 2, 3, 4]
+    assert budget.used_rows == 0
+
+    spilled_files = list(tmp_path.iterdir())
+
+    assert len(spilled_files) == 1
+    assert spilled_files[0].name.startswith("extract_0002_")
+
+    head, n_rows = _get_spilled_extract_preview(extract=extract, n=2)
+
+    assert head.shape == (2, 2)
+    assert n_rows == 4
+
+
+def test_extract_budget_temp_spill_dir(monkeypatch):
+    registered = []
+
+    monkeypatch.setattr(
+        "pointblank._utils_extract.atexit.register", lambda *args, **kwargs: registered.append(args)
+    )
+
+    budget = _ExtractBudget(max_rows=1)
+    budget.get_spill_path(step=1)
+    budget.get_spill_path(step=2)
+
+    # A temporary directory is created once and removed at exit
+    assert len(registered) == 1
+    assert registered[0][1] == budget.spill_dir
+
+    shutil.rmtree(budget.spill_dir)
+
+
+def test_collect_extract_spilled_pd(tmp_path):
+    tbl = pd.DataFrame({"a": list(range(10))})
+    mask = nw.from_native(
+        pd.Series([x >= 4 for x in range(10)], name="pb_is_good_"), series_only=True
+    )
+    budget = _ExtractBudget(max_rows=3, spill_dir=str(tmp_path))
+
+    extract = _collect_extract_with_budget(
+        batches=_iter_local_extract_batches(tbl=tbl, mask=mask),
+        budget=budget,
+        step=1,
+        df_lib_name="pandas",
+    )
+
+    assert isinstance(extract, ds.Dataset)
+    assert extract.to_table().column_names == ["_row_num_", "a"]
+
+
+def test_collect_extract_spilled_by_bytes(tbl_mask, tmp_path):
+    tbl, mask = tbl_mask
+    budget = _ExtractBudget(max_bytes=1, spill_dir=str(tmp_path))
+
+    extract = _collect_extract_with_budget(
+        batches=_iter_local_extract_batches(tbl=tbl, mask=mask),
+        budget=budget,
+        step=1,
+        df_lib_name="polars",
+    )
+
+    assert _is_spilled_extract(extract)
+
+
+def test_is_spilled_extract():
+    assert not _is_spilled_extract(None)
+    assert not _is_spilled_extract(pl.DataFrame({"a": [1]}))
+    assert not _is_spilled_extract(pd.DataFrame({"a": [1]}))
+
+
+def test_extract_reservoir_is_deterministic():
+    row_nums = nw.from_native(pl.Series(list(range(1, 1001))), series_only=True)
+
+    reservoir_1 = _ExtractReservoir(size=10, seed=23)
+    reservoir_1.update(row_nums=row_nums)
+
+    # Splitting the stream differently gives the same sample
+    reservoir_2 = _ExtractReservoir(size=10, seed=23)
+    for offset in range(0, 1000, 7):
+        reservoir_2.update(row_nums=row_nums[offset : offset + 7])
+
+    assert reservoir_1.get_row_nums() == reservoir_2.get_row_nums()
+    assert len(set(reservoir_1.get_row_nums())) == 10
+    assert reservoir_1.n_seen == 1000
+
+    reservoir_3 = _ExtractReservoir(size=10, seed=24)
+    reservoir_3.update(row_nums=row_nums)
+
+    assert reservoir_1.get_row_nums() != reservoir_3.get_row_nums()
+
+
+def test_extract_reservoir_small_streams():
+    row_nums = nw.from_native(pl.Series([5, 8, 13]), series_only=True)
+
+    reservoir = _ExtractReservoir(size=5, seed=1)
+    reservoir.update(row_nums=row_nums)
+
+    assert reservoir.get_row_nums() == [5, 8, 13]
+
+    reservoir = _ExtractReservoir(size=0, seed=1)
+    reservoir.update(row_nums=row_nums)
+
+    assert reservoir.get_row_nums() == []
+
+
+def test_iter_failing_row_nums(tbl_mask, monkeypatch):
+    _, mask = tbl_mask
+
+    monkeypatch.setattr("pointblank._utils_extract.EXTRACT_CHUNK_SIZE", 3)
+
+    chunks = [row_nums.to_list() for row_nums in _iter_failing_row_nums(mask=mask)]
+
+    assert chunks == [[1, 2, 3], [4], [], []]
+
+
+@pytest.mark.parametrize(
+    "sample_n, sample_frac, sample_limit, expected",
+    [(5, None, 5000, 5), (None, 0.1, 5000, 10), (None, 0.5, 20, 20)],
+)
+def test_get_sample_size(sample_n, sample_frac, sample_limit, expected):
+    assert (
+        _get_sample_size(
+            n_failing=100, sample_n=sample_n, sample_frac=sample_frac, sample_limit=sample_limit
+        )
+        == expected
+    )
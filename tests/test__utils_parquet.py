@@ -0,0 +1,253 @@
+import pathlib
+
+import pytest
+
+import ibis
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from pointblank.schema import Schema
+from pointblank.validate import Validate, get_column_count, get_row_count
+from pointblank._utils_parquet import (
+    _decide_range,
+    _get_parquet_paths,
+    _get_parquet_row_count,
+    _get_parquet_step_counts,
+    _get_table_file_row_count,
+    _get_table_file_schema,
+)
+
+
+@pytest.fixture
+def parquet_row_groups(tmp_path):
+    # Three row groups: [1, 2, 3], [4, None, 6], [7, 8, 9]
+    tbl = pa.table(
+        {
+            "x": pa.array([1, 2, 3, 4, None, 6, 7, 8, 9], type=pa.int64()),
+            "y": pa.array([0.5] * 9, type=pa.float64()),
+        }
+    )
+
+    path = tmp_path / "tbl_row_groups.parquet"
+    pq.write_table(tbl, path, row_group_size=3)
+
+    return path
+
+
+def test_get_parquet_paths(parquet_row_groups):
+    tbl = ibis.read_parquet(parquet_row_groups)
+
+    assert _get_parquet_paths(data=tbl) == [str(parquet_row_groups)]
+
+
+def test_get_parquet_paths_glob(parquet_row_groups):
+    tbl = ibis.read_parquet(str(parquet_row_groups.parent / "*.parquet"))
+
+    assert _get_parquet_paths(data=tbl) == [str(parquet_row_groups)]
+
+
+def test_get_parquet_paths_not_parquet():
+    tbl = ibis.memtable({"x": [1, 2, 3]})
+
+    assert _get_parquet_paths(data=tbl) is None
+
+
+@pytest.mark.parametrize(
+    "assertion_method, values, inclusive, expected",
+    [
+        ("gt", 0, None, True),
+        ("gt", 9, None, False),
+        ("gt", 5, None, None),
+        ("ge", 1, None, True),
+        ("ge", 10, None, False),
+        ("lt", 10, None, True),
+        ("lt", 1, None, False),
+        ("le", 9, None, True),
+        ("le", 0, None, False),
+        ("between", (1, 9), (True, True), True),
+        ("between", (1, 9), (False, True), None),
+        ("between", (10, 20), (True, True), False),
+        ("outside", (10, 20), (True, True), True),
+        ("outside", (0, 10), (True, True), False),
+        ("outside", (5, 6), (True, True), None),
+    ],
+)
+def test_decide_range(assertion_method, values, inclusive, expected):
+    assert (
+        _decide_range(
+            assertion_method=assertion_method,
+            min_val=1,
+            max_val=9,
+            values=values,
+            inclusive=inclusive,
+        )
+        is expected
+    )
+
+
+@pytest.mark.parametrize(
+    "assertion_method, values, inclusive, na_pass, expected",
+    [
+        ("gt", 0, None, False, (9, 8, 1)),
+        ("gt", 0, None, True, (9, 9, 0)),
+        ("gt", 5, None, False, (9, 4, 5)),
+        ("ge", 4, None, True, (9, 6, 3)),
+        ("lt", 7, None, False, (9, 5, 4)),
+        ("le", 100, None, False, (9, 8, 1)),
+        ("between", (2, 8), (True, True), False, (9, 6, 3)),
+        ("between", (2, 8), (False, False), True, (9, 5, 4)),
+        ("outside", (2, 8), (True, True), False, (9, 2, 7)),
+        ("null", None, None, False, (9, 1, 8)),
+        ("not_null", None, None, False, (9, 8, 1)),
+    ],
+)
+def test_get_parquet_step_counts(
+    parquet_row_groups, assertion_method, values, inclusive, na_pass, expected
+):
+    tbl = ibis.read_parquet(parquet_row_groups)
+
+    counts = _get_parquet_step_counts(
+        data=tbl,
+        assertion_method=assertion_method,
+        column="x",
+        values=values,
+        inclusive=inclusive,
+        na_pass=na_pass,
+    )
+
+    assert counts == expected
+
+
+def test_get_parquet_step_counts_not_prunable(parquet_row_groups):
+    tbl = ibis.read_parquet(parquet_row_groups)
+
+    # Floating point columns, non-numeric values, and other assertion types aren't pruned
+    assert _get_parquet_step_counts(tbl, "gt", "y", 0, None, False) is None
+    assert _get_parquet_step_counts(tbl, "gt", "x", "a", None, False) is None
+    assert _get_parquet_step_counts(tbl, "in_set", "x", [1, 2], None, False) is None
+    assert _get_parquet_step_counts(tbl, "gt", "z", 0, None, False) is None
+
+
+def test_parquet_pruning_matches_full_scan(parquet_row_groups):
+    tbl_parquet = ibis.read_parquet(parquet_row_groups)
+    tbl_memtable = ibis.memtable(pq.read_table(parquet_row_groups).to_pandas())
+
+    def validation_counts(tbl):
+        validation = (
+            Validate(data=tbl)
+            .col_vals_gt(columns="x", value=3)
+            .col_vals_ge(columns="x", value=0, na_pass=True)
+            .col_vals_between(columns="x", left=2, right=8)
+            .col_vals_outside(columns="x", left=2, right=8, inclusive=(False, False))
+            .col_vals_not_null(columns="x")
+            .col_vals_gt(columns="y", value=0)
+            .interrogate()
+        )
+
+        return [
+            (step.n, step.n_passed, step.n_failed, step.all_passed)
+            for step in validation.validation_info
+        ]
+
+    assert validation_counts(tbl_parquet) == validation_counts(tbl_memtable)
+
+
+def test_parquet_pruning_with_existing_file():
+    file_path = pathlib.Path.cwd() / "tests" / "tbl_files" / "tbl_xyz.parquet"
+    tbl = ibis.read_parquet(file_path)
+
+    validation = Validate(data=tbl).col_vals_ge(columns="x", value=0).interrogate()
+
+    assert validation.n_passed(i=1, scalar=True) == 4
+    assert validation.all_passed()
+
+
+@pytest.fixture
+def arrow_ipc_file(tmp_path):
+    tbl = pa.table({"x": pa.array([1, 2, 3, 4, 5], type=pa.int64()), "z": ["a"] * 5})
+
+    path = tmp_path / "tbl.arrow"
+
+    with pa.ipc.new_file(path, tbl.schema) as writer:
+        writer.write_table(tbl, max_chunksize=2)
+
+    return path
+
+
+def test_get_table_file_metadata(parquet_row_groups, arrow_ipc_file):
+    assert _get_table_file_schema(path=parquet_row_groups, file_type="parquet_file").names == [
+        "x",
+        "y",
+    ]
+    assert _get_table_file_row_count(path=parquet_row_groups, file_type="parquet_file") == 9
+
+    assert _get_table_file_schema(path=arrow_ipc_file, file_type="arrow_file").names == ["x", "z"]
+    assert _get_table_file_row_count(path=arrow_ipc_file, file_type="arrow_file") == 5
+
+    assert get_row_count(str(parquet_row_groups)) == 9
+    assert get_column_count(arrow_ipc_file) == 2
+
+
+def test_get_parquet_row_count(parquet_row_groups):
+    tbl = ibis.read_parquet(parquet_row_groups)
+
+    assert _get_parquet_row_count(data=tbl) == 9
+    assert get_row_count(tbl) == 9
+
+    # A filtered table isn't backed by the files alone so its rows are counted by the backend
+    assert _get_parquet_row_count(data=tbl.filter(tbl.x > 3)) is None
+    assert get_row_count(tbl.filter(tbl.x > 3)) == 5
+
+
+def test_validate_table_files_without_reading_data(parquet_row_groups, arrow_ipc_file, monkeypatch):
+    def fail_read(*args, **kwargs):
+        raise AssertionError("Data was read from the file")
+
+    monkeypatch.setattr(pq.ParquetFile, "read", fail_read)
+    monkeypatch.setattr(pq.ParquetFile, "read_row_groups", fail_read)
+    monkeypatch.setattr(pq, "read_table", fail_read)
+    monkeypatch.setattr(pa.ipc.RecordBatchFileReader, "read_all", fail_read)
+
+    validation = (
+        Validate(data=parquet_row_groups)
+        .col_schema_match(schema=Schema(columns=[("x", "int64"), ("y", "double")]))
+        .col_schema_match(schema=Schema(tbl=arrow_ipc_file))
+        .row_count_match(count=9)
+        .row_count_match(count=arrow_ipc_file)
+        .col_count_match(count=2)
+        .interrogate()
+    )
+
+    assert [step.all_passed for step in validation.validation_info] == [
+        True,
+        False,
+        True,
+        False,
+        True,
+    ]
+    assert [step.n for step in validation.validation_info] == [1] * 5
+
+    validation.get_tabular_report()
+    validation.get_step_report(i=2)
+
+    validation = Validate(data=str(arrow_ipc_file)).row_count_match(count=5).interrogate()
+
+    assert validation.all_passed()
+
+
+def test_validate_table_files_unsupported_steps(parquet_row_groups):
+    with pytest.raises(ValueError, match="col_vals_gt"):
+        Validate(data=parquet_row_groups).col_vals_gt(columns="x", value=0).interrogate()
+
+    with pytest.raises(ValueError, match="pre="):
+        Validate(data=parquet_row_groups).row_count_match(count=9, pre=lambda df: df).interrogate()
+
+    # Inactive steps aren't interrogated and so are allowed
+    validation = (
+        Validate(data=parquet_row_groups)
+        .col_vals_gt(columns="x", value=0, active=False)
+        .row_count_match(count=9)
+        .interrogate()
+    )
+
+    assert validation.validation_info[1].all_passed
@@ -0,0 +1,136 @@
+import bisect
+import datetime
+import random
+
+import narwhals as nw
+import numpy as np
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pytest
+
+from pointblank._utils_sketch import (
+    _count_leading_zeros,
+    _hash_array,
+    _hash_series,
+    _HyperLogLog,
+    _QuantileSketch,
+)
+
+
+def pl_series(values):
+    return nw.from_native(pl.Series(values), series_only=True)
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [1, 2, 2, None],
+        [1.5, 2.5, 2.5, None],
+        [True, False, False, None],
+        ["a", "b", "b", None],
+        [datetime.date(2024, 1, 1), datetime.date(2024, 1, 2), datetime.date(2024, 1, 2), None],
+        [datetime.datetime(2024, 1, 1), datetime.datetime(2024, 1, 2), None, None],
+    ],
+)
+@pytest.mark.parametrize("df_lib", ["pandas", "polars"])
+def test_hash_series(values, df_lib):
+    series = pl.Series(values)
+    series = series.to_pandas() if df_lib == "pandas" else series
+
+    hashes = _hash_series(nw.from_native(series, series_only=True))
+
+    assert hashes.dtype == np.uint64
+    assert len(hashes) == len([value for value in values if value is not None])
+    assert len(set(hashes.tolist())) == 2
+
+
+def test_hash_series_numbers_across_libraries():
+    values = [1.0, 2.5, None]
+
+    assert (
+        _hash_series(pl_series(values)).tolist()
+        == _hash_series(nw.from_native(pd.Series(values), series_only=True)).tolist()
+    )
+
+
+def test_hash_array():
+    hashes = _hash_array(pa.array(["a", "b", "b", None]))
+
+    assert hashes.type == pa.uint64()
+    assert len(hashes) == 2
+
+
+def test_count_leading_zeros():
+    values = [0, 1, 3, 2**53 - 1, 2**53, 2**53 + 1, 2**63, 2**64 - 1]
+
+    assert _count_leading_zeros(np.array(values, dtype=np.uint64)).tolist() == [
+        64 - value.bit_length() for value in values
+    ]
+
+
+@pytest.mark.parametrize("n_distinct", [0, 1, 10, 1000, 50_000])
+def test_hyperloglog_estimate(n_distinct):
+    sketch = _HyperLogLog()
+
+    values = list(range(n_distinct)) * 2
+
+    for start in range(0, len(values), 10_000):
+        sketch.update(pl_series(values[start : start + 10_000]))
+
+    assert abs(sketch.estimate() - n_distinct) <= max(1, 4 * sketch.rel_std_error() * n_distinct)
+
+
+def test_hyperloglog_merge():
+    sketch_1 = _HyperLogLog()
+    sketch_1.update(pl_series(list(range(3000))))
+
+    sketch_2 = _HyperLogLog()
+    sketch_2.update(pl_series(list(range(2000, 5000))))
+
+    merged = sketch_1.merge(sketch_2)
+
+    assert abs(merged.estimate() - 5000) <= 4 * merged.rel_std_error() * 5000
+
+    with pytest.raises(ValueError):
+        sketch_1.merge(_HyperLogLog(p=10))
+
+
+def test_quantile_sketch_small():
+    sketch = _QuantileSketch()
+    sketch.update(pl_series([3.0, 1.0, None, 2.0, float("nan")]))
+
+    assert sketch.n == 3
+    assert sketch.quantile(0.0) == 1.0
+    assert sketch.quantile(0.5) == 2.0
+    assert sketch.quantile(1.0) == 3.0
+    assert sketch.rank_error() == 0.0
+
+    assert _QuantileSketch().quantile(0.5) is None
+
+
+def test_quantile_sketch_error_bound():
+    rng = random.Random(3)
+    values = [rng.gauss(0, 1) for _ in range(200_000)]
+
+    sketch_1 = _QuantileSketch(seed=1)
+    sketch_2 = _QuantileSketch(seed=2)
+
+    for start in range(0, 100_000, 25_000):
+        sketch_1.update(pl_series(values[start : start + 25_000]))
+    for start in range(100_000, 200_000, 25_000):
+        sketch_2.update(pl_series(values[start : start + 25_000]))
+
+    merged = sketch_1.merge(sketch_2)
+    sorted_values = sorted(values)
+
+    assert merged.n == 200_000
+    assert 0 < merged.rank_error() < 0.05
+
+    for q in [0.05, 0.25, 0.5, 0.75, 0.95]:
+        rank = bisect.bisect(sorted_values, merged.quantile(q)) / len(sorted_values)
+
+        assert abs(rank - q) <= merged.rank_error()
+
+    # The sketch stays small
+    assert sum(len(compactor) for compactor in merged.compactors) < 10 * merged.k
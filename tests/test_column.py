@@ -22,6 +22,8 @@ from pointblank.column import (
     OrSelector,
     SubSelector,
     NotSelector,
+    _resolve_column_expr,
+    _COLUMN_RESOLUTION_CACHE,
 )
 
 import pandas as pd
@@ -1396,3 +1398,86 @@ def test_nw_selectors(request, tbl_fixture):
     )
 
     assert len(validation.n()) == 6
+
+
+def test_nw_selectors_ibis_table():
+    tbl = ibis.memtable(pd.DataFrame({"a": [1, 2], "b": ["x", "y"], "c": [1.5, 2.5]}))
+
+    validation = Validate(data=tbl).col_vals_gt(columns=ncs.numeric(), value=0).interrogate()
+
+    assert [step.column for step in validation.validation_info] == ["a", "c"]
+    assert validation.all_passed()
+
+
+def test_resolve_column_expr_cache():
+    _COLUMN_RESOLUTION_CACHE.clear()
+
+    tbl = pl.DataFrame({"a_1": [1], "a_2": [2.0], "b": ["x"]})
+
+    assert _resolve_column_expr(column_expr=col(starts_with("a")), table=tbl) == ["a_1", "a_2"]
+    assert len(_COLUMN_RESOLUTION_CACHE) == 1
+
+    # An equivalent selector on a table with the same schema reuses the cached columns
+    tbl_2 = pl.DataFrame({"a_1": [3, 4], "a_2": [5.0, 6.0], "b": ["y", "z"]})
+
+    assert _resolve_column_expr(column_expr=col(starts_with("a")), table=tbl_2) == ["a_1", "a_2"]
+    assert len(_COLUMN_RESOLUTION_CACHE) == 1
+
+    # A change in the schema gives a different resolution
+    tbl_3 = tbl.rename({"a_2": "b_2"})
+
+    assert _resolve_column_expr(column_expr=col(starts_with("a")), table=tbl_3) == ["a_1"]
+    assert len(_COLUMN_RESOLUTION_CACHE) == 2
+
+    # Narwhals selectors are resolved using the dtypes of the schema
+    assert _resolve_column_expr(column_expr=col(ncs.numeric()), table=tbl) == ["a_1", "a_2"]
+    assert _resolve_column_expr(column_expr=col(ncs.string()), table=tbl) == ["b"]
+
+
+def test_column_resolution_pre_full_table():
+    tbl = pl.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+
+    n_rows_seen = []
+
+    def add_col(df):
+        n_rows_seen.append(len(df))
+        return df.with_columns(c=pl.col("a") + pl.col("b"))
+
+    validation = (
+        Validate(data=tbl)
+        .col_vals_gt(columns=col(everything()), value=0, pre=add_col)
+        .interrogate()
+    )
+
+    assert [step.column for step in validation.validation_info] == ["a", "b", "c"]
+    assert validation.all_passed()
+
+    # The `pre=` function is applied once to the full table to resolve the columns, then for
+    # each step
+    assert n_rows_seen == [3, 3, 3, 3]
+
+
+def test_column_resolution_pre_data_dependent():
+    tbl = pl.DataFrame({"id": [1, 2, 3], "k": ["x", "y", "x"], "v": [0.5, 1.5, 2.5]})
+
+    # The columns produced by `to_dummies()` depend on the values in the table
+    validation = (
+        Validate(data=tbl)
+        .col_vals_ge(
+            columns=col(starts_with("k_")), value=0, pre=lambda df: df.to_dummies(columns=["k"])
+        )
+        .interrogate()
+    )
+
+    assert [step.column for step in validation.validation_info] == ["k_x", "k_y"]
+    assert not any(step.eval_error for step in validation.validation_info)
+    assert validation.all_passed()
+
+    validation = (
+        Validate(data=tbl)
+        .col_vals_not_null(columns=col(matches(".")), pre=lambda df: df.to_dummies(columns=["k"]))
+        .interrogate()
+    )
+
+    assert [step.column for step in validation.validation_info] == ["id", "k_x", "k_y", "v"]
+    assert validation.all_passed()
@@ -1,5 +1,6 @@
 import pytest
 import sys
+import threading
 
 from unittest.mock import patch
 
@@ -12,6 +13,12 @@ from pointblank.datascan import (
     _compact_0_1_fmt,
     _compact_decimal_fmt,
     _compact_integer_fmt,
+    _get_column_agg_exprs,
+    _get_column_kind,
+    _get_ibis_column_agg_exprs,
+    _get_ibis_column_kind,
+    _partition_columns,
+    _PROFILE_CACHE,
 )
 
 
@@ -189,6 +196,377 @@ def test_col_summary_tbl_duckdb_snap(snapshot):
     snapshot.assert_match(col_summary_html, "col_summary_html_duckdb.html")
 
 
+@pytest.mark.parametrize("df_lib", ["pandas", "polars"])
+def test_datascan_profile_df_statistics(df_lib):
+    data = {
+        "num": [-2.0, 0.0, 1.0, 3.0, None],
+        "str": ["a", "bb", None, "dddd", "ccc"],
+        "bool": [True, False, True, False, True],
+    }
+
+    if df_lib == "pandas":
+        import pandas as pd
+
+        tbl = pd.DataFrame(data)
+    else:
+        import polars as pl
+
+        tbl = pl.DataFrame(data)
+
+    num_profile, str_profile, bool_profile = DataScan(data=tbl).profile["columns"]
+
+    assert num_profile["n_missing_values"] == 1
+    assert num_profile["n_unique_values"] == 4
+    assert num_profile["n_negative_values"] == 1
+    assert num_profile["n_zero_values"] == 1
+    assert num_profile["n_positive_values"] == 2
+    assert num_profile["statistics"]["numerical"]["quantiles"] == {
+        "min": -2.0,
+        "p05": -1.7,
+        "q_1": -0.5,
+        "med": 0.5,
+        "q_3": 1.5,
+        "p95": 2.7,
+        "max": 3.0,
+        "iqr": 2.0,
+    }
+    assert num_profile["statistics"]["numerical"]["descriptive"]["mean"] == 0.5
+
+    assert str_profile["statistics"]["string_lengths"]["quantiles"]["min"] == 1
+    assert str_profile["statistics"]["string_lengths"]["quantiles"]["max"] == 4
+    assert str_profile["statistics"]["string_lengths"]["descriptive"]["mean"] == 2.5
+
+    assert bool_profile["statistics"]["boolean"]["n_true_values"] == 3
+    assert bool_profile["statistics"]["boolean"]["n_false_values"] == 2
+
+
+def test_get_column_agg_exprs():
+    assert _get_column_kind(dtype_str="Int64") == "numerical"
+    assert _get_column_kind(dtype_str="String") == "string"
+    assert _get_column_kind(dtype_str="Datetime(time_unit='us', time_zone=None)") == "datetime"
+    assert _get_column_kind(dtype_str="Boolean") == "boolean"
+    assert _get_column_kind(dtype_str="object") is None
+
+    assert list(_get_column_agg_exprs(column="a", column_kind=None)) == ["n_missing", "n_unique"]
+    assert list(_get_column_agg_exprs(column="a", column_kind="datetime")) == [
+        "n_missing",
+        "n_unique",
+        "min",
+        "max",
+    ]
+    assert "n_negative" in _get_column_agg_exprs(column="a", column_kind="numerical")
+    assert "n_negative" not in _get_column_agg_exprs(column="a", column_kind="string")
+    assert "n_true" in _get_column_agg_exprs(column="a", column_kind="boolean")
+
+
+def test_datascan_profile_ibis_statistics():
+    import ibis
+    import polars as pl
+
+    tbl = pl.DataFrame(
+        {
+            "num": [-2.0, 0.0, 1.0, 3.0, None],
+            "str": ["a", "bb", None, "dddd", "ccc"],
+            "bool": [True, False, True, None, True],
+        }
+    )
+
+    scanner = DataScan(data=ibis.memtable(tbl))
+    num_profile, str_profile, bool_profile = scanner.profile["columns"]
+
+    assert scanner.profile["dimensions"] == {"rows": 5, "columns": 3}
+
+    assert num_profile["n_missing_values"] == 1
+    assert num_profile["n_negative_values"] == 1
+    assert num_profile["n_zero_values"] == 1
+    assert num_profile["n_positive_values"] == 2
+    # Sample data is taken from rows without any missing values
+    assert num_profile["sample_data"] == [-2.0, 0.0]
+    assert num_profile["statistics"]["numerical"]["quantiles"]["min"] == -2.0
+    assert num_profile["statistics"]["numerical"]["quantiles"]["max"] == 3.0
+    assert num_profile["statistics"]["numerical"]["descriptive"]["mean"] == 0.5
+
+    assert str_profile["statistics"]["string_lengths"]["quantiles"]["max"] == 4
+
+    assert bool_profile["statistics"]["boolean"]["n_true_values"] == 3
+    assert bool_profile["statistics"]["boolean"]["n_false_values"] == 1
+
+    # The profile can be serialized (all statistics are Python scalars)
+    assert isinstance(scanner.to_json(), str)
+
+
+def test_get_ibis_column_agg_exprs():
+    import ibis
+
+    tbl = ibis.memtable({"a": [1, 2, 3]})
+
+    assert _get_ibis_column_kind(dtype_str="int64") == "numerical"
+    assert _get_ibis_column_kind(dtype_str="!string") == "string"
+    assert _get_ibis_column_kind(dtype_str="timestamp") == "datetime"
+    assert _get_ibis_column_kind(dtype_str="boolean") == "boolean"
+    assert _get_ibis_column_kind(dtype_str="array<int64>") == "numerical"
+    assert _get_ibis_column_kind(dtype_str="json") is None
+
+    assert list(_get_ibis_column_agg_exprs(col_data=tbl["a"], column_kind=None)) == [
+        "n_missing",
+        "n_unique",
+    ]
+    assert "q_1_exact" in _get_ibis_column_agg_exprs(col_data=tbl["a"], column_kind="numerical")
+
+
+@pytest.mark.parametrize("tbl_type", ["pandas", "polars", "duckdb"])
+def test_datascan_approx(tbl_type):
+    dataset = load_dataset(dataset="game_revenue", tbl_type=tbl_type)
+
+    profile_exact = DataScan(data=dataset).profile
+    profile_approx = DataScan(data=dataset, approx=True).profile
+
+    for col_exact, col_approx in zip(profile_exact["columns"], profile_approx["columns"]):
+        assert "approx" not in col_exact
+        assert col_approx["n_missing_values"] == col_exact["n_missing_values"]
+
+        n_unique_info = col_approx["approx"]["n_unique_values"]
+
+        if tbl_type == "duckdb":
+            assert n_unique_info == {"method": "backend", "rel_std_error": None}
+        else:
+            assert n_unique_info["method"] == "hyperloglog"
+            assert abs(col_approx["n_unique_values"] - col_exact["n_unique_values"]) <= max(
+                2, 4 * n_unique_info["rel_std_error"] * col_exact["n_unique_values"]
+            )
+
+        if "numerical" in col_exact.get("statistics", {}):
+            quantiles_exact = col_exact["statistics"]["numerical"]["quantiles"]
+            quantiles_approx = col_approx["statistics"]["numerical"]["quantiles"]
+
+            assert quantiles_approx["min"] == quantiles_exact["min"]
+            assert quantiles_approx["max"] == quantiles_exact["max"]
+            assert "rank_error" in col_approx["approx"]["quantiles"]
+
+    # The error bounds are part of the JSON output
+    assert '"approx"' in DataScan(data=dataset, approx=True).to_json()
+
+
+@pytest.mark.parametrize("tbl_type", ["pandas", "polars"])
+@pytest.mark.parametrize("n_jobs", [2, 3, -1])
+def test_datascan_n_jobs(tbl_type, n_jobs):
+    dataset = load_dataset(dataset="game_revenue", tbl_type=tbl_type)
+
+    # The column profiles are the same (and in the same order) when profiled in parallel
+    assert DataScan(data=dataset, n_jobs=n_jobs).to_json() == DataScan(data=dataset).to_json()
+
+
+@pytest.mark.parametrize("tbl_type", ["pandas", "polars"])
+def test_datascan_n_jobs_threads(tbl_type, monkeypatch):
+    dataset = load_dataset(dataset="game_revenue", tbl_type=tbl_type)
+
+    get_column_stats_df = DataScan._get_column_stats_df
+    barrier = threading.Barrier(2, timeout=10)
+    thread_names = set()
+
+    # Both partitions must be profiled at the same time (and in this process) to pass the barrier
+    def get_column_stats_df_barrier(self, column_idxs, column_kinds):
+        thread_names.add(threading.current_thread().name)
+        barrier.wait()
+        return get_column_stats_df(self, column_idxs=column_idxs, column_kinds=column_kinds)
+
+    monkeypatch.setattr(DataScan, "_get_column_stats_df", get_column_stats_df_barrier)
+
+    DataScan(data=dataset, n_jobs=2, cache=False)
+
+    assert len(thread_names) == 2
+    assert all(name.startswith("pointblank_datascan") for name in thread_names)
+
+
+@pytest.mark.parametrize("n_jobs", [0, -2, 1.5, True])
+def test_datascan_n_jobs_raises(n_jobs):
+    with pytest.raises(ValueError):
+        DataScan(data=load_dataset(dataset="small_table"), n_jobs=n_jobs)
+
+
+@pytest.mark.parametrize(
+    "n_columns, n_partitions, expected",
+    [
+        (5, 1, [[0, 1, 2, 3, 4]]),
+        (5, 2, [[0, 1, 2], [3, 4]]),
+        (3, 8, [[0], [1], [2]]),
+        (0, 4, [[]]),
+    ],
+)
+def test_partition_columns(n_columns, n_partitions, expected):
+    assert _partition_columns(n_columns=n_columns, n_partitions=n_partitions) == expected
+
+
+@pytest.mark.parametrize("tbl_type", ["pandas", "polars"])
+def test_datascan_merge(tbl_type):
+    dataset = load_dataset(dataset="game_revenue", tbl_type=tbl_type)
+
+    scans = [DataScan(data=dataset[i : i + 500], approx=True) for i in range(0, 2000, 500)]
+    merged = DataScan.merge(scans, tbl_name="game_revenue")
+
+    profile_exact = DataScan(data=dataset).profile
+
+    assert merged.profile["tbl_name"] == "game_revenue"
+    assert merged.profile["dimensions"] == profile_exact["dimensions"]
+
+    for col_merged, col_exact in zip(merged.profile["columns"], profile_exact["columns"]):
+        assert col_merged["column_name"] == col_exact["column_name"]
+        assert col_merged["n_missing_values"] == col_exact["n_missing_values"]
+        assert col_merged["sample_data"] == col_exact["sample_data"]
+        assert abs(col_merged["n_unique_values"] - col_exact["n_unique_values"]) <= max(
+            2, 0.05 * col_exact["n_unique_values"]
+        )
+
+        for stats_type in ["numerical", "string_lengths"]:
+            if stats_type in col_exact.get("statistics", {}):
+                stats_merged = col_merged["statistics"][stats_type]
+                stats_exact = col_exact["statistics"][stats_type]
+
+                # The means and standard deviations are combined exactly
+                assert stats_merged["descriptive"] == stats_exact["descriptive"]
+                assert stats_merged["quantiles"]["min"] == stats_exact["quantiles"]["min"]
+                assert stats_merged["quantiles"]["max"] == stats_exact["quantiles"]["max"]
+
+    # A merged scan can be merged again and reported on
+    merged_again = DataScan.merge([merged, scans[0]])
+
+    assert merged_again.profile["dimensions"]["rows"] == 2500
+    assert merged_again.get_tabular_report() is not None
+
+
+def test_datascan_merge_parallel():
+    dataset = load_dataset(dataset="game_revenue", tbl_type="pandas")
+
+    scans = [DataScan(data=dataset[i : i + 1000], approx=True, n_jobs=2) for i in [0, 1000]]
+
+    assert (
+        DataScan.merge(scans).to_json()
+        == DataScan.merge(
+            [DataScan(data=dataset[i : i + 1000], approx=True) for i in [0, 1000]]
+        ).to_json()
+    )
+
+
+def test_datascan_merge_raises():
+    small_table = load_dataset(dataset="small_table")
+
+    with pytest.raises(ValueError):
+        DataScan.merge([])
+
+    # Scans with exact statistics can't be merged
+    with pytest.raises(ValueError):
+        DataScan.merge([DataScan(data=small_table), DataScan(data=small_table)])
+
+    # The columns of the scans must match
+    with pytest.raises(ValueError):
+        DataScan.merge(
+            [
+                DataScan(data=small_table, approx=True),
+                DataScan(data=small_table.drop("a"), approx=True),
+            ]
+        )
+
+
+@pytest.mark.parametrize("tbl_type", ["pandas", "polars", "duckdb"])
+def test_datascan_sample(tbl_type):
+    dataset = load_dataset(dataset="game_revenue", tbl_type=tbl_type)
+
+    scan = DataScan(data=dataset, sample_n=500, seed=3, cache=False)
+
+    assert scan.profile["sample"] == {"tbl_rows": 2000, "seed": 3}
+    assert scan.profile["dimensions"]["columns"] == 11
+
+    if tbl_type == "duckdb":
+        assert 400 < scan.profile["dimensions"]["rows"] < 600
+    else:
+        assert scan.profile["dimensions"]["rows"] == 500
+
+    # The same seed gives the same sample
+    assert scan.to_json() == DataScan(data=dataset, sample_n=500, seed=3, cache=False).to_json()
+
+    scan_frac = DataScan(data=dataset, sample_frac=0.1, cache=False)
+
+    assert scan_frac.profile["sample"]["seed"] == 0
+
+    # The sample is noted in the header of the report
+    html = col_summary_tbl(data=dataset, sample_frac=0.1).as_raw_html()
+
+    assert ">Sample</span>" in html
+    assert "ROWS (SEED 0)" in html
+
+    assert "sample" not in DataScan(data=dataset, cache=False).profile
+
+
+@pytest.mark.parametrize(
+    "sample_n, sample_frac", [(10, 0.1), (0, None), (1.5, None), (None, 0), (None, 1.5)]
+)
+def test_datascan_sample_raises(sample_n, sample_frac):
+    with pytest.raises(ValueError):
+        DataScan(
+            data=load_dataset(dataset="small_table"), sample_n=sample_n, sample_frac=sample_frac
+        )
+
+
+@pytest.mark.parametrize("tbl_type", ["pandas", "polars", "duckdb"])
+def test_datascan_profile_cache(tbl_type, monkeypatch):
+    dataset = load_dataset(dataset="small_table", tbl_type=tbl_type)
+
+    scan = DataScan(data=dataset, tbl_name="small_table", cache=True)
+    scan.profile["columns"].clear()
+
+    def _raise(self):
+        raise AssertionError("The table was scanned again")
+
+    monkeypatch.setattr(DataScan, "_generate_profile_df", _raise)
+    monkeypatch.setattr(DataScan, "_generate_profile_ibis", _raise)
+
+    # The stored profile is reused (and isn't affected by changes to the earlier profile)
+    scan_cached = DataScan(data=dataset, tbl_name="small_table", cache=True)
+
+    assert len(scan_cached.profile["columns"]) == 8
+    assert col_summary_tbl(data=dataset, tbl_name="small_table", cache=True) is not None
+
+    # A different table, different options, or `cache=False` all lead to a new scan
+    with pytest.raises(AssertionError):
+        DataScan(
+            data=load_dataset(dataset="small_table", tbl_type=tbl_type),
+            tbl_name="small_table",
+            cache=True,
+        )
+
+    with pytest.raises(AssertionError):
+        DataScan(data=dataset, tbl_name="small_table", approx=True, cache=True)
+
+    with pytest.raises(AssertionError):
+        DataScan(data=dataset, tbl_name="small_table", cache=False)
+
+    # The cache isn't used by default
+    with pytest.raises(AssertionError):
+        DataScan(data=dataset, tbl_name="small_table")
+
+
+def test_datascan_profile_cache_size(monkeypatch):
+    monkeypatch.setattr("pointblank.datascan.PROFILE_CACHE_SIZE", 2)
+
+    datasets = [load_dataset(dataset="small_table") for _ in range(3)]
+
+    for dataset in datasets:
+        DataScan(data=dataset, cache=True)
+
+    assert len(_PROFILE_CACHE) <= 2
+
+
+def test_datascan_no_cache_by_default():
+    dataset = load_dataset(dataset="small_table", tbl_type="pandas")
+
+    scan = DataScan(data=dataset)
+
+    # A DataFrame that's modified in place is scanned again
+    dataset["a"] = dataset["a"] * 100
+
+    assert DataScan(data=dataset).profile != scan.profile
+
+
 def test_datascan_class_raises():
     with pytest.raises(TypeError):
         DataScan(data="not a DataFrame or Ibis Table")
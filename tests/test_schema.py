@@ -406,3 +406,87 @@ def test_schema_input_errors(request, tbl_fixture):
 
     with pytest.raises(ValueError):
         Schema(columns=(1, "int"))
+
+
+@pytest.mark.parametrize(
+    "complete, in_order, expected",
+    [(True, True, False), (True, False, True), (False, True, False), (False, False, True)],
+)
+def test_compare_schema_columns_wide(complete, in_order, expected):
+    n = 2000
+
+    schema_tgt = Schema(columns=[(f"col_{i}", "Int64") for i in range(n)])
+    schema_exp = Schema(columns=[(f"COL_{i}", ["String", "int64"]) for i in reversed(range(n))])
+
+    res = schema_exp._compare_schema_columns(
+        other=schema_tgt,
+        complete=complete,
+        in_order=in_order,
+        case_sensitive_colnames=False,
+        case_sensitive_dtypes=False,
+        full_match_dtypes=True,
+    )
+
+    assert res is expected
+
+    # Column names are case-sensitive here, so no column is matched
+    assert not schema_exp._compare_schema_columns(
+        other=schema_tgt,
+        complete=complete,
+        in_order=in_order,
+        case_sensitive_colnames=True,
+        case_sensitive_dtypes=False,
+        full_match_dtypes=True,
+    )
+
+    # Comparing the schemas doesn't modify the dtypes of the expected schema
+    assert schema_exp.columns[0] == ("COL_1999", ["String", "int64"])
+
+
+def test_compare_schema_columns_normalized_once():
+    schema = Schema(columns=[("a", "Int64"), ("B", ["String", "Utf8"]), ("c",)])
+
+    normalized = schema._get_normalized_columns(
+        case_sensitive_colnames=False, case_sensitive_dtypes=False
+    )
+
+    assert normalized.colnames == ["a", "b", "c"]
+    assert normalized.positions == {"a": 0, "b": 1, "c": 2}
+    assert normalized.dtypes == [("int64",), ("string", "utf8"), None]
+
+    assert (
+        schema._get_normalized_columns(case_sensitive_colnames=False, case_sensitive_dtypes=False)
+        is normalized
+    )
+
+    # Replacing the columns of the schema resets the normalized columns
+    schema.columns = [("d", "Float64")]
+
+    assert schema._get_normalized_columns(
+        case_sensitive_colnames=False, case_sensitive_dtypes=False
+    ).colnames == ["d"]
+
+
+def test_schema_from_table_file_and_arrow_schema(tmp_path):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    arrow_schema = pa.schema([("a", pa.int64()), ("b", pa.string())])
+    tbl = pa.table({"a": [1, 2], "b": ["x", "y"]}, schema=arrow_schema)
+
+    pq.write_table(tbl, tmp_path / "tbl.parquet")
+
+    with pa.ipc.new_file(tmp_path / "tbl.feather", arrow_schema) as writer:
+        writer.write_table(tbl)
+
+    schema_arrow = Schema(tbl=arrow_schema)
+    schema_parquet = Schema(tbl=tmp_path / "tbl.parquet")
+    schema_feather = Schema(tbl=str(tmp_path / "tbl.feather"))
+
+    assert schema_arrow.columns == [("a", "int64"), ("b", "string")]
+    assert schema_parquet.columns == schema_arrow.columns
+    assert schema_feather.columns == schema_arrow.columns
+
+    assert schema_arrow.get_tbl_type() == "pyarrow"
+    assert schema_parquet.get_tbl_type() == "parquet_file"
+    assert schema_feather.get_tbl_type() == "arrow_file"
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import pathlib
 
+import json
 import pprint
 import sys
 import re
@@ -15,13 +16,16 @@ import contextlib
 import pandas as pd
 import polars as pl
 import ibis
+import pyarrow.dataset as pa_ds
 from datetime import datetime
 
 import great_tables as GT
 import narwhals as nw
+from narwhals.dependencies import is_ibis_table
 
 from pointblank.validate import (
     Actions,
+    _DeferredExtract,
     get_column_count,
     get_row_count,
     load_dataset,
@@ -31,8 +35,12 @@ from pointblank.validate import (
     Validate,
     _create_table_time_html,
     _create_table_type_html,
+    _fmt_counts,
     _fmt_lg,
     _get_default_title_text,
+    _get_ibis_head_tail_query,
+    _get_missing_vals_by_sector,
+    _get_report_steps,
     _normalize_reporting_language,
     _process_action_str,
     _process_brief,
@@ -1991,6 +1999,41 @@ def test_col_vals_expr_pandas_tbl():
     )
 
 
+def test_col_vals_expr_ibis_tbl():
+    tbl = load_dataset(tbl_type="duckdb")
+
+    ibis_expr = (ibis._.c > ibis._.a) & (ibis._.d > ibis._.c)
+    nw_expr = (nw.col("c") > nw.col("a")) & (nw.col("d") > nw.col("c"))
+
+    for expr in [ibis_expr, nw_expr]:
+        validation = Validate(data=tbl).col_vals_expr(expr=expr).interrogate()
+
+        # Rows with missing values yield neither a passing nor a failing test unit (as in Polars)
+        assert validation.n(i=1, scalar=True) == 13
+        assert validation.n_passed(i=1, scalar=True) == 6
+        assert validation.n_failed(i=1, scalar=True) == 5
+
+
+def test_col_vals_expr_ibis_value_expr():
+    tbl = load_dataset(tbl_type="duckdb")
+
+    validation = Validate(data=tbl).col_vals_expr(expr=tbl["c"] > tbl["a"]).interrogate()
+
+    assert validation.n_passed(i=1, scalar=True) == 6
+
+
+def test_col_vals_expr_incompatible_expr():
+    with pytest.raises(ValueError):
+        Validate(data=load_dataset(tbl_type="pandas")).col_vals_expr(
+            expr=pl.col("c") > pl.col("a")
+        ).interrogate()
+
+    with pytest.raises(ValueError):
+        Validate(data=load_dataset(tbl_type="polars")).col_vals_expr(
+            expr=ibis._.c > ibis._.a
+        ).interrogate()
+
+
 @pytest.mark.parametrize("tbl_fixture", TBL_LIST)
 def test_rows_distinct(request, tbl_fixture):
     tbl = request.getfixturevalue(tbl_fixture)
@@ -4575,44 +4618,55 @@ def test_validation_with_selector_helper_functions_no_match_snap(request, tbl_fi
 
 @pytest.mark.parametrize("tbl_fixture", TBL_DATES_TIMES_TEXT_LIST)
 def test_interrogate_first_n(request, tbl_fixture):
-    if tbl_fixture not in [
-        "tbl_dates_times_text_parquet",
-        "tbl_dates_times_text_duckdb",
-        "tbl_dates_times_text_sqlite",
-    ]:
-        tbl = request.getfixturevalue(tbl_fixture)
+    tbl = request.getfixturevalue(tbl_fixture)
 
-        validation = (
-            Validate(tbl)
-            .col_vals_regex(columns="text", pattern=r"^[a-z]{3}")
-            .interrogate(get_first_n=2)
-        )
+    validation = (
+        Validate(tbl)
+        .col_vals_regex(columns="text", pattern=r"^[a-z]{3}")
+        .interrogate(get_first_n=2)
+    )
 
-        # Expect that the extracts table has 2 entries out of 3 failures
-        assert validation.n_failed(i=1, scalar=True) == 3
-        assert len(nw.from_native(validation.get_data_extracts(i=1, frame=True)).rows()) == 2
-        assert len(nw.from_native(validation.get_data_extracts(i=1, frame=True)).columns) == 4
+    # Expect that the extracts table has 2 entries out of 3 failures
+    assert validation.n_failed(i=1, scalar=True) == 3
+    assert len(nw.from_native(validation.get_data_extracts(i=1, frame=True)).rows()) == 2
+    assert len(nw.from_native(validation.get_data_extracts(i=1, frame=True)).columns) == 4
 
 
 @pytest.mark.parametrize("tbl_fixture", TBL_DATES_TIMES_TEXT_LIST)
 def test_interrogate_sample_n(request, tbl_fixture):
-    if tbl_fixture not in [
-        "tbl_dates_times_text_parquet",
-        "tbl_dates_times_text_duckdb",
-        "tbl_dates_times_text_sqlite",
-    ]:
-        tbl = request.getfixturevalue(tbl_fixture)
+    tbl = request.getfixturevalue(tbl_fixture)
 
+    validation = (
+        Validate(tbl).col_vals_regex(columns="text", pattern=r"^[a-z]{3}").interrogate(sample_n=2)
+    )
+
+    # Expect that the extracts table has 2 entries out of 3 failures
+    assert validation.n_failed(i=1, scalar=True) == 3
+    assert len(nw.from_native(validation.get_data_extracts(i=1, frame=True)).rows()) == 2
+    assert len(nw.from_native(validation.get_data_extracts(i=1, frame=True)).columns) == 4
+
+
+@pytest.mark.parametrize("sample_n, sample_frac", [(2, None), (None, 0.7)])
+def test_interrogate_sample_with_seed(request, sample_n, sample_frac):
+    def get_sampled_row_nums(tbl_fixture, seed):
         validation = (
-            Validate(tbl)
+            Validate(request.getfixturevalue(tbl_fixture))
             .col_vals_regex(columns="text", pattern=r"^[a-z]{3}")
-            .interrogate(sample_n=2)
+            .interrogate(sample_n=sample_n, sample_frac=sample_frac, seed=seed)
         )
 
-        # Expect that the extracts table has 2 entries out of 3 failures
-        assert validation.n_failed(i=1, scalar=True) == 3
-        assert len(nw.from_native(validation.get_data_extracts(i=1, frame=True)).rows()) == 2
-        assert len(nw.from_native(validation.get_data_extracts(i=1, frame=True)).columns) == 4
+        extract = nw.from_native(validation.get_data_extracts(i=1, frame=True))
+
+        return extract["_row_num_"].to_list()
+
+    row_nums = get_sampled_row_nums("tbl_dates_times_text_pl", seed=23)
+
+    assert len(row_nums) == 2
+    assert row_nums == sorted(row_nums)
+
+    # The same seed gives the same sample on every rerun and for every type of table
+    for tbl_fixture in TBL_DATES_TIMES_TEXT_LIST:
+        assert get_sampled_row_nums(tbl_fixture, seed=23) == row_nums
 
 
 @pytest.mark.parametrize(
@@ -4647,6 +4701,58 @@ def test_interrogate_sample_frac(request, tbl_fixture, sample_frac, expected):
     assert len(nw.from_native(validation.get_data_extracts(i=1, frame=True)).columns) == 4
 
 
+@pytest.mark.parametrize(
+    "tbl_fixture",
+    ["tbl_dates_times_text_parquet", "tbl_dates_times_text_duckdb", "tbl_dates_times_text_sqlite"],
+)
+def test_interrogate_ibis_extracts(request, tbl_fixture):
+    tbl = request.getfixturevalue(tbl_fixture)
+
+    validation = Validate(tbl).col_vals_regex(columns="text", pattern=r"^[a-z]{3}").interrogate()
+
+    # The extract is stored as a query and is only fetched when it's requested
+    assert is_ibis_table(validation.validation_info[0].__dict__["extract"].tbl)
+
+    extract = nw.from_native(validation.get_data_extracts(i=1, frame=True))
+
+    assert not is_ibis_table(validation.validation_info[0].__dict__["extract"])
+    assert extract.columns[0] == "_row_num_"
+    assert len(extract) == 3
+
+    # Row numbers refer to the rows of the target table
+    local_extract = nw.from_native(
+        Validate(tbl.to_polars())
+        .col_vals_regex(columns="text", pattern=r"^[a-z]{3}")
+        .interrogate()
+        .get_data_extracts(i=1, frame=True)
+    )
+
+    assert extract["_row_num_"].to_list() == local_extract["_row_num_"].to_list()
+
+
+def test_interrogate_ibis_extracts_sorted_table():
+    tbl = ibis.memtable(pd.DataFrame({"key": [3, 1, 4, 2], "x": [0, 5, -1, -2]})).order_by("key")
+
+    validation = Validate(tbl).col_vals_ge(columns="x", value=0).interrogate()
+
+    extract = nw.from_native(validation.get_data_extracts(i=1, frame=True))
+
+    # Rows of a sorted table are numbered by its sort keys
+    assert extract.sort("_row_num_")["_row_num_"].to_list() == [2, 4]
+    assert extract.sort("_row_num_")["key"].to_list() == [2, 4]
+
+
+@pytest.mark.parametrize("sample_frac, expected", [(0, 0), (1.00, 3)])
+def test_interrogate_ibis_extracts_sample_frac(tbl_dates_times_text_duckdb, sample_frac, expected):
+    validation = (
+        Validate(tbl_dates_times_text_duckdb)
+        .col_vals_regex(columns="text", pattern=r"^[a-z]{3}")
+        .interrogate(sample_frac=sample_frac)
+    )
+
+    assert len(nw.from_native(validation.get_data_extracts(i=1, frame=True))) == expected
+
+
 @pytest.mark.parametrize("tbl_fixture", ["tbl_dates_times_text_pd", "tbl_dates_times_text_pl"])
 def test_interrogate_sample_frac_with_sample_limit(request, tbl_fixture):
     tbl = request.getfixturevalue(tbl_fixture)
@@ -4713,6 +4819,118 @@ def test_interrogate_raise_on_get_first_and_sample(request, tbl_fixture):
         Validate(tbl).col_vals_gt(columns="z", value=10).interrogate(sample_n=2, sample_frac=0.5)
 
 
+@pytest.mark.parametrize("tbl_fixture", ["tbl_pd", "tbl_pl"])
+def test_data_extracts_are_lazy(request, tbl_fixture):
+    tbl = request.getfixturevalue(tbl_fixture)
+
+    validation = (
+        Validate(tbl)
+        .col_vals_gt(columns="y", value=4)
+        .col_vals_lt(columns="x", value=4)
+        .interrogate()
+    )
+
+    # Checking the results doesn't require the extracts
+    assert not validation.all_passed()
+    assert all(
+        isinstance(step.__dict__["extract"], _DeferredExtract)
+        for step in validation.validation_info
+    )
+
+    # The extract for a step is obtained when first accessed and then cached
+    extract = validation.get_data_extracts(i=1, frame=True)
+
+    assert nw.from_native(extract).rows() == [(1, 1, 4, 8)]
+    assert validation.validation_info[0].__dict__["extract"] is extract
+    assert isinstance(validation.validation_info[1].__dict__["extract"], _DeferredExtract)
+
+    assert nw.from_native(validation.validation_info[1].extract).rows() == [(4, 4, 7, 8)]
+
+
+@pytest.mark.parametrize("tbl_fixture", ["tbl_pd", "tbl_pl"])
+def test_data_extracts_no_tbl_checked(request, tbl_fixture):
+    tbl = request.getfixturevalue(tbl_fixture)
+
+    validation = (
+        Validate(tbl)
+        .col_vals_gt(columns="y", value=4)
+        .col_vals_lt(columns="x", value=4)
+        .interrogate(collect_tbl_checked=False)
+    )
+
+    # Without the per-step tables, the extracts are collected during interrogation so that the
+    # step's table and mask aren't kept alive
+    for step in validation.validation_info:
+        assert step.tbl_checked is None
+        assert not isinstance(step.__dict__["extract"], _DeferredExtract)
+
+    assert nw.from_native(validation.get_data_extracts(i=1, frame=True)).rows() == [(1, 1, 4, 8)]
+    assert nw.from_native(validation.get_data_extracts(i=2, frame=True)).rows() == [(4, 4, 7, 8)]
+
+
+@pytest.mark.parametrize("tbl_fixture", ["tbl_pd", "tbl_pl", "tbl_parquet", "tbl_duckdb"])
+def test_interrogate_extract_limit(request, tbl_fixture, tmp_path):
+    tbl = request.getfixturevalue(tbl_fixture)
+
+    validation = (
+        Validate(tbl)
+        .col_vals_gt(columns="x", value=10)
+        .col_vals_lt(columns="x", value=4)
+        .interrogate(extract_limit=2, extract_spill_dir=str(tmp_path))
+    )
+
+    # The first extract (4 rows) is written to Parquet while the second one (1 row) is in memory
+    extract_1 = validation.get_data_extracts(i=1, frame=True)
+    extract_2 = validation.get_data_extracts(i=2, frame=True)
+
+    if tbl_fixture == "tbl_pd":
+        assert isinstance(extract_1, pa_ds.Dataset)
+        extract_1 = pl.from_arrow(extract_1.to_table()).lazy()
+    else:
+        assert isinstance(extract_1, pl.LazyFrame)
+
+    assert extract_1.collect().columns == ["_row_num_", "x", "y", "z"]
+    assert extract_1.collect()["_row_num_"].to_list() == [1, 2, 3, 4]
+    assert len(list(tmp_path.iterdir())) == 1
+    assert not isinstance(extract_2, pl.LazyFrame)
+    assert nw.from_native(extract_2)["_row_num_"].to_list() == [4]
+
+    # Reporting works with the extract that was written to Parquet
+    validation.get_tabular_report()
+    validation.get_step_report(i=1)
+
+
+def test_interrogate_extract_limit_pd_chunks(tbl_pd, monkeypatch):
+    monkeypatch.setattr("pointblank._utils_extract.EXTRACT_CHUNK_SIZE", 2)
+
+    validation = Validate(tbl_pd).col_vals_lt(columns="x", value=3).interrogate(extract_limit=1)
+
+    extract = validation.get_data_extracts(i=1, frame=True)
+
+    # The index of the Pandas chunks isn't written to the Parquet file
+    assert isinstance(extract, pa_ds.Dataset)
+    assert extract.to_table().column_names == ["_row_num_", "x", "y", "z"]
+    assert extract.to_table()["_row_num_"].to_pylist() == [3, 4]
+
+
+def test_interrogate_extract_limit_total(tbl_pl):
+    validation = (
+        Validate(tbl_pl)
+        .col_vals_lt(columns="x", value=3)
+        .col_vals_lt(columns="x", value=3)
+        .interrogate(extract_limit_total=3)
+    )
+
+    # The second extract doesn't fit in the remaining budget
+    assert isinstance(validation.get_data_extracts(i=1, frame=True), pl.DataFrame)
+    assert isinstance(validation.get_data_extracts(i=2, frame=True), pl.LazyFrame)
+
+
+def test_interrogate_extract_limit_invalid(tbl_pl):
+    with pytest.raises(ValueError):
+        Validate(tbl_pl).col_vals_gt(columns="x", value=1).interrogate(extract_limit="lots")
+
+
 def test_get_data_extracts(tbl_missing_pd):
     validation = (
         Validate(tbl_missing_pd)
@@ -4820,6 +5038,181 @@ def test_get_sundered_data(request, tbl_fixture):
     assert failed_data_rows[1] == (4, 7, 8)
 
 
+@pytest.mark.parametrize("tbl_fixture", ["tbl_parquet", "tbl_duckdb", "tbl_sqlite"])
+def test_get_sundered_data_ibis(request, tbl_fixture):
+    tbl = request.getfixturevalue(tbl_fixture)
+
+    validation = (
+        Validate(tbl)
+        .col_vals_eq(columns="z", value=8)
+        .col_vals_gt(columns="y", value=4)
+        .col_vals_lt(columns="x", value=4)
+        .interrogate(collect_tbl_checked=False)
+    )
+
+    sundered_data_pass = validation.get_sundered_data(type="pass")
+    sundered_data_fail = validation.get_sundered_data(type="fail")
+
+    # The pieces are lazy Ibis queries against the target table
+    assert is_ibis_table(sundered_data_pass)
+    assert is_ibis_table(sundered_data_fail)
+
+    assert sundered_data_pass.columns == ("x", "y", "z")
+    assert sundered_data_fail.columns == ("x", "y", "z")
+
+    passed_data_rows = sorted(sundered_data_pass.to_polars().rows())
+    failed_data_rows = sorted(sundered_data_fail.to_polars().rows())
+
+    assert passed_data_rows == [(2, 5, 8), (3, 6, 8)]
+    assert failed_data_rows == [(1, 4, 8), (4, 7, 8)]
+
+
+@pytest.mark.parametrize("tbl_type", ["pandas", "polars", "duckdb"])
+def test_get_sundered_data_null_values(tbl_type):
+    tbl_pl = pl.DataFrame({"a": ["x", "y", None, "z", None], "b": [1, 2, 3, 4, 5]})
+
+    if tbl_type == "pandas":
+        tbl = tbl_pl.to_pandas()
+    elif tbl_type == "polars":
+        tbl = tbl_pl
+    else:
+        tbl = ibis.memtable(tbl_pl)
+
+    validation = (
+        Validate(tbl)
+        .col_vals_in_set(columns="a", set=["x", "y"])
+        .col_vals_not_in_set(columns="a", set=["q"])
+        .col_vals_gt(columns="b", value=0)
+        .interrogate()
+    )
+
+    sundered_data_pass = validation.get_sundered_data(type="pass")
+    sundered_data_fail = validation.get_sundered_data(type="fail")
+
+    if tbl_type == "duckdb":
+        sundered_data_pass = sundered_data_pass.to_polars()
+        sundered_data_fail = sundered_data_fail.to_polars()
+
+    # Rows with a missing result for a set membership check are in the 'fail' piece, so that the
+    # two pieces together have all the rows of the table
+    assert len(sundered_data_pass) + len(sundered_data_fail) == len(tbl_pl)
+    assert sorted(nw.from_native(sundered_data_pass)["b"].to_list()) == [1, 2]
+
+
+@pytest.mark.parametrize("tbl_fixture", ["tbl_pd", "tbl_pl"])
+def test_get_sundered_data_with_pre(request, tbl_fixture):
+    tbl = request.getfixturevalue(tbl_fixture)
+
+    # A `pre=` function that keeps the rows of the table can be used in sundering, whereas one
+    # that changes the number of rows cannot be aligned with the target table
+    validation = (
+        Validate(tbl)
+        .col_vals_gt(columns="y", value=4)
+        .col_vals_lt(columns="x2", value=8, pre=lambda dfn: dfn.with_columns(x2=nw.col("x") * 2))
+        .col_vals_gt(columns="x", value=100, pre=lambda dfn: dfn.head(1))
+        .interrogate()
+    )
+
+    passed_data_rows = nw.from_native(validation.get_sundered_data(type="pass")).rows()
+    failed_data_rows = nw.from_native(validation.get_sundered_data(type="fail")).rows()
+
+    assert passed_data_rows == [(2, 5, 8), (3, 6, 8)]
+    assert failed_data_rows == [(1, 4, 8), (4, 7, 8)]
+
+
+def test_get_sundered_data_no_tbl_checked(tbl_pl):
+    validation = (
+        Validate(tbl_pl).col_vals_gt(columns="y", value=4).interrogate(collect_tbl_checked=False)
+    )
+
+    with pytest.raises(ValueError):
+        validation.get_sundered_data()
+
+
+@pytest.mark.parametrize("tbl_fixture", ["tbl_pd", "tbl_pl", "tbl_parquet", "tbl_duckdb"])
+def test_get_failure_matrix(request, tbl_fixture):
+    tbl = request.getfixturevalue(tbl_fixture)
+
+    validation = (
+        Validate(tbl)
+        .col_vals_eq(columns="z", value=8)
+        .col_vals_gt(columns="y", value=4)
+        .col_exists(columns="z")
+        .col_vals_lt(columns="x", value=4)
+        .interrogate()
+    )
+
+    bitmask = validation.get_failure_matrix()
+    failed_lists = validation.get_failure_matrix(type="list")
+
+    if is_ibis_table(bitmask):
+        bitmask = bitmask.order_by("_row_num_").to_polars()
+        failed_lists = failed_lists.order_by("_row_num_").to_polars()
+
+    bitmask = nw.from_native(bitmask)
+    failed_lists = nw.from_native(failed_lists)
+
+    # Row 1 failed step 2 and row 4 failed step 4
+    assert bitmask.columns == ["_row_num_", "_failed_steps_"]
+    assert bitmask["_row_num_"].to_list() == [1, 2, 3, 4]
+    assert bitmask["_failed_steps_"].to_list() == [2, 0, 0, 8]
+    assert [list(x) for x in failed_lists["_failed_steps_"].to_list()] == [[2], [], [], [4]]
+
+
+def test_get_failure_matrix_many_steps(tbl_pl):
+    validation = Validate(tbl_pl)
+
+    for _ in range(70):
+        validation = validation.col_vals_gt(columns="y", value=4)
+
+    validation = validation.col_vals_lt(columns="x", value=4).interrogate()
+
+    bitmask = validation.get_failure_matrix()
+
+    # Steps 1-64 are in the first bitmask column, steps 65-71 are in the second one
+    assert bitmask.columns == ["_row_num_", "_failed_steps_1_", "_failed_steps_2_"]
+    assert bitmask["_failed_steps_1_"].to_list() == [2**64 - 1, 0, 0, 0]
+    assert bitmask["_failed_steps_2_"].to_list() == [2**6 - 1, 0, 0, 2**6]
+
+
+@pytest.mark.parametrize("df_lib", ["pandas", "polars"])
+def test_get_failure_matrix_list_matches_bitmask(df_lib):
+    tbl = pl.DataFrame({f"x_{k}": [(row * (k + 3)) % 7 for row in range(500)] for k in range(5)})
+    tbl = tbl.to_pandas() if df_lib == "pandas" else tbl
+
+    validation = Validate(tbl)
+
+    for k in range(5):
+        validation = validation.col_vals_gt(columns=f"x_{k}", value=k)
+
+    validation = validation.interrogate()
+
+    bitmask = nw.from_native(validation.get_failure_matrix())["_failed_steps_"].to_list()
+    failed_lists = nw.from_native(validation.get_failure_matrix(type="list"))
+
+    assert [list(x) for x in failed_lists["_failed_steps_"].to_list()] == [
+        [i for i in range(1, 6) if mask & (1 << (i - 1))] for mask in bitmask
+    ]
+
+
+def test_get_failure_matrix_invalid_type(tbl_pl):
+    validation = Validate(tbl_pl).col_vals_gt(columns="y", value=4).interrogate()
+
+    with pytest.raises(ValueError):
+        validation.get_failure_matrix(type="matrix")
+
+
+def test_get_failure_matrix_list_no_pyarrow(tbl_pl):
+    validation = Validate(tbl_pl).col_vals_gt(columns="y", value=4).interrogate()
+
+    with patch.dict(sys.modules, {"pyarrow": None}):
+        with pytest.raises(ImportError):
+            validation.get_failure_matrix(type="list")
+
+        # The bitmask doesn't require PyArrow
+        validation.get_failure_matrix(type="bitmask")
+
+
 @pytest.mark.parametrize("tbl_fixture", ["tbl_pd", "tbl_pl"])
 def test_get_sundered_data_empty_frame(request, tbl_fixture):
     tbl = request.getfixturevalue(tbl_fixture)
@@ -5028,6 +5421,229 @@ def test_no_steps_validation_report_html_with_interrogate():
     )
 
 
+def test_validation_report_collapse_passing_and_pages():
+    tbl = pl.DataFrame({"x": [1, 2, 3, 4]})
+
+    validation = Validate(data=tbl)
+
+    # Steps 1, 4, and 7 have failing test units
+    for i in range(8):
+        validation = validation.col_vals_gt(columns="x", value=1 if i % 3 == 0 else 0)
+
+    validation = validation.interrogate()
+
+    def get_step_nums(report):
+        html_str = report.as_raw_html()
+        # The step number follows the status color cell of each row
+        pattern = r'gt_left">(?:<div[^>]*></div>)?</td>\s*<td class="gt_row gt_right">(\d+)</td>'
+
+        return [int(i) for i in re.findall(pattern, html_str)]
+
+    assert get_step_nums(validation.get_tabular_report()) == list(range(1, 9))
+
+    report_html = validation.get_tabular_report(collapse_passing=True).as_raw_html()
+
+    assert "5 passing steps not shown." in report_html
+    assert get_step_nums(validation.get_tabular_report(collapse_passing=True)) == [1, 4, 7]
+    assert get_step_nums(validation.get_tabular_report(page_size=3, page=3)) == [7, 8]
+    assert get_step_nums(
+        validation.get_tabular_report(collapse_passing=True, page_size=2, page=2)
+    ) == [7]
+
+    # The SVG icons are defined once and referenced in each row
+    assert report_html.count("<symbol") == 2
+    assert report_html.count('<use href="#pb-icon-col_vals_gt">') == 3
+
+    with pytest.raises(ValueError):
+        validation.get_tabular_report(page_size=3, page=4)
+
+
+def test_validation_report_css_scoped_to_report():
+    validation = Validate(data=pl.DataFrame({"x": [1, 2]})).col_vals_gt(columns="x", value=1)
+
+    html_no_interrogation = validation.get_tabular_report().as_raw_html()
+    html_interrogation = validation.interrogate().get_tabular_report().as_raw_html()
+
+    def get_table_id(html_str):
+        return re.search(r'<div id="(pb_tbl_[0-9a-f]+)"', html_str).group(1)
+
+    id_no_interrogation = get_table_id(html_no_interrogation)
+    id_interrogation = get_table_id(html_interrogation)
+
+    # Reports with different body styles have different IDs, so the rules of one report don't
+    # apply to another one on the same page
+    assert id_no_interrogation != id_interrogation
+
+    for html_str, table_id in [
+        (html_no_interrogation, id_no_interrogation),
+        (html_interrogation, id_interrogation),
+    ]:
+        scopes = set(re.findall(r"#(pb_tbl_[0-9a-f]+) tbody td\.gt_row", html_str))
+
+        assert scopes == {table_id}
+
+    # The same report always gets the same ID
+    assert get_table_id(validation.get_tabular_report().as_raw_html()) == id_interrogation
+
+
+def test_get_summary():
+    tbl = pl.DataFrame({"x": [1, 2, 3, 4], "y": [4, 5, None, 7]})
+
+    validation = (
+        Validate(data=tbl, tbl_name="tbl_xy", label="Summary example", thresholds=(1, 2, 3))
+        .col_vals_gt(columns="x", value=1)
+        .col_vals_between(columns="x", left=0, right=3, inclusive=(True, False))
+        .col_vals_not_null(columns="y")
+        .row_count_match(count=5, inverse=True)
+        .col_vals_gt(columns="x", value=0, active=False)
+        .interrogate()
+    )
+
+    summary = validation.get_summary(format="dict")
+
+    assert summary["tbl_name"] == "tbl_xy"
+    assert summary["interrogated"] is True
+    assert summary["all_passed"] is False
+    assert summary["n_steps"] == 5
+    assert summary["n_steps_passed"] == 1
+    assert summary["n_steps_failed"] == 3
+    assert summary["n_steps_warning"] == 3
+    assert summary["n_steps_error"] == 1
+    assert [step["values"] for step in summary["steps"]] == ["1", "[0, 3)", None, "≠ 5", "0"]
+    assert summary["steps"][3]["columns"] is None
+
+    # The JSON summary is the compact form of the dictionary
+    summary_json = validation.get_summary(format="json")
+
+    assert json.loads(summary_json) == json.loads(json.dumps(summary))
+    assert ", " not in summary_json.split('"steps"')[0]
+
+    summary_text = validation.get_summary(format="text")
+    text_lines = summary_text.split("\n")
+
+    assert text_lines[:3] == [
+        "Pointblank Validation: tbl_xy",
+        "Summary example",
+        "5 steps, 1 passed, 3 failed (warning: 3, error: 1, critical: 0)",
+    ]
+    assert text_lines[4].split() == [
+        "STEP",
+        "TYPE",
+        "COLUMNS",
+        "VALUES",
+        "EVAL",
+        "UNITS",
+        "PASS",
+        "FAIL",
+        "W",
+        "E",
+        "C",
+    ]
+    assert text_lines[5].split() == [
+        "1",
+        "col_vals_gt()",
+        "x",
+        "1",
+        "✓",
+        "4",
+        "3",
+        "(0.75)",
+        "1",
+        "(0.25)",
+        "●",
+        "○",
+        "○",
+    ]
+    assert len(text_lines) == 10
+
+    summary_md = validation.get_summary(format="markdown")
+
+    assert summary_md.startswith("### Pointblank Validation: `tbl_xy`")
+    assert "| 1 | `col_vals_gt()` | x | 1 | ✓ | 4 | 3 (0.75) | 1 (0.25) | ● | ○ | ○ |" in summary_md
+    assert "| 5 | `col_vals_gt()` | x | 0 | — | — | — | — | — | — | — |" in summary_md
+
+    with pytest.raises(ValueError):
+        validation.get_summary(format="html")
+
+
+def test_get_summary_steps_without_columns_or_values():
+    tbl = pl.DataFrame({"x": [1, 2, 3, 4], "y": [4, 5, 6, 7]})
+
+    validation = (
+        Validate(data=tbl)
+        .col_exists(columns=["x", "y"])
+        .row_count_match(count=4)
+        .col_vals_gt(columns="x", value=0)
+        .col_vals_gt(columns="y", value=5)
+        .col_vals_gt(columns="x", value=0, active=False)
+        .col_exists(columns="z")
+        .interrogate()
+    )
+
+    summary = validation.get_summary(format="dict")
+
+    # The `col_exists()` steps record `all_passed` as an integer but still count as passing
+    assert summary["n_steps"] == 7
+    assert summary["n_steps_passed"] == 4
+    assert summary["n_steps_failed"] == 2
+
+    # Steps without values have `None` in the structured summary and an em dash in the text one
+    assert [step["values"] for step in summary["steps"]] == [None, None, "4", "0", "5", "0", None]
+    assert summary["steps"][2]["columns"] is None
+    assert json.loads(validation.get_summary(format="json"))["steps"][0]["values"] is None
+
+    text_lines = validation.get_summary(format="text").split("\n")
+
+    assert text_lines[1] == "7 steps, 4 passed, 2 failed (warning: 0, error: 0, critical: 0)"
+    assert text_lines[4].split()[:4] == ["1", "col_exists()", "x", "—"]
+
+
+def test_get_summary_no_interrogation():
+    validation = Validate(data=pl.DataFrame({"x": [1, 2]})).col_vals_gt(columns="x", value=0)
+
+    summary = validation.get_summary(format="dict")
+
+    assert summary["interrogated"] is False
+    assert summary["all_passed"] is None
+    assert summary["n_steps_passed"] is None
+    assert summary["steps"][0]["i"] == 1
+
+    assert "1 steps (no interrogation performed)" in validation.get_summary()
+    assert Validate(data=pl.DataFrame({"x": [1]})).get_summary().split("\n") == [
+        "Pointblank Validation",
+        "0 steps (no interrogation performed)",
+    ]
+
+
+def test_get_report_steps():
+    validation_info = [
+        _ValidationInfo(i=i + 1, assertion_type="col_vals_gt", all_passed=all_passed)
+        for i, all_passed in enumerate([True, False, True, False, False])
+    ]
+
+    assert _get_report_steps(validation_info, collapse_passing=False, page_size=None, page=1) == (
+        [0, 1, 2, 3, 4],
+        None,
+    )
+
+    steps, note = _get_report_steps(validation_info, collapse_passing=True, page_size=2, page=2)
+
+    assert steps == [4]
+    assert "2 passing steps not shown." in note
+    assert "Page 2 of 2 (showing 1 of 3 steps)." in note
+
+    for page_size, page in [(0, 1), (2, 0), (2, 4), (2.5, 1)]:
+        with pytest.raises(ValueError):
+            _get_report_steps(
+                validation_info, collapse_passing=False, page_size=page_size, page=page
+            )
+
+
+def test_fmt_counts():
+    assert _fmt_counts([]) == []
+    assert _fmt_counts([5, 9999, 12345, 5, 12345]) == ["5", "9999", "12.3K", "5", "12.3K"]
+
+
 def test_load_dataset():
     # Load the default dataset (`small_table`) and verify it's a Polars DataFrame
     tbl = load_dataset()
@@ -5304,6 +5920,112 @@ def test_preview_with_columns_subset_failing(tbl_type):
         preview(tbl, columns_subset=col(matches("fake_id")))
 
 
+@pytest.mark.parametrize("tbl_type", ["pandas", "polars"])
+@pytest.mark.parametrize("n_head, n_tail", [(5, 5), (10, 10)])
+def test_preview_leaves_input_table_unchanged(tbl_type, n_head, n_tail):
+    tbl = load_dataset(dataset="small_table", tbl_type=tbl_type)
+    columns = list(tbl.columns)
+
+    html = preview(tbl, n_head=n_head, n_tail=n_tail).as_raw_html()
+    preview(tbl, columns_subset=["a", "b"], n_head=n_head, n_tail=n_tail)
+
+    # Row numbers are added to the displayed rows but not to the input table
+    assert "_row_num_" in html
+    assert list(tbl.columns) == columns
+    assert tbl.shape == (13, 8)
+
+
+@pytest.mark.parametrize("n_head, n_tail", [(5, 5), (0, 3), (3, 0), (1500, 1500)])
+def test_get_ibis_head_tail_query(n_head, n_tail):
+    tbl = load_dataset(dataset="game_revenue", tbl_type="duckdb")
+
+    preview_tbl = _get_ibis_head_tail_query(tbl, n_head=n_head, n_tail=n_tail, n_rows=2000)
+    preview_tbl = preview_tbl.to_polars()
+
+    session_ids = tbl.to_polars()["session_id"].to_list()
+    expected_row_nums = sorted(set(range(min(n_head, 2000))) | set(range(2000 - n_tail, 2000)))
+
+    # The rows are those of the table (in the same order), each one only once
+    assert preview_tbl.columns == list(tbl.columns) + ["_pb_part_", "_pb_pos_"]
+    assert preview_tbl["session_id"].to_list() == [session_ids[i] for i in expected_row_nums]
+
+
+def test_get_ibis_head_tail_query_no_full_scan():
+    tbl = ibis.memtable(pl.DataFrame({"x": list(range(100))}))
+
+    sql = ibis.to_sql(_get_ibis_head_tail_query(tbl, n_head=5, n_tail=5, n_rows=100)).upper()
+
+    # The head and tail are bounded `LIMIT` queries in one statement, with an explicit ordering;
+    # rows are only numbered within the limited parts (the windows have no partitioning or order)
+    assert sql.count("LIMIT 5") == 2
+    assert "OFFSET 95" in sql
+    assert "UNION ALL" in sql
+    assert "ORDER BY" in sql
+    assert "PARTITION BY" not in sql
+    assert "OVER (ORDER" not in sql
+
+
+@pytest.mark.parametrize("n_rows", [3, 7, 10, 11])
+def test_preview_small_duckdb_table_row_numbers(n_rows):
+    tbl = ibis.memtable(pl.DataFrame({"x": [100 + i for i in range(n_rows)]}))
+
+    html = preview(tbl, n_head=5, n_tail=5).as_raw_html()
+
+    # The cells are the row and column counts in the header and then the row number and value of
+    # each row (a small table is shown in full, with each row only once)
+    cells = [int(cell) for cell in re.findall(r">(\d+)<", html)]
+    row_nums = sorted(
+        set(range(1, min(5, n_rows) + 1)) | set(range(max(n_rows - 4, 1), n_rows + 1))
+    )
+
+    assert cells[:2] == [n_rows, 1]
+    assert cells[2:] == [cell for i in row_nums for cell in (i, 99 + i)]
+
+
+def test_preview_large_duckdb_table():
+    con = ibis.duckdb.connect()
+    tbl = con.sql("SELECT range AS id, range * 2 AS x FROM range(5000000)")
+
+    html = preview(tbl, n_head=3, n_tail=3).as_raw_html()
+
+    # The last row of the table is in the preview
+    assert "4999999" in html
+    assert "9999998" in html
+
+
+@pytest.mark.parametrize("n_rows", [0, 3, 10, 23])
+@pytest.mark.parametrize("tbl_type", ["polars", "pandas", "duckdb"])
+def test_get_missing_vals_by_sector(n_rows, tbl_type):
+    tbl = pl.DataFrame(
+        {
+            "a": [None if i % 3 == 0 else i for i in range(n_rows)],
+            "b": [str(i) for i in range(n_rows)],
+        },
+        schema={"a": pl.Int64, "b": pl.String},
+    )
+
+    if tbl_type == "pandas":
+        tbl = tbl.to_pandas()
+    elif tbl_type == "duckdb":
+        tbl = ibis.memtable(tbl.to_arrow())
+
+    n_rows_counted, sector_sizes, sector_missing_counts = _get_missing_vals_by_sector(
+        data=tbl, n_cuts=9, ibis_tbl=tbl_type == "duckdb"
+    )
+
+    # Sectors have `n_rows // 10` rows, with the remaining rows in the last sector
+    sector_size = n_rows // 10
+    expected_sizes = [sector_size] * 9 + [n_rows - 9 * sector_size]
+    bounds = [sum(expected_sizes[:i]) for i in range(11)]
+
+    assert n_rows_counted == n_rows
+    assert sector_sizes == expected_sizes
+    assert sector_missing_counts["a"] == [
+        sum(1 for i in range(bounds[s], bounds[s + 1]) if i % 3 == 0) for s in range(10)
+    ]
+    assert sector_missing_counts["b"] == [0] * 10
+
+
 def test_missing_vals_tbl_no_fail_pd_table():
     small_table = load_dataset(dataset="small_table", tbl_type="pandas")
     missing_vals_tbl(small_table)
@@ -5490,6 +6212,57 @@ def test_get_step_report_non_supported_steps():
     assert validation.get_step_report(i=2) is None
 
 
+def test_get_step_reports(monkeypatch):
+    small_table = load_dataset(dataset="small_table", tbl_type="polars")
+
+    validation = (
+        Validate(small_table)
+        .col_vals_gt(columns="a", value=0)
+        .col_vals_lt(columns="a", value=5)
+        .col_vals_not_null(columns="date_time")
+        .rows_distinct()
+        .col_vals_gt(columns="d", value=0, active=False)
+        .interrogate()
+    )
+
+    n_previews = 0
+
+    def counting_preview(*args, **kwargs):
+        nonlocal n_previews
+        n_previews += 1
+        return preview(*args, **kwargs)
+
+    monkeypatch.setattr("pointblank.validate.preview", counting_preview)
+
+    step_reports = validation.get_step_reports()
+
+    assert list(step_reports) == [1, 2, 3, 4, 5]
+    assert isinstance(step_reports[1], GT.GT)
+    assert isinstance(step_reports[2], GT.GT)
+    assert isinstance(step_reports[3], GT.GT)
+    assert step_reports[4] is None
+    assert step_reports[5] == "This validation step is inactive."
+
+    # The preview of the target table is shared by the reports of the two passing steps
+    assert n_previews == 1
+
+    assert list(validation.get_step_reports(steps=3)) == [3]
+    assert validation.get_step_report(i=1).as_raw_html() == step_reports[1].as_raw_html()
+    assert n_previews == 1
+
+    # The shared preview is generated again after a new interrogation
+    validation.interrogate()
+    validation.get_step_reports(steps=[1, 3])
+
+    assert n_previews == 2
+
+    with pytest.raises(ValueError):
+        validation.get_step_reports(steps=[1, 6])
+
+    with pytest.raises(ValueError):
+        validation.get_step_reports(steps=0)
+
+
 @pytest.mark.parametrize(
     "schema",
     [